@@ -73,7 +73,11 @@ export default function EmailIntelligence({ theme }) {
     try {
       const response = await runEmailAction(action, email)
       setRawResponse(response)
-      setActionMessage(`${action === 'calendar' ? 'Calendar' : 'Notion'} action submitted for “${email.subject || 'Untitled'}”.`)
+      // Calendar actions report per-target results (e.g. Notion failed)
+      setActionMessage(
+        response?.result?.message ||
+          `${action === 'calendar' ? 'Calendar' : 'Notion'} action submitted for “${email.subject || 'Untitled'}”.`,
+      )
     } catch (err) {
       setError(err.message || `Unable to complete ${action} action.`)
     } finally {
@@ -1,7 +1,7 @@
 import { useEffect, useMemo, useState } from "react";
 import { useLocation } from "react-router-dom";
 import ResultCard from "../components/ResultCard";
-import { getInsights } from "../services/api";
+import { getInsights, subscribeToEvents } from "../services/api";
 
 // ---------------------------------------------------------------------------
 // Source icons and display config
@@ -165,6 +165,16 @@ export default function InsightAgent({ theme }) {
 
   useEffect(() => {
     loadInsights();
+    // Apply deltas from the server instead of re-fetching everything
+    return subscribeToEvents({
+      "insight.added": ({ insight }) =>
+        setInsights((prev) => [...prev.filter((i) => i.id !== insight.id), insight]),
+      "insight.changed": ({ insight }) =>
+        setInsights((prev) => prev.map((i) => (i.id === insight.id ? insight : i))),
+      "insight.removed": ({ id }) =>
+        setInsights((prev) => prev.filter((i) => i.id !== id)),
+      reset: () => loadInsights(),
+    });
   }, []);
 
   // ------ Stats ------
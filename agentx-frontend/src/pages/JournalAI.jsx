@@ -4,6 +4,7 @@ import {
   createTask,
   deleteTask,
   getActionAgentDashboard,
+  subscribeToEvents,
   updateTask,
 } from "../services/api";
 
@@ -48,6 +49,25 @@ export default function JournalAI({ theme }) {
 
   useEffect(() => {
     loadDashboard();
+    // Keep tasks and stats in sync with changes made elsewhere
+    const upsertTask = ({ task, stats: nextStats }) => {
+      setTasks((prev) => {
+        if (task.done) return prev.filter((t) => t.id !== task.id);
+        return prev.some((t) => t.id === task.id)
+          ? prev.map((t) => (t.id === task.id ? task : t))
+          : [...prev, task];
+      });
+      setStats(nextStats);
+    };
+    return subscribeToEvents({
+      "task.created": upsertTask,
+      "task.updated": upsertTask,
+      "task.deleted": ({ id, stats: nextStats }) => {
+        setTasks((prev) => prev.filter((t) => t.id !== id));
+        setStats(nextStats);
+      },
+      reset: () => loadDashboard(),
+    });
   }, []);
 
   // ---------- Add task ----------
@@ -74,56 +74,51 @@ export function analyzeJournal(entry) {
   });
 }
 
+const TRANSCRIBE_MAX_ATTEMPTS = 4;
+
+/** POST audio to /transcribe, waiting out 503s while the model warms up */
+async function postAudio(formData) {
+  for (let attempt = 1; ; attempt++) {
+    const response = await fetch(`${API_BASE_URL}/transcribe`, {
+      method: "POST",
+      body: formData,
+    });
+
+    if (response.status === 503 && attempt < TRANSCRIBE_MAX_ATTEMPTS) {
+      const retryAfter = Number(response.headers.get("Retry-After")) || 5;
+      await new Promise((resolve) => setTimeout(resolve, retryAfter * 1000));
+      continue;
+    }
+
+    const text = await response.text();
+    const data = text ? tryParseJson(text) : null;
+
+    if (!response.ok) {
+      const message =
+        data?.message ||
+        data?.error ||
+        data?.detail ||
+        text ||
+        `Request failed: ${response.status}`;
+      throw new Error(message);
+    }
+
+    return data;
+  }
+}
+
 /** Send recorded audio blob to the backend for transcription */
 export async function sendAudioForTranscription(audioBlob) {
   const formData = new FormData();
   formData.append("file", audioBlob, "recording.webm");
-
-  const response = await fetch(`${API_BASE_URL}/transcribe`, {
-    method: "POST",
-    body: formData,
-  });
-
-  const text = await response.text();
-  const data = text ? tryParseJson(text) : null;
-
-  if (!response.ok) {
-    const message =
-      data?.message ||
-      data?.error ||
-      data?.detail ||
-      text ||
-      `Request failed: ${response.status}`;
-    throw new Error(message);
-  }
-
-  return data;
+  return postAudio(formData);
 }
 
 /** Send a small audio chunk for real-time streaming transcription */
 export async function sendAudioChunk(audioBlob, chunkIndex) {
   const formData = new FormData();
   formData.append("file", audioBlob, `chunk_${chunkIndex}.webm`);
-
-  const response = await fetch(`${API_BASE_URL}/transcribe`, {
-    method: "POST",
-    body: formData,
-  });
-
-  const text = await response.text();
-  const data = text ? tryParseJson(text) : null;
-
-  if (!response.ok) {
-    const message =
-      data?.message ||
-      data?.error ||
-      data?.detail ||
-      text ||
-      `Request failed: ${response.status}`;
-    throw new Error(message);
-  }
-
-  return data;
+  return postAudio(formData);
 }
 
 export function searchKnowledgeHub(query) {
@@ -200,10 +195,40 @@ export function getActionAgentDashboard() {
 // Task Management (Journal AI → Todo List)
 // ------------------------------------------------------------------
 
-export function getTasks() {
-  return request("/tasks", {
+// Last response per task URL, revalidated with If-None-Match so polling
+// gets a 304 (and reuses the cached body) when nothing has changed.
+const taskResponseCache = new Map();
+
+export async function getTasks(filters = {}) {
+  const params = new URLSearchParams();
+  Object.entries(filters).forEach(([key, value]) => {
+    if (value !== undefined && value !== null && value !== "") {
+      params.set(key, value);
+    }
+  });
+  const query = params.toString();
+  const endpoint = query ? `/tasks?${query}` : "/tasks";
+  const cached = taskResponseCache.get(endpoint);
+
+  const response = await fetch(`${API_BASE_URL}${endpoint}`, {
     method: "GET",
+    headers: cached ? { "If-None-Match": cached.etag } : {},
   });
+  if (response.status === 304 && cached) {
+    return cached.data;
+  }
+
+  const text = await response.text();
+  const data = text ? tryParseJson(text) : null;
+  if (!response.ok) {
+    throw new Error(data?.detail || data?.message || `Request failed: ${response.status}`);
+  }
+
+  const etag = response.headers.get("ETag");
+  if (etag) {
+    taskResponseCache.set(endpoint, { etag, data });
+  }
+  return data;
 }
 
 export function getTaskStats() {
@@ -249,4 +274,19 @@ export function getInsights() {
   });
 }
 
+// ------------------------------------------------------------------
+// Change feed — server-sent events instead of polling
+// ------------------------------------------------------------------
+
+// handlers: { [eventName]: (data) => void }. EventSource reconnects on its
+// own and resumes after the last event id it received; a "reset" event
+// means the server could not replay the gap and the caller should reload.
+export function subscribeToEvents(handlers) {
+  const source = new EventSource(`${API_BASE_URL}/events`);
+  Object.entries(handlers).forEach(([name, handler]) => {
+    source.addEventListener(name, (event) => handler(tryParseJson(event.data)));
+  });
+  return () => source.close();
+}
+
 export { API_BASE_URL };
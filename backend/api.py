@@ -1,18 +1,21 @@
+import asyncio
 import base64
+import html
 import json
 import logging
 import os
-import re
 import sys
+import threading
 from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi import FastAPI, File, Header, HTTPException, Query, Request, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 logger = logging.getLogger("api")
@@ -22,62 +25,71 @@ _BACKEND_DIR = Path(__file__).resolve().parent
 
 
 def _get_gmail_service():
-    """Return an authenticated Gmail service using existing token only.
+    """Return this thread's cached Gmail service using the existing token only.
 
-    Never launches a browser / blocks. Returns None if credentials are
-    missing, expired without a refresh token, or refresh fails.
+    Never launches a browser / blocks. Returns ``(None, reason)`` if
+    credentials are missing, expired without a refresh token, or refresh
+    fails.
     """
-    creds_file = _BACKEND_DIR / "credentials.json"
-    token_file = _BACKEND_DIR / "token.json"
-
-    if not creds_file.exists() or not token_file.exists():
-        return None, "Gmail credentials not configured (credentials.json / token.json missing)."
+    from backend.google_services import GoogleAuthError, get_google_services
 
     try:
-        from google.oauth2.credentials import Credentials
-        from google.auth.transport.requests import Request
-        from googleapiclient.discovery import build
-
-        SCOPES = [
-            "https://www.googleapis.com/auth/gmail.modify",
-            "https://www.googleapis.com/auth/calendar",
-        ]
-        creds = Credentials.from_authorized_user_file(str(token_file), SCOPES)
-
-        if not creds.valid:
-            if creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-                token_file.write_text(creds.to_json())
-            else:
-                return None, "Gmail token expired and cannot be refreshed without re-authorising."
-
-        service = build("gmail", "v1", credentials=creds)
-        return service, None
+        return get_google_services().gmail(), None
+    except GoogleAuthError as exc:
+        return None, str(exc)
     except Exception as exc:
         return None, f"Gmail auth error: {exc}"
 
 
+def _google_call_failed(exc: Exception) -> None:
+    """Drop cached Google credentials if *exc* was an auth failure."""
+    from backend.google_services import get_google_services
+
+    get_google_services().invalidate_on_auth_error(exc)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Eagerly initialize the transcription model on application startup."""
-    logger.info("Starting AgentX API — initializing transcription engine …")
+    """Start warming the transcription model without blocking startup.
+
+    The model loads on a background thread; ``/transcribe`` answers 503
+    with ``Retry-After`` until it is ready and every other endpoint is
+    served immediately.
+    """
+    logger.info("Starting AgentX API — warming transcription engine in background …")
     try:
         from backend.live_transcript import get_engine
 
-        engine = get_engine()
-        success = engine.ensure_initialized()
-        if success:
-            logger.info(
-                "Transcription engine ready (backend: %s)", engine.backend
-            )
-        else:
-            logger.error(
-                "Transcription engine failed to initialize: %s",
-                engine._init_error or "unknown error",
-            )
+        get_engine().start_background_init()
     except Exception as exc:
-        logger.error("Transcription engine init raised: %s", exc)
+        logger.error("Transcription engine warm-up raised: %s", exc)
+
+    # Build the knowledge hub search index off the request path
+    from backend.knowledge_search import get_search_index
+
+    threading.Thread(target=get_search_index, name="knowledge-search-warmup", daemon=True).start()
+
+    # Publish insight deltas to /events subscribers
+    from backend.insight_agent import start_insight_watcher
+
+    insight_watcher_stop = threading.Event()
+    start_insight_watcher(stop=insight_watcher_stop)
+
+    # Resume deliveries left in the outbox by a previous run
+    from backend.outbound_queue import get_outbound_queue
+
+    threading.Thread(target=get_outbound_queue, name="outbound-start", daemon=True).start()
+
+    # Mailbox sync / reminders / insight refresh, opt-in with AGENTX_DAEMON=1
+    from backend.automation_daemon import daemon_enabled, run_daemon
+
+    daemon_stop = asyncio.Event()
+    daemon_task = asyncio.create_task(run_daemon(stop=daemon_stop)) if daemon_enabled() else None
     yield
+    insight_watcher_stop.set()
+    if daemon_task is not None:
+        daemon_stop.set()
+        await daemon_task
     logger.info("Shutting down AgentX API.")
 
 
@@ -88,6 +100,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Retry-After"],
 )
 
 # Register Organization Knowledge Module routes
@@ -123,6 +136,8 @@ class EmailRequest(BaseModel):
 
 class KnowledgeRequest(BaseModel):
     query: str = ""
+    limit: int = 20
+    offset: int = 0
 
 
 class PipelineRequest(BaseModel):
@@ -161,29 +176,41 @@ def _email_header(headers, name):
     return ""
 
 
-def _parse_email_details(text, backend_main):
-    lowered = text.lower()
-    detected_type = backend_main.classify_email_type(text)
-    if "exam" in lowered:
-        detected_type = "exam"
-    elif "meeting" in lowered:
-        detected_type = "meeting"
-    if detected_type == "none":
+def _safe_classify_email_type(text, backend_main, subject=""):
+    """Keyword rules first; the LLM only for unclear emails, never raising."""
+    from backend.email_classifier import quick_classify
+
+    detected_type = quick_classify(text, subject)
+    if detected_type:
+        return detected_type
+    try:
+        # None: the LLM couldn't classify it this time
+        return backend_main.classify_email_type(text) or "none"
+    except Exception as exc:
+        logger.warning("Email classification failed: %s", exc)
+        return "none"
+
+
+def _parse_email_details(text, backend_main, subject=None, detected_type=None, when=None):
+    """Event details for an email, or None if it is undated or not an event.
+
+    *when* is the ``find_event_time`` result if the caller already has it.
+    """
+    from backend.email_extract import find_event_time
+
+    if when is None:
+        when = find_event_time(text, backend_main.IST)
+    if when is None:
         return None
-    date_match = re.search(r"(\d{1,2}/\d{1,2}/\d{4})", text)
-    if not date_match:
+    if detected_type is None:
+        detected_type = _safe_classify_email_type(text, backend_main, subject or "")
+    if detected_type == "none":
         return None
-    date_obj = datetime.strptime(date_match.group(1), "%d/%m/%Y")
-    time_match = re.search(r"(\d{1,2}:\d{2}\s*(am|pm))", lowered)
-    time_obj = datetime.strptime(time_match.group(1), "%I:%M %p").time() if time_match else datetime.strptime("09:00", "%H:%M").time()
-    duration_match = re.search(r"(\d+(\.\d+)?)\s*hour", lowered)
-    duration_minutes = int(float(duration_match.group(1)) * 60) if duration_match else 60
-    start = datetime.combine(date_obj.date(), time_obj).replace(tzinfo=backend_main.IST)
     return {
         "detected_type": detected_type,
-        "title": detected_type.capitalize(),
-        "start": start.isoformat(),
-        "duration_minutes": duration_minutes,
+        "title": subject or detected_type.capitalize(),
+        "start": when.start.isoformat(),
+        "duration_minutes": when.duration_minutes,
     }
 
 
@@ -199,7 +226,25 @@ def _load_json_list(path):
 
 @app.get("/health")
 def health_check():
-    return {"status": "ok"}
+    from backend.live_transcript import get_engine
+    from backend.transcript_cache import get_cache
+
+    return {
+        "status": "ok",
+        "transcription": get_engine().status(),
+        "transcript_cache": get_cache().stats(),
+    }
+
+
+@app.get("/automation/jobs")
+def automation_jobs():
+    """Run-time metrics of the embedded automation daemon's jobs."""
+    from backend.automation_daemon import get_scheduler
+
+    scheduler = get_scheduler()
+    if scheduler is None:
+        return {"running": False, "jobs": {}}
+    return {"running": True, **scheduler.metrics()}
 
 
 @app.post("/summarize")
@@ -223,14 +268,63 @@ def research(payload: TopicRequest):
 # Task Management (Journal AI → Todo List)
 # ------------------------------------------------------------------
 
+def _tasks_etag() -> str:
+    """Weak ETag for task responses: store version plus today's date
+    (the streak in the stats can change at midnight without a write)."""
+    from datetime import date
+
+    from backend.journal_ai import task_version
+
+    return f'W/"tasks-{task_version()}-{date.today().isoformat()}"'
+
+
+def _not_modified(etag: str, if_none_match: str | None) -> Response | None:
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    return None
+
+
 @app.get("/tasks")
-def get_all_tasks():
-    """Return all tasks + aggregate stats."""
-    from backend.journal_ai import get_task_stats, get_tasks
+def get_all_tasks(
+    response: Response,
+    status: str = Query("all", pattern="^(all|open|done)$"),
+    created_after: str | None = None,
+    created_before: str | None = None,
+    q: str | None = None,
+    limit: int | None = Query(None, ge=1, le=500),
+    cursor: str | None = None,
+    if_none_match: str | None = Header(None),
+):
+    """Return tasks (optionally filtered and paginated) + aggregate stats.
+
+    Pages are ordered by id; pass ``next_cursor`` back as ``cursor`` for
+    the next page. Responds 304 when ``If-None-Match`` matches the ETag.
+    """
+    from backend.journal_ai import list_tasks
+
+    etag = _tasks_etag()
+    unchanged = _not_modified(etag, if_none_match)
+    if unchanged is not None:
+        return unchanged
 
+    try:
+        page = list_tasks(
+            status=status,
+            created_after=created_after,
+            created_before=created_before,
+            text=q,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
     return {
-        "tasks": get_tasks(),
-        "stats": get_task_stats(),
+        "tasks": page["tasks"],
+        "next_cursor": page["next_cursor"],
+        "stats": page["stats"],
     }
 
 
@@ -270,10 +364,16 @@ def remove_task(task_id: str):
 
 
 @app.get("/tasks/stats")
-def task_stats():
+def task_stats(response: Response, if_none_match: str | None = Header(None)):
     """Return only the aggregate statistics."""
     from backend.journal_ai import get_task_stats
 
+    etag = _tasks_etag()
+    unchanged = _not_modified(etag, if_none_match)
+    if unchanged is not None:
+        return unchanged
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
     return get_task_stats()
 
 
@@ -284,105 +384,180 @@ def task_stats():
 @app.get("/action-agent")
 def action_agent():
     """Return pending tasks + unread email count + stats for the Action Agent dashboard."""
-    from backend.journal_ai import get_task_stats, get_tasks
+    from backend.gmail_fetch import GmailFetcher
+    from backend.journal_ai import list_tasks
 
-    tasks = get_tasks()
-    stats = get_task_stats()
+    pending = list_tasks(status="open")
+    stats = pending["stats"]
 
     # Try to scan unread emails (gracefully handle missing config)
     unread_count = 0
     unread_emails = []
-    email_error = None
+    fetch_timings = None
 
     gmail, email_error = _get_gmail_service()
     if gmail:
         try:
-            results = gmail.users().messages().list(
-                userId="me", labelIds=["UNREAD"], maxResults=10
-            ).execute()
-            messages = results.get("messages", [])
-            unread_count = len(messages)
-            for msg in messages:
-                msg_data = gmail.users().messages().get(
-                    userId="me", id=msg["id"], format="full"
-                ).execute()
-                payload_data = msg_data.get("payload", {})
-                headers = payload_data.get("headers", [])
-                text = _decode_email_body(payload_data) or msg_data.get("snippet", "")
+            fetcher = GmailFetcher(gmail)
+            ids = fetcher.list_ids(max_results=10)
+            unread_count = len(ids)
+            # Previews only need headers and the snippet
+            for msg_data in fetcher.get_messages(ids, format="metadata"):
+                headers = msg_data.get("payload", {}).get("headers", [])
                 unread_emails.append({
-                    "id": msg["id"],
+                    "id": msg_data["id"],
                     "subject": _email_header(headers, "Subject") or "No subject",
                     "sender": _email_header(headers, "From") or "Unknown",
-                    "preview": text[:300],
+                    "preview": html.unescape(msg_data.get("snippet", ""))[:300],
                 })
+            fetch_timings = fetcher.timings.as_dict()
         except Exception as e:
+            _google_call_failed(e)
             email_error = str(e)
 
     return {
-        "tasks": [t for t in tasks if not t["done"]],
+        "tasks": pending["tasks"],
         "task_stats": stats,
         "unread_count": unread_count,
         "unread_emails": unread_emails,
         "email_error": email_error,
+        "fetch_timings": fetch_timings,
     }
 
 
+def _transcription_warming_response():
+    """Return a 503 response while the model warms up, else None."""
+    from backend.live_transcript import WARMUP_RETRY_AFTER, get_engine
+
+    engine = get_engine()
+    if engine.state not in ("cold", "loading"):
+        return None
+    engine.start_background_init()
+    return JSONResponse(
+        status_code=503,
+        content={
+            "detail": "Transcription model is warming up, retry shortly.",
+            "transcription": engine.status(),
+        },
+        headers={"Retry-After": str(WARMUP_RETRY_AFTER)},
+    )
+
+
+def _transcript_cache_key(audio_bytes, word_timestamps, mode):
+    from backend.live_transcript import MODEL_SIZE
+    from backend.transcript_cache import cache_key
+
+    return cache_key(
+        audio_bytes,
+        model=MODEL_SIZE,
+        language="en",
+        word_timestamps=word_timestamps,
+        mode=mode,
+    )
+
+
 @app.post("/transcribe")
-async def transcribe(file: UploadFile = File(...)):
-    """Receive browser-recorded audio and return transcribed text."""
+async def transcribe(file: UploadFile = File(...), word_timestamps: bool = False):
+    """Receive browser-recorded audio and return transcribed text.
+
+    Identical re-uploads are answered from the transcript cache, even
+    while the model is still warming up.
+    """
     from backend.live_transcript import transcribe_audio_file
+    from backend.transcript_cache import get_cache
 
     audio_bytes = await file.read()
+    key = _transcript_cache_key(audio_bytes, word_timestamps, "short")
+    cached = get_cache().get(key)
+    if cached is not None:
+        print(f"[transcribe] Cache hit for {len(audio_bytes)} bytes")
+        return {**cached, "cached": True}
+
+    warming = _transcription_warming_response()
+    if warming is not None:
+        return warming
+
     print(f"[transcribe] Received {len(audio_bytes)} bytes, filename={file.filename}, content_type={file.content_type}")
-    result = transcribe_audio_file(audio_bytes)
+    result = await run_in_threadpool(transcribe_audio_file, audio_bytes, word_timestamps)
     if result.get("error"):
         print(f"[transcribe] Error: {result['error']}")
     else:
         print(f"[transcribe] Transcript ({len(result.get('segments', []))} segments): {result.get('transcript', '')[:100]}")
+        get_cache().put(key, result)
+    return result
+
+
+@app.post("/transcribe/stream")
+async def transcribe_stream(file: UploadFile = File(...), word_timestamps: bool = False):
+    """Stream segments as newline-delimited JSON while the clip is decoded."""
+    from backend.live_transcript import stream_audio_file
+
+    warming = _transcription_warming_response()
+    if warming is not None:
+        return warming
+
+    audio_bytes = await file.read()
+
+    def _lines():
+        texts = []
+        for segment in stream_audio_file(audio_bytes, word_timestamps=word_timestamps):
+            if "error" not in segment:
+                texts.append(segment["text"])
+            yield json.dumps(segment) + "\n"
+        yield json.dumps({"done": True, "transcript": " ".join(texts)}) + "\n"
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+
+@app.post("/transcribe/long")
+def transcribe_long(file: UploadFile = File(...), word_timestamps: bool = False):
+    """Transcribe a long recording in parallel ~30 s pieces.
+
+    Runs in the worker thread pool so the decode and model calls never
+    block the event loop. The response includes real-time-factor stats.
+    """
+    from backend.long_transcript import transcribe_long_audio
+    from backend.transcript_cache import get_cache
+
+    audio_bytes = file.file.read()
+    key = _transcript_cache_key(audio_bytes, word_timestamps, "long")
+    cached = get_cache().get(key)
+    if cached is not None:
+        return {**cached, "cached": True}
+
+    warming = _transcription_warming_response()
+    if warming is not None:
+        return warming
+
+    result = transcribe_long_audio(audio_bytes, word_timestamps=word_timestamps)
+    if result.get("error"):
+        print(f"[transcribe/long] Error: {result['error']}")
+    else:
+        print(f"[transcribe/long] {result['stats']}")
+        get_cache().put(key, result)
     return result
 
 
 @app.post("/knowledge-hub")
 def knowledge_hub(payload: KnowledgeRequest):
-    query = payload.query.strip().lower()
-    entries = _load_json_list("knowledge_base.json")
-    if query:
-        entries = [entry for entry in entries if query in json.dumps(entry).lower()]
-    normalized = []
-    for entry in reversed(entries[-20:]):
-        data = entry.get("data", {}) if isinstance(entry, dict) else {}
-
-        # Determine source
-        raw_source = entry.get("source") or entry.get("type", "Knowledge Hub")
-        if raw_source.lower() in ["meeting", "meeting intelligence"]:
-            source = "Meeting Intelligence"
-        elif raw_source.lower() in ["pipeline", "meeting pipeline"]:
-            source = "Meeting Pipeline"
-        elif raw_source.lower() in ["research", "research copilot"]:
-            source = "Research Copilot"
-        elif raw_source.lower() in ["journal", "journal ai"]:
-            source = "Journal AI"
-        elif raw_source.lower() in ["live transcript", "live transcription"]:
-            source = "Live Transcript"
-        else:
-            source = str(raw_source).title()
-
-        # Determine actual title
-        raw_title = data.get("title") or entry.get("title") or ""
-        if not raw_title or raw_title.strip().lower() == "short meeting title":
-            summary_snippet = (data.get("summary") or "").strip()
-            if summary_snippet and summary_snippet.strip().lower() != "short summary":
-                raw_title = summary_snippet.split(".")[0][:60]
-            else:
-                raw_title = f"{source} Entry"
+    from backend.knowledge_hub import get_knowledge_log, normalize_entry
+    from backend.knowledge_search import get_search_index
 
-        normalized.append({
-            "type": entry.get("type", "entry"),
-            "source": source,
-            "title": raw_title,
-            "summary": data.get("summary") or json.dumps(data or entry, ensure_ascii=False),
-        })
-    return {"entries": normalized}
+    query = payload.query.strip()
+    limit = max(1, min(payload.limit, 100))
+    offset = max(0, payload.offset)
+    if query:
+        # Ranked full-text search; only the requested page is read from disk
+        page = get_search_index().search(query, limit=limit, offset=offset)
+        entries, total = page["entries"], page["total"]
+    else:
+        log = get_knowledge_log()
+        entries = list(reversed(log.tail(offset + limit)))[offset:]
+        total = len(log)
+    # Views are computed at write time; entries predating them (until
+    # ``python -m backend.knowledge_hub --backfill-views`` runs) fall back
+    normalized = [entry.get("view") or normalize_entry(entry) for entry in entries]
+    return {"entries": normalized, "total": total, "offset": offset, "limit": limit}
 
 
 @app.post("/scan-emails")
@@ -406,7 +581,11 @@ def scan_emails(payload: EmailRequest):
         duration_minutes = int(email.get("duration_minutes") or 60)
         try:
             if payload.action == "calendar":
-                backend_main.create_calendar_event(title, start_time, intent_type, duration_minutes)
+                result = backend_main.create_calendar_event(title, start_time, intent_type, duration_minutes)
+                if result["status"] == "failed":
+                    raise RuntimeError(result["message"])
+                # "partial" still created the event; report which targets failed
+                return {"status": result["status"], "message": result["message"], "result": result}
             elif payload.action == "notion":
                 backend_main.add_to_notion(title, start_time)
             else:
@@ -432,32 +611,58 @@ def scan_emails(payload: EmailRequest):
         sys.path.insert(0, str(_BACKEND_DIR))
         import main as backend_main  # type: ignore
 
+    from backend.email_extract import find_event_time
+    from backend.gmail_fetch import GmailFetcher
+
     try:
-        results = gmail.users().messages().list(userId="me", labelIds=["UNREAD"], maxResults=5).execute()
-        messages = results.get("messages", [])
+        fetcher = GmailFetcher(gmail)
+        ids = fetcher.list_ids(max_results=5)
         detected_emails = []
-        for message in messages:
-            message_data = gmail.users().messages().get(userId="me", id=message["id"], format="full").execute()
+        # Detection parses the body, so fetch full messages
+        candidates = []
+        for message_data in fetcher.get_messages(ids, format="full"):
             payload_data = message_data.get("payload", {})
             headers = payload_data.get("headers", [])
             text = _decode_email_body(payload_data) or message_data.get("snippet", "")
-            parsed = _parse_email_details(text, backend_main)
+            # Undated emails can never become events; don't classify them
+            when = find_event_time(text, backend_main.IST)
+            if when is not None:
+                candidates.append({
+                    "id": message_data["id"],
+                    "subject": _email_header(headers, "Subject"),
+                    "sender": _email_header(headers, "From"),
+                    "text": text,
+                    "when": when,
+                })
+
+        types, classification = backend_main.email_classifier.classify_many(candidates)
+        classification["scanned"] = len(ids)
+        classification["llm_calls_per_email"] = round(classification["llm_calls"] / len(ids), 3) if ids else 0.0
+        for email, detected_type in zip(candidates, types):
+            if detected_type is None:
+                continue   # classification failed; the next scan retries it
+            parsed = _parse_email_details(
+                email["text"], backend_main, email["subject"], detected_type, email["when"]
+            )
             if not parsed:
                 continue
             detected_emails.append({
-                "id": message["id"],
-                "subject": _email_header(headers, "Subject") or parsed["title"],
-                "sender": _email_header(headers, "From"),
-                "preview": text[:500],
+                "id": email["id"],
+                "subject": parsed["title"],
+                "sender": email["sender"],
+                "preview": email["text"][:500],
                 **parsed,
             })
 
         return {
-            "scanned_count": len(messages),
+            "scanned_count": len(ids),
             "detected_emails": detected_emails,
             "upcoming_events": _load_json_list(str(_BACKEND_DIR / "events.json")),
+            "fetch_timings": fetcher.timings.as_dict(),
+            "classification": classification,
         }
     except Exception as e:
+        _google_call_failed(e)
         return {
             "scanned_count": 0,
             "detected_emails": [],
@@ -483,20 +688,55 @@ def pipeline_run(payload: PipelineRequest):
     summary = summarize_meeting(transcript)
     store_meeting(summary)
 
-    notion_status = "Notion token not configured"
+    # Queued, not sent inline: poll /outbound/{delivery_id} for the result
+    notion = {"message": "Notion token not configured", "delivery_id": None}
     try:
         from backend.notion_writer import write_summary
-        write_summary(summary)
-        notion_status = "Summary saved to Notion"
+
+        delivery = write_summary(summary)
+        notion = {"message": "Summary queued for Notion", "delivery_id": delivery["id"]}
     except Exception as e:
-        notion_status = f"Notion write skipped: {e}"
+        notion["message"] = f"Notion write skipped: {e}"
 
     return {
         "summary_data": summary,
-        "notion": {"message": notion_status},
+        "notion": notion,
     }
 
 
+# ------------------------------------------------------------------
+# Outbound queue — Notion / WhatsApp deliveries
+# ------------------------------------------------------------------
+
+@app.get("/outbound")
+def outbound_status(dead_limit: int = Query(20, ge=0, le=200)):
+    """Queue counts, delivery stats and the most recent dead letters."""
+    from backend.outbound_queue import get_outbound_queue
+
+    queue = get_outbound_queue()
+    return {**queue.stats(), "dead_letters": queue.dead_letters(dead_limit)}
+
+
+@app.get("/outbound/{delivery_id}")
+def outbound_delivery(delivery_id: str):
+    from backend.outbound_queue import get_outbound_queue
+
+    delivery = get_outbound_queue().get(delivery_id)
+    if delivery is None:
+        raise HTTPException(status_code=404, detail="Delivery not found")
+    return delivery
+
+
+@app.post("/outbound/{delivery_id}/retry")
+def outbound_retry(delivery_id: str):
+    """Requeue a dead-lettered delivery."""
+    from backend.outbound_queue import get_outbound_queue
+
+    if not get_outbound_queue().retry_dead(delivery_id):
+        raise HTTPException(status_code=404, detail="Dead letter not found")
+    return {"status": "requeued", "id": delivery_id}
+
+
 # ------------------------------------------------------------------
 # Insight Agent — AI-generated insights from Email Intelligence, Meeting Intelligence,
 # Organizational Knowledge, and Analytics
@@ -505,11 +745,63 @@ def pipeline_run(payload: PipelineRequest):
 @app.get("/insights")
 def get_all_insights():
     """Return all AI-generated insights."""
-    from backend.insight_agent import get_all_insights as _get_all, get_insight_stats
+    from backend.insight_agent import get_insights_snapshot
+
+    snapshot = get_insights_snapshot()
+    return {"insights": snapshot["insights"], "stats": snapshot["stats"]}
+
 
-    insights = _get_all()
-    stats = get_insight_stats()
-    return {"insights": insights, "stats": stats}
+# ------------------------------------------------------------------
+# Change feed — server-sent events for tasks, follow-ups, insights
+# ------------------------------------------------------------------
+
+SSE_HEARTBEAT_SECONDS = 15
+SSE_RETRY_MS = 3000
+
+
+def _sse_message(event) -> str:
+    return f"id: {event.event_id}\nevent: {event.topic}\ndata: {json.dumps(event.data, default=str)}\n\n"
+
+
+@app.get("/events")
+async def event_stream(
+    request: Request,
+    last_event_id: str | None = Header(None),
+    since: int | None = None,
+):
+    """Stream change events as SSE.
+
+    Resumes after ``Last-Event-ID`` (sent automatically by EventSource on
+    reconnect) or ``?since=``; a ``Last-Event-ID`` from before a server
+    restart gets a ``reset`` event. A client that falls too far behind is
+    disconnected and catches up from history when it reconnects.
+    """
+    from backend.event_bus import get_event_bus
+
+    resume_from = last_event_id if last_event_id else since
+    subscription, replay = get_event_bus().subscribe(resume_from)
+
+    async def _messages():
+        try:
+            yield f"retry: {SSE_RETRY_MS}\n\n"
+            for event in replay:
+                yield _sse_message(event)
+            while not await request.is_disconnected():
+                event = await subscription.next_event(timeout=SSE_HEARTBEAT_SECONDS)
+                if event is not None:
+                    yield _sse_message(event)
+                elif subscription.closed:
+                    break
+                else:
+                    yield ": keep-alive\n\n"
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        _messages(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 if __name__ == "__main__":
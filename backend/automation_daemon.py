@@ -0,0 +1,342 @@
+"""Automation Daemon — asyncio scheduler for the periodic AgentX jobs.
+
+``automation_loop`` used to run the mailbox sync and the reminder check one
+after the other and then ``time.sleep(300)``, so a reminder could fire up
+to five minutes late and one slow Gmail call held up everything else.
+
+Here every job runs on its own timer:
+
+- ``interval`` seconds between starts, plus up to ``jitter`` random seconds
+  so jobs sharing an interval don't hit their APIs in lockstep
+- ``timeout`` seconds per run; a run that overshoots is counted as timed out
+- ``concurrency`` runs at most in flight; a tick that finds every slot busy
+  is skipped rather than queued
+- optionally ``next_delay``, which can shorten the wait to when the job
+  actually has work (the reminder heap), and ``wake_on``, which subscribes
+  a callback that cuts the current wait short (a new event was saved)
+
+Blocking (plain function) jobs run on worker threads, so a slow Gmail call
+never delays the reminder check. A thread can't be interrupted, so a timed
+out blocking run keeps its slot until it actually returns.
+
+The daemon runs inside the API (``AGENTX_DAEMON=1``, see ``api.lifespan``)
+or standalone:
+
+    python -m backend.automation_daemon
+"""
+
+import argparse
+import asyncio
+import inspect
+import logging
+import os
+import random
+import signal
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+logger = logging.getLogger("automation_daemon")
+
+MAILBOX_SYNC_INTERVAL = 300
+REMINDER_INTERVAL = 60      # longest wait; reminders normally wake exactly on time
+INSIGHT_REFRESH_INTERVAL = 120
+
+
+@dataclass
+class Job:
+    name: str
+    func: Callable[[], Any]       # plain function (run on a thread) or coroutine function
+    interval: float
+    jitter: float = 0.0
+    timeout: float | None = None
+    concurrency: int = 1
+    run_at_start: bool = True
+    next_delay: Callable[[], float | None] | None = None
+    wake_on: Callable[[Callable[[], None]], Callable[[], None]] | None = None
+
+
+@dataclass
+class JobMetrics:
+    runs: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    skipped: int = 0
+    running: int = 0
+    last_started_at: str | None = None
+    last_duration_ms: float | None = None
+    max_duration_ms: float = 0.0
+    total_duration_ms: float = 0.0
+    last_error: str | None = None
+    next_run_at: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        finished = self.succeeded + self.failed + self.timed_out
+        return {
+            "runs": self.runs,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "skipped": self.skipped,
+            "running": self.running,
+            "last_started_at": self.last_started_at,
+            "last_duration_ms": self.last_duration_ms,
+            "avg_duration_ms": round(self.total_duration_ms / finished, 1) if finished else None,
+            "max_duration_ms": round(self.max_duration_ms, 1),
+            "last_error": self.last_error,
+            "next_run_at": self.next_run_at,
+        }
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+class Scheduler:
+    """Runs each :class:`Job` on an independent timer until stopped."""
+
+    def __init__(self, jobs: list[Job], rng: random.Random | None = None):
+        names = [job.name for job in jobs]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate job names: {names}")
+        self.jobs = list(jobs)
+        self._rng = rng or random.Random()
+        self._metrics = {job.name: JobMetrics() for job in jobs}
+        self._stop: asyncio.Event | None = None
+        self.started_at: float | None = None
+
+    # ------------------------------------------------------------------
+
+    async def run(self, stop: asyncio.Event | None = None) -> None:
+        """Run every job until *stop* is set (or the task is cancelled)."""
+        self._stop = stop or asyncio.Event()
+        self.started_at = time.time()
+        logger.info("Automation daemon started: %s", ", ".join(job.name for job in self.jobs))
+        runs: set[asyncio.Task] = set()
+        timers = [asyncio.create_task(self._timer(job, runs), name=f"timer:{job.name}") for job in self.jobs]
+        try:
+            await self._stop.wait()
+        finally:
+            for task in timers:
+                task.cancel()
+            await asyncio.gather(*timers, return_exceptions=True)
+            if runs:
+                # Let in-flight runs finish (bounded by their own timeouts)
+                await asyncio.gather(*runs, return_exceptions=True)
+            logger.info("Automation daemon stopped.")
+
+    def stop(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+
+    async def _timer(self, job: Job, runs: set[asyncio.Task]) -> None:
+        slots = asyncio.Semaphore(job.concurrency)
+        metrics = self._metrics[job.name]
+        loop = asyncio.get_running_loop()
+        wake = asyncio.Event()
+        unsubscribe = None
+        if job.wake_on is not None:
+            unsubscribe = await asyncio.to_thread(job.wake_on, lambda: loop.call_soon_threadsafe(wake.set))
+        try:
+            delay = 0.0 if job.run_at_start else self._next_delay(job)
+            while True:
+                metrics.next_run_at = _iso(time.time() + delay)
+                wake.clear()
+                try:
+                    await asyncio.wait_for(wake.wait(), delay)
+                    delay = self._next_delay(job)   # woken early: re-plan, don't run
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+                if slots.locked():
+                    metrics.skipped += 1
+                    logger.debug("%s: all %d slots busy, skipping this tick", job.name, job.concurrency)
+                    # A hung run holds the slot; don't spin on a stale hint
+                    delay = job.interval
+                    continue
+                await slots.acquire()
+                task = asyncio.create_task(self._run_once(job, slots), name=f"run:{job.name}")
+                runs.add(task)
+                task.add_done_callback(runs.discard)
+                if job.next_delay is not None:
+                    # The hint only moves once this run has consumed what was due
+                    await asyncio.wait({task})
+                delay = self._next_delay(job)
+        finally:
+            if unsubscribe is not None:
+                unsubscribe()
+
+    def _next_delay(self, job: Job) -> float:
+        delay = job.interval + (self._rng.uniform(0, job.jitter) if job.jitter else 0.0)
+        if job.next_delay is not None:
+            try:
+                hint = job.next_delay()
+            except Exception as exc:
+                logger.warning("%s: next_delay failed: %s", job.name, exc)
+                hint = None
+            if hint is not None:
+                delay = min(delay, max(0.0, hint))
+        return delay
+
+    async def _run_once(self, job: Job, slots: asyncio.Semaphore) -> None:
+        metrics = self._metrics[job.name]
+        metrics.runs += 1
+        metrics.running += 1
+        metrics.last_started_at = _iso(time.time())
+        started = time.perf_counter()
+
+        is_coroutine = inspect.iscoroutinefunction(job.func)
+        work = asyncio.ensure_future(job.func() if is_coroutine else asyncio.to_thread(job.func))
+
+        def _release(_future) -> None:
+            metrics.running -= 1
+            slots.release()
+
+        work.add_done_callback(_release)
+        try:
+            # shield: a timed-out thread keeps running, and keeps its slot
+            await asyncio.wait_for(asyncio.shield(work), job.timeout)
+            metrics.succeeded += 1
+        except asyncio.TimeoutError:
+            metrics.timed_out += 1
+            metrics.last_error = f"timed out after {job.timeout}s"
+            logger.warning("%s timed out after %ss", job.name, job.timeout)
+            if is_coroutine:
+                work.cancel()
+        except asyncio.CancelledError:
+            if is_coroutine:
+                work.cancel()
+            raise
+        except Exception as exc:
+            metrics.failed += 1
+            metrics.last_error = f"{type(exc).__name__}: {exc}"
+            logger.warning("%s failed: %s", job.name, exc)
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            metrics.last_duration_ms = round(elapsed, 1)
+            metrics.total_duration_ms += elapsed
+            metrics.max_duration_ms = max(metrics.max_duration_ms, elapsed)
+
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "started_at": _iso(self.started_at) if self.started_at else None,
+            "jobs": {
+                job.name: {
+                    "interval": job.interval,
+                    "jitter": job.jitter,
+                    "timeout": job.timeout,
+                    "concurrency": job.concurrency,
+                    **self._metrics[job.name].as_dict(),
+                }
+                for job in self.jobs
+            },
+        }
+
+
+# ---------------------------------------------------------------------------
+# Default AgentX jobs
+# ---------------------------------------------------------------------------
+
+def _sync_mailbox():
+    from backend import main as backend_main
+
+    return backend_main.sync_mailbox()
+
+
+def _check_reminders():
+    from backend import main as backend_main
+
+    return backend_main.check_reminders()
+
+
+def _reminder_delay():
+    from backend import main as backend_main
+
+    return backend_main.reminders.seconds_until_next()
+
+
+def _on_new_event(callback):
+    from backend import main as backend_main
+
+    return backend_main.reminders.add_listener(callback)
+
+
+def _refresh_insights():
+    # Keeps the materialized insights current so /insights never pays for
+    # a recompute; the API's insight watcher publishes the deltas
+    from backend.insight_agent import get_insight_store
+
+    return get_insight_store().refresh()
+
+
+def default_jobs() -> list[Job]:
+    return [
+        Job("mailbox_sync", _sync_mailbox, interval=MAILBOX_SYNC_INTERVAL, jitter=30, timeout=240),
+        Job(
+            "reminders", _check_reminders, interval=REMINDER_INTERVAL, timeout=20,
+            next_delay=_reminder_delay, wake_on=_on_new_event,
+        ),
+        Job("insight_refresh", _refresh_insights, interval=INSIGHT_REFRESH_INTERVAL, jitter=15, timeout=60),
+    ]
+
+
+def daemon_enabled() -> bool:
+    """Whether the API should embed the daemon (``AGENTX_DAEMON=1``)."""
+    return os.getenv("AGENTX_DAEMON", "").strip().lower() in ("1", "true", "yes")
+
+
+_scheduler: Scheduler | None = None
+
+
+def get_scheduler() -> Scheduler | None:
+    """The running embedded/standalone scheduler, if any."""
+    return _scheduler
+
+
+async def run_daemon(jobs: list[Job] | None = None, stop: asyncio.Event | None = None) -> None:
+    global _scheduler
+    _scheduler = Scheduler(jobs if jobs is not None else default_jobs())
+    try:
+        await _scheduler.run(stop)
+    finally:
+        _scheduler = None
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the AgentX automation jobs")
+    parser.add_argument("--only", nargs="+", metavar="JOB", help="run only these jobs")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+
+    jobs = default_jobs()
+    if args.only:
+        jobs = [job for job in jobs if job.name in args.only]
+
+    async def _serve():
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except (NotImplementedError, RuntimeError):
+                pass   # Windows: Ctrl+C raises KeyboardInterrupt instead
+        await run_daemon(jobs, stop)
+
+    try:
+        asyncio.run(_serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Email Extract Benchmark
+
+Generates a corpus of synthetic emails (realistic body lengths, a mix of
+date/time/duration phrasings, and some undated mail) and times three
+extractors over it:
+- legacy    — the old lowercase + three ``re.search`` + ``strptime`` parser,
+  which only knows ``dd/mm/yyyy`` and ``h:mm am/pm``
+- per_form  — the extractor's forms as separate case-insensitive patterns,
+  one ``finditer`` pass each (same coverage, no shared scan)
+- extractor — ``email_extract.find_event_time`` (one compiled pass)
+
+Reports per-email latency, throughput and how many emails each one dated.
+
+Usage:
+    python -m backend.bench_email_extract --emails 5000
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import statistics
+import sys
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend import email_extract
+from backend.email_extract import find_event_time
+
+TODAY = date(2026, 4, 8)
+
+_FILLER = (
+    "Thanks for the update on the roadmap. Please find the notes attached and let "
+    "me know if anything needs to change before we share them with the wider team. "
+)
+_WHEN = [
+    "on {d:02d}/{m:02d}/2026 at {h}:30 am",
+    "on {d}/{m}/2026 at {h}:00 pm for 2 hours",
+    "on 2026-{m:02d}-{d:02d}T{h24:02d}:15",
+    "on {d} April 2026 at {h}pm",
+    "on April {d}th at {h}:45 p.m. for 45 minutes",
+    "tomorrow {h}pm for half an hour",
+    "next Friday at {h24:02d}:00",
+    "at noon on {d}th of May",
+]
+
+
+def synthesize_corpus(count: int, seed: int = 7) -> list[str]:
+    """*count* email bodies; about one in five has no date at all."""
+    rng = random.Random(seed)
+    emails = []
+    for n in range(count):
+        filler = _FILLER * rng.randint(2, 12)
+        if n % 5 == 4:
+            emails.append(f"Hi team,\n{filler}\nBest,\nSam")
+            continue
+        when = rng.choice(_WHEN).format(
+            d=rng.randint(1, 28), m=rng.randint(1, 12), h=rng.randint(1, 11), h24=rng.randint(8, 20)
+        )
+        emails.append(f"Hi team,\n{filler[:len(filler) // 2]}\nLet's meet {when}.\n{filler[len(filler) // 2:]}")
+    return emails
+
+
+def legacy_extract(text: str):
+    """The pre-extractor parsing from ``_parse_email_details``."""
+    lowered = text.lower()
+    date_match = re.search(r"(\d{1,2}/\d{1,2}/\d{4})", text)
+    if not date_match:
+        return None
+    date_obj = datetime.strptime(date_match.group(1), "%d/%m/%Y")
+    time_match = re.search(r"(\d{1,2}:\d{2}\s*(am|pm))", lowered)
+    time_obj = datetime.strptime(time_match.group(1), "%I:%M %p").time() if time_match else datetime.strptime("09:00", "%H:%M").time()
+    duration_match = re.search(r"(\d+(\.\d+)?)\s*hour", lowered)
+    duration_minutes = int(float(duration_match.group(1)) * 60) if duration_match else 60
+    return datetime.combine(date_obj.date(), time_obj), duration_minutes
+
+
+_PER_FORM = [
+    re.compile(rf"\b{form}", re.IGNORECASE)
+    for form in email_extract._DIGIT_FORMS + email_extract._WORD_FORMS
+]
+
+
+def per_form_extract(text: str):
+    """Same forms as the extractor, but one pass over the text per form."""
+    dated = False
+    for n, pattern in enumerate(_PER_FORM):
+        for match in pattern.finditer(text):
+            dated = dated or n < 3 or match.lastgroup in ("month_day", "relative", "weekday")
+    return True if dated else None
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _measure(fn, emails: list[str]) -> dict:
+    timings = []
+    dated = 0
+    for text in emails:
+        started = time.perf_counter()
+        try:
+            result = fn(text)
+        except ValueError:
+            result = None
+        timings.append(time.perf_counter() - started)
+        dated += result is not None
+    total = sum(timings)
+    return {
+        "median_us": round(statistics.median(timings) * 1e6, 1),
+        "p95_us": round(_percentile(timings, 95) * 1e6, 1),
+        "total_ms": round(total * 1000, 1),
+        "emails_per_second": round(len(emails) / total) if total else None,
+        "dated": dated,
+    }
+
+
+def run_benchmark(emails: list[str]) -> dict:
+    legacy = _measure(legacy_extract, emails)
+    per_form = _measure(per_form_extract, emails)
+    extractor = _measure(lambda text: find_event_time(text, timezone.utc, today=TODAY), emails)
+    return {
+        "emails": len(emails),
+        "average_chars": round(sum(map(len, emails)) / len(emails)),
+        "legacy": legacy,
+        "per_form": per_form,
+        "extractor": extractor,
+        "speedup_vs_per_form": round(per_form["total_ms"] / extractor["total_ms"], 2),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark email date/time extraction")
+    parser.add_argument("--emails", type=int, default=3000, help="emails in the synthetic corpus")
+    parser.add_argument("--output", type=Path, help="also write the JSON report here")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(synthesize_corpus(args.emails))
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
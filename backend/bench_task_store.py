@@ -0,0 +1,163 @@
+"""
+Task Store Benchmark
+
+Seeds a task store with N tasks, then measures per-operation latency for
+create / get / update / delete with several concurrent writer threads, and
+checks that no writes were lost. For reference it also times a single
+whole-file rewrite of the legacy ``tasks.json`` format at the same size.
+
+Usage:
+    python -m backend.bench_task_store --tasks 100000 --writers 8 --ops 500
+"""
+
+import argparse
+import json
+import math
+import random
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.task_store import TaskStore
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _summary(values: list[float]) -> dict:
+    return {
+        "ops": len(values),
+        "median_ms": round(statistics.median(values) * 1000, 3),
+        "p95_ms": round(_percentile(values, 95) * 1000, 3),
+        "max_ms": round(max(values) * 1000, 3),
+    }
+
+
+def _seed_rows(count: int):
+    start = datetime(2025, 1, 1)
+    for i in range(1, count + 1):
+        created = start + timedelta(minutes=i)
+        done = i % 3 == 0
+        yield (
+            i,
+            f"Seeded task {i}",
+            int(done),
+            created.isoformat(),
+            (created + timedelta(hours=2)).isoformat() if done else None,
+        )
+
+
+def seed(store: TaskStore, count: int) -> float:
+    """Bulk-load *count* tasks in one transaction; returns seconds taken."""
+    started = time.perf_counter()
+    with store._write() as conn:
+        conn.executemany(
+            "INSERT INTO tasks (id, title, done, created_at, completed_at) VALUES (?, ?, ?, ?, ?)",
+            _seed_rows(count),
+        )
+        store._rebuild_stats(conn)
+    return time.perf_counter() - started
+
+
+def legacy_rewrite_seconds(count: int, directory: Path) -> float:
+    """Time one load + append + ``indent=2`` rewrite of a legacy tasks.json."""
+    path = directory / "legacy_tasks.json"
+    tasks = [
+        {"id": str(r[0]), "title": r[1], "done": bool(r[2]), "created_at": r[3], "completed_at": r[4]}
+        for r in _seed_rows(count)
+    ]
+    path.write_text(json.dumps(tasks, indent=2), encoding="utf-8")
+
+    started = time.perf_counter()
+    loaded = json.loads(path.read_text(encoding="utf-8"))
+    loaded.append({"id": str(count + 1), "title": "new", "done": False,
+                   "created_at": datetime.now().isoformat(), "completed_at": None})
+    path.write_text(json.dumps(loaded, indent=2), encoding="utf-8")
+    return time.perf_counter() - started
+
+
+def run_benchmark(tasks: int, writers: int, ops: int, directory: Path) -> dict:
+    db_path = directory / "bench_tasks.db"
+    seed_seconds = seed(TaskStore(db_path, legacy_path=None), tasks)
+
+    # Reopen so the in-memory index is loaded from the seeded table
+    load_started = time.perf_counter()
+    store = TaskStore(db_path, legacy_path=None)
+    load_seconds = time.perf_counter() - load_started
+
+    timings: dict[str, list[float]] = {"create": [], "get": [], "update": [], "delete": []}
+    created_ids: list[str] = []
+
+    def _timed(kind, fn, *args):
+        started = time.perf_counter()
+        result = fn(*args)
+        timings[kind].append(time.perf_counter() - started)
+        return result
+
+    def _writer(worker: int):
+        rng = random.Random(worker)
+        for i in range(ops):
+            task = _timed("create", store.create, f"worker {worker} task {i}")
+            created_ids.append(task["id"])
+            target = str(rng.randint(1, tasks))
+            _timed("get", store.get, target)
+            _timed("update", store.update, target, {"done": bool(i % 2)})
+            if i % 4 == 0:
+                _timed("delete", store.delete, task["id"])
+
+    wall_started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=writers) as pool:
+        list(pool.map(_writer, range(writers)))
+    wall = time.perf_counter() - wall_started
+
+    expected = tasks + writers * ops - len(timings["delete"])
+    total = store._conn().execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+    return {
+        "tasks": tasks,
+        "writers": writers,
+        "ops_per_writer": ops,
+        "seed_seconds": round(seed_seconds, 3),
+        "index_load_seconds": round(load_seconds, 3),
+        "operations": {kind: _summary(values) for kind, values in timings.items() if values},
+        "wall_seconds": round(wall, 3),
+        "writes_per_second": round(
+            (len(timings["create"]) + len(timings["update"]) + len(timings["delete"])) / wall, 1
+        ),
+        "expected_rows": expected,
+        "actual_rows": total,
+        "lost_writes": expected - total,
+        "stats_total_matches": store.stats()["total"] == total,
+        "unique_ids": len(set(created_ids)) == len(created_ids),
+        "legacy_json_rewrite_ms": round(legacy_rewrite_seconds(tasks, directory) * 1000, 1),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the SQLite task store")
+    parser.add_argument("--tasks", type=int, default=100_000, help="tasks to seed")
+    parser.add_argument("--writers", type=int, default=8, help="concurrent writer threads")
+    parser.add_argument("--ops", type=int, default=250, help="create/update cycles per writer")
+    parser.add_argument("--output", type=Path, help="also write the JSON report here")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report = run_benchmark(args.tasks, args.writers, args.ops, Path(tmp))
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0 if report["lost_writes"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""
+Transcription Benchmark
+
+Measures the live transcription pipeline stage by stage and under load:
+- decode   — container bytes -> float32 PCM (``convert_audio_to_float32``,
+             the path uploads take; ffmpeg resamples inside this stage)
+- resample — ``live_transcript.resample`` to 16 kHz mono
+- model    — Whisper inference on the 16 kHz samples
+- end-to-end throughput with N concurrent requests
+
+Audio comes from ``--audio`` or is synthesised (a syllable-rate modulated
+harmonic tone with pauses, at 44.1 kHz so resampling is exercised).
+Results are printed as JSON and optionally written to ``--output`` so runs
+can be compared between releases.
+
+Usage:
+    python -m backend.bench_transcription --seconds 30 --concurrency 4
+"""
+
+import argparse
+import io
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from backend import live_transcript
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SYNTH_SAMPLE_RATE = 44100
+
+
+# ---------------------------------------------------------------------------
+# Audio fixtures
+# ---------------------------------------------------------------------------
+
+
+def synthesize_speech_like(seconds: float, sample_rate: int = SYNTH_SAMPLE_RATE) -> bytes:
+    """Return WAV bytes of a speech-like signal: voiced bursts and pauses.
+
+    A 140 Hz fundamental with decaying harmonics is amplitude-modulated at a
+    syllable rate of ~4 Hz; every third second is silent, approximating
+    the pauses between phrases.
+    """
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    voice = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 6))
+    syllables = 0.5 * (1 + np.sin(2 * np.pi * 4 * t))
+    phrases = (np.floor(t) % 3 != 2).astype(np.float64)
+    signal = 0.2 * voice * syllables * phrases
+
+    pcm = (np.clip(signal, -1, 1) * 32767).astype("<i2")
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(pcm.tobytes())
+    return buf.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# Measurements
+# ---------------------------------------------------------------------------
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MB, if measurable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _summary(values: list[float]) -> dict:
+    return {
+        "median_ms": round(statistics.median(values) * 1000, 2),
+        "p95_ms": round(_percentile(values, 95) * 1000, 2),
+        "min_ms": round(min(values) * 1000, 2),
+    }
+
+
+def run_pipeline(audio_bytes: bytes, engine) -> dict:
+    """Run decode -> resample -> model once and return per-stage seconds."""
+    t0 = time.perf_counter()
+    data, sample_rate = live_transcript.convert_audio_to_float32(audio_bytes)
+    t1 = time.perf_counter()
+    samples = live_transcript.resample(data, sample_rate)
+    t2 = time.perf_counter()
+    result = engine.transcribe(samples, language="en")
+    t3 = time.perf_counter()
+
+    if result.get("error"):
+        raise RuntimeError(result["error"])
+    return {
+        "decode": t1 - t0,
+        "resample": t2 - t1,
+        "model": t3 - t2,
+        "total": t3 - t0,
+        "audio_seconds": len(samples) / live_transcript.samplerate,
+    }
+
+
+def run_benchmark(
+    audio_bytes: bytes,
+    engine=None,
+    repeat: int = 3,
+    concurrency: int = 2,
+    requests: int = 4,
+) -> dict:
+    """Benchmark *audio_bytes* and return a JSON-serialisable report."""
+    engine = engine or live_transcript.get_engine()
+
+    load_started = time.perf_counter()
+    if hasattr(engine, "ensure_initialized") and not engine.ensure_initialized():
+        raise RuntimeError("Transcription engine failed to initialize")
+    load_seconds = time.perf_counter() - load_started
+
+    # Warm-up run so one-off allocations don't skew the stage timings
+    run_pipeline(audio_bytes, engine)
+
+    runs = [run_pipeline(audio_bytes, engine) for _ in range(repeat)]
+    audio_seconds = runs[0]["audio_seconds"]
+
+    latencies = []
+
+    def _timed_request(_):
+        started = time.perf_counter()
+        run_pipeline(audio_bytes, engine)
+        latencies.append(time.perf_counter() - started)
+
+    wall_started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(_timed_request, range(requests)))
+    wall = time.perf_counter() - wall_started
+
+    model_median = statistics.median(r["model"] for r in runs)
+    total_median = statistics.median(r["total"] for r in runs)
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "backend": getattr(engine, "backend", "unknown"),
+        "model": live_transcript.MODEL_SIZE,
+        "audio_seconds": round(audio_seconds, 3),
+        "model_load_seconds": round(load_seconds, 3),
+        "stages": {
+            stage: _summary([r[stage] for r in runs])
+            for stage in ("decode", "resample", "model", "total")
+        },
+        "real_time_factor": {
+            "model": round(model_median / audio_seconds, 4),
+            "end_to_end": round(total_median / audio_seconds, 4),
+        },
+        "concurrency": {
+            "workers": concurrency,
+            "requests": requests,
+            "wall_seconds": round(wall, 3),
+            "requests_per_second": round(requests / wall, 3),
+            "audio_seconds_per_second": round(requests * audio_seconds / wall, 3),
+            "latency": _summary(latencies),
+        },
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+# ===================================================================
+# CLI
+# ===================================================================
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark live transcription")
+    parser.add_argument("--audio", type=Path, help="audio file to use instead of synthetic audio")
+    parser.add_argument("--seconds", type=float, default=30.0, help="length of synthetic audio")
+    parser.add_argument("--repeat", type=int, default=3, help="sequential runs per stage")
+    parser.add_argument("--concurrency", type=int, default=2, help="concurrent workers")
+    parser.add_argument("--requests", type=int, default=4, help="requests in the concurrent phase")
+    parser.add_argument("--output", type=Path, help="also write the JSON report here")
+    args = parser.parse_args(argv)
+
+    audio_bytes = args.audio.read_bytes() if args.audio else synthesize_speech_like(args.seconds)
+    report = run_benchmark(
+        audio_bytes,
+        repeat=args.repeat,
+        concurrency=args.concurrency,
+        requests=args.requests,
+    )
+    report["audio_source"] = str(args.audio) if args.audio else f"synthetic:{args.seconds}s"
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,260 @@
+"""Calendar Sync — local event index and concurrent event fan-out.
+
+``event_exists`` used to call ``events().list`` for every event created,
+just to compare titles in a one-minute window, and ``create_calendar_event``
+then ran the Calendar insert, the local save and the Notion page one
+after another, with the first failure hiding the rest.
+
+``CalendarIndex`` keeps ``(title, start minute)`` for every known upcoming
+Calendar event. It is filled by one full listing and then kept current
+with Calendar's incremental ``syncToken`` listings (at most one call per
+``max_age`` seconds), plus every event we insert ourselves. A duplicate
+check is then a set lookup.
+
+``run_targets`` runs the side effects of creating an event concurrently.
+Each target is retried on transient errors (timeouts, 429, 5xx) and
+reported on its own. A Calendar insert is not idempotent, so callers give
+the event a deterministic ``id`` (``event_id``): a retried insert whose
+first attempt went through gets a 409 instead of a second event.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("calendar_sync")
+
+INDEX_FILE = Path(__file__).resolve().parent / "cache" / "calendar_index.json"
+INDEX_MAX_AGE = 60          # seconds between incremental syncs
+LOOKBACK = timedelta(days=1)
+PAGE_SIZE = 250
+RETRIES = 2
+RETRY_BACKOFF = 0.5
+TRANSIENT_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+def _status(exc: Exception) -> int | None:
+    for candidate in (getattr(getattr(exc, "resp", None), "status", None),
+                      getattr(exc, "status", None),
+                      getattr(exc, "status_code", None)):
+        try:
+            return int(candidate)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def is_transient(exc: Exception) -> bool:
+    """Whether retrying *exc* could succeed (network trouble, 429, 5xx)."""
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    return _status(exc) in TRANSIENT_STATUSES
+
+
+def _event_key(title: str, start: datetime) -> str:
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    minute = start.astimezone(timezone.utc).replace(second=0, microsecond=0)
+    return f"{title.strip().casefold()}|{minute.isoformat()}"
+
+
+def event_id(title: str, start: datetime) -> str:
+    """Calendar event id for *title* at *start*'s minute (base32hex, as the API requires)."""
+    digest = hashlib.sha256(_event_key(title, start).encode("utf-8")).digest()[:20]
+    return base64.b32hexencode(digest).decode("ascii").lower()
+
+
+# ---------------------------------------------------------------------------
+# Local index
+# ---------------------------------------------------------------------------
+
+class CalendarIndex:
+    """Known Calendar events, keyed by normalized title and start minute."""
+
+    def __init__(
+        self,
+        index_file: Path | None = INDEX_FILE,
+        calendar_id: str = "primary",
+        max_age: float = INDEX_MAX_AGE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._index_file = Path(index_file) if index_file else None
+        self._calendar_id = calendar_id
+        self._max_age = max_age
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._events: dict[str, str] = {}      # calendar event id -> key
+        self._keys: dict[str, int] = {}        # key -> number of events
+        self._sync_token: str | None = None
+        self._synced_at: float | None = None
+        self._stats = {"full_syncs": 0, "incremental_syncs": 0, "list_calls": 0, "lookups": 0}
+        self._load()
+
+    # -- persistence ----------------------------------------------------
+
+    def _load(self) -> None:
+        if not self._index_file or not self._index_file.exists():
+            return
+        try:
+            data = json.loads(self._index_file.read_text(encoding="utf-8"))
+            for event_id, key in data["events"].items():
+                self._put(event_id, key)
+            self._sync_token = data.get("sync_token")
+        except (OSError, ValueError, KeyError, AttributeError) as exc:
+            logger.warning("Ignoring unreadable calendar index %s: %s", self._index_file, exc)
+            self._events, self._keys, self._sync_token = {}, {}, None
+
+    def _save(self) -> None:
+        if not self._index_file:
+            return
+        self._index_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self._index_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"sync_token": self._sync_token, "events": self._events}, f)
+            os.replace(tmp, self._index_file)
+        except OSError as exc:
+            Path(tmp).unlink(missing_ok=True)
+            logger.warning("Could not save calendar index: %s", exc)
+
+    # -- bookkeeping ----------------------------------------------------
+
+    def _put(self, event_id: str, key: str) -> None:
+        self._drop(event_id)
+        self._events[event_id] = key
+        self._keys[key] = self._keys.get(key, 0) + 1
+
+    def _drop(self, event_id: str) -> None:
+        key = self._events.pop(event_id, None)
+        if key is not None:
+            self._keys[key] -= 1
+            if not self._keys[key]:
+                del self._keys[key]
+
+    def _apply(self, event: dict[str, Any]) -> None:
+        event_id = event.get("id")
+        if not event_id:
+            return
+        start = (event.get("start") or {}).get("dateTime")
+        if event.get("status") == "cancelled" or not start:
+            self._drop(event_id)   # deleted, or all-day (never a duplicate of a timed event)
+            return
+        self._put(event_id, _event_key(event.get("summary") or "", datetime.fromisoformat(start)))
+
+    # -- syncing --------------------------------------------------------
+
+    def _list_pages(self, service, **params) -> tuple[list[dict], str | None]:
+        items, page_token = [], None
+        while True:
+            response = service.events().list(
+                calendarId=self._calendar_id, maxResults=PAGE_SIZE, pageToken=page_token, **params
+            ).execute()
+            self._stats["list_calls"] += 1
+            items.extend(response.get("items", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return items, response.get("nextSyncToken")
+
+    def sync(self, service, force: bool = False) -> str:
+        """Bring the index up to date; returns ``"full"``, ``"incremental"`` or ``"fresh"``."""
+        with self._lock:
+            now = self._clock()
+            if not force and self._synced_at is not None and now - self._synced_at < self._max_age:
+                return "fresh"
+            mode = "incremental"
+            items: list[dict] = []
+            token = None
+            if self._sync_token:
+                try:
+                    items, token = self._list_pages(service, syncToken=self._sync_token, singleEvents=True)
+                except Exception as exc:
+                    if _status(exc) != 410:
+                        raise
+                    logger.info("Calendar sync token expired; relisting")
+                    self._sync_token = None
+            if not self._sync_token:
+                mode = "full"
+                time_min = (datetime.now(timezone.utc) - LOOKBACK).isoformat()
+                items, token = self._list_pages(service, timeMin=time_min, singleEvents=True)
+                self._events, self._keys = {}, {}
+            for event in items:
+                self._apply(event)
+            self._sync_token = token or self._sync_token
+            self._synced_at = now
+            self._stats[f"{mode}_syncs"] += 1
+            if mode == "full" or items:
+                self._save()
+            return mode
+
+    def contains(self, service, title: str, start: datetime) -> bool:
+        """Whether an event with *title* already starts in *start*'s minute."""
+        self.sync(service)
+        with self._lock:
+            self._stats["lookups"] += 1
+            return _event_key(title, start) in self._keys
+
+    def record(self, event: dict[str, Any]) -> None:
+        """Add an event we just inserted, without waiting for the next sync."""
+        with self._lock:
+            self._apply(event)
+            self._save()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, events=len(self._events), has_sync_token=self._sync_token is not None)
+
+
+# ---------------------------------------------------------------------------
+# Concurrent side effects
+# ---------------------------------------------------------------------------
+
+@dataclass
+class TargetResult:
+    ok: bool
+    attempts: int
+    duration_ms: float
+    value: Any = None
+    error: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+_executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix="event-targets")
+
+
+def _run_with_retry(fn: Callable[[], Any], retries: int, backoff: float) -> TargetResult:
+    started = time.perf_counter()
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            value = fn()
+            return TargetResult(True, attempt, round((time.perf_counter() - started) * 1000, 1), value)
+        except Exception as exc:
+            if attempt > retries or not is_transient(exc):
+                return TargetResult(
+                    False, attempt, round((time.perf_counter() - started) * 1000, 1), error=str(exc) or type(exc).__name__
+                )
+            time.sleep(backoff * 2 ** (attempt - 1))
+
+
+def run_targets(
+    targets: dict[str, Callable[[], Any]],
+    retries: int = RETRIES,
+    backoff: float = RETRY_BACKOFF,
+) -> dict[str, TargetResult]:
+    """Run every target concurrently; one failing never stops the others."""
+    futures = {name: _executor.submit(_run_with_retry, fn, retries, backoff) for name, fn in targets.items()}
+    return {name: future.result() for name, future in futures.items()}
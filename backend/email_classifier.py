@@ -0,0 +1,175 @@
+"""Email Classifier — cached, batched email type classification.
+
+``scan_emails`` and the mailbox sync used to make one Gemini call per
+email, and re-classified the same unread messages on every scan. Here:
+
+- ``quick_classify`` settles obvious cases (exams, meetings, video-call
+  invites, interviews) with precompiled keyword patterns and no LLM call
+- results are cached by message id + body hash, in memory and in
+  ``backend/cache/email_classifications.json``
+- the remaining emails go to the LLM in batches of ``max_batch`` per
+  prompt, and each call reports how many LLM calls it made
+- an email the LLM could not classify (failed call, left out of the
+  reply) comes back as ``None``, never as ``"none"``, so callers can leave
+  it for the next pass instead of treating it as "not an event"
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("email_classifier")
+
+CACHE_FILE = Path(__file__).resolve().parent / "cache" / "email_classifications.json"
+MAX_CACHE_ENTRIES = 5000
+MAX_BATCH = 20
+
+EMAIL_TYPES = ("meeting", "exam", "task", "interview", "payment", "none")
+
+# Checked in order; the first match wins (exam used to override meeting)
+_RULES = [
+    ("exam", re.compile(r"\bexam(?:s|ination)?\b", re.IGNORECASE)),
+    ("meeting", re.compile(
+        r"\bmeeting\b|\bgoogle meet\b|meet\.google\.com/|zoom\.us/j/|\bteams (?:meeting|call)\b",
+        re.IGNORECASE,
+    )),
+    ("interview", re.compile(r"\binterview(?:s|ing)?\b", re.IGNORECASE)),
+]
+
+
+def quick_classify(text: str, subject: str = "") -> str | None:
+    """The type of an obvious email, or None if it needs the LLM."""
+    for email_type, pattern in _RULES:
+        if pattern.search(subject) or pattern.search(text):
+            return email_type
+    return None
+
+
+def normalize_type(value: Any) -> str:
+    value = str(value or "").strip().lower()
+    return value if value in EMAIL_TYPES else "none"
+
+
+def _cache_key(message_id: str | None, subject: str, text: str) -> str:
+    digest = hashlib.sha256(f"{subject}\n{text}".encode("utf-8")).hexdigest()[:32]
+    return f"{message_id or ''}:{digest}"
+
+
+class EmailClassifier:
+    """Classifies emails with rules, then cache, then batched LLM calls.
+
+    *classify_batch* takes a list of email texts and returns one type per
+    text, in order, from a single LLM call. A ``None`` entry (or a short
+    list) marks emails the reply left out; it raises if the reply is
+    unusable.
+    """
+
+    def __init__(
+        self,
+        classify_batch: Callable[[list[str]], list[str | None]],
+        cache_file: Path | None = CACHE_FILE,
+        max_batch: int = MAX_BATCH,
+        max_entries: int = MAX_CACHE_ENTRIES,
+    ):
+        self._classify_batch = classify_batch
+        self._cache_file = Path(cache_file) if cache_file else None
+        self._max_batch = max_batch
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._totals = {"emails": 0, "rule_hits": 0, "cache_hits": 0, "llm_emails": 0, "llm_calls": 0}
+        self._load()
+
+    def _load(self) -> None:
+        if not self._cache_file or not self._cache_file.exists():
+            return
+        try:
+            data = json.loads(self._cache_file.read_text(encoding="utf-8"))
+            self._cache.update((k, normalize_type(v)) for k, v in data.items())
+        except (OSError, ValueError, AttributeError) as exc:
+            logger.warning("Ignoring unreadable classification cache %s: %s", self._cache_file, exc)
+
+    def _save(self) -> None:
+        if not self._cache_file:
+            return
+        self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self._cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f)
+            os.replace(tmp, self._cache_file)
+        except OSError as exc:
+            Path(tmp).unlink(missing_ok=True)
+            logger.warning("Could not save classification cache: %s", exc)
+
+    def classify_many(self, emails: list[dict]) -> tuple[list[str | None], dict[str, int]]:
+        """Classify ``{"id", "text", "subject"}`` dicts.
+
+        Returns the types in input order and a report of how each was
+        decided. Emails whose LLM batch failed, or that the reply left
+        out, come back as ``None`` and are not cached, so the next scan
+        retries them.
+        """
+        report = {"emails": len(emails), "rule_hits": 0, "cache_hits": 0, "llm_emails": 0, "llm_calls": 0}
+        types: list[str | None] = [None] * len(emails)
+        uncached: list[tuple[int, str]] = []
+        with self._lock:
+            for n, email in enumerate(emails):
+                text, subject = email.get("text") or "", email.get("subject") or ""
+                key = _cache_key(email.get("id"), subject, text)
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    types[n] = self._cache[key]
+                    report["cache_hits"] += 1
+                elif (quick := quick_classify(text, subject)) is not None:
+                    types[n] = quick
+                    report["rule_hits"] += 1
+                else:
+                    uncached.append((n, key))
+
+        learned: dict[str, str] = {}
+        for start in range(0, len(uncached), self._max_batch):
+            batch = uncached[start:start + self._max_batch]
+            texts = [
+                f"Subject: {emails[n].get('subject') or ''}\n{emails[n].get('text') or ''}".strip()
+                for n, _key in batch
+            ]
+            report["llm_calls"] += 1
+            report["llm_emails"] += len(batch)
+            try:
+                results = list(self._classify_batch(texts))
+            except Exception as exc:
+                logger.warning("Batch classification of %d emails failed: %s", len(batch), exc)
+                results = []
+            for i, (n, key) in enumerate(batch):
+                if i < len(results) and results[i] is not None:
+                    types[n] = learned[key] = normalize_type(results[i])
+
+        with self._lock:
+            for key, email_type in learned.items():
+                self._cache[key] = email_type
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+            for name, value in report.items():
+                self._totals[name] += value
+            if learned:
+                self._save()
+        return types, report
+
+    def classify(self, text: str, message_id: str | None = None, subject: str = "") -> str | None:
+        types, _report = self.classify_many([{"id": message_id, "text": text, "subject": subject}])
+        return types[0]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats: dict[str, Any] = dict(self._totals, cached=len(self._cache))
+        stats["llm_calls_per_email"] = round(stats["llm_calls"] / stats["emails"], 3) if stats["emails"] else 0.0
+        return stats
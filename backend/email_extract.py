@@ -0,0 +1,186 @@
+"""Email Extract — single-pass date, time and duration extraction.
+
+``_parse_email_details`` (API) and ``process_email`` (daemon) each ran
+several ``re.search`` calls over the lowercased body and understood only
+``dd/mm/yyyy`` and ``h:mm am/pm``. This module compiles one alternation
+of every supported form and walks the lowercased text once with ``finditer``,
+returning each candidate with its offsets:
+
+- dates: ``11/04/2026`` (day first), ``2026-04-11`` (ISO, optionally with
+  ``T10:30``), ``11 April 2026`` / ``11th of Apr``, ``April 11, 2026``,
+  ``today`` / ``tomorrow`` / ``day after tomorrow``, ``(next) Friday``
+- times: ``10:30 am``, ``3pm``, ``3 p.m.``, ``14:00``, ``noon``
+- durations: ``2 hours``, ``for 1.5 hrs``, ``45 minutes``, ``an hour``,
+  ``half an hour`` (a bare ``a minute`` is an idiom, not a duration)
+
+``find_event_time`` then picks the first absolute date (falling back to the
+first relative one), the time closest to it and the first duration.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, tzinfo
+
+DEFAULT_TIME = time(9, 0)
+DEFAULT_DURATION_MINUTES = 60
+
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+_WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+_MONTH = (
+    r"jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+    r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?"
+)
+_ORDINAL = r"(?:st|nd|rd|th)?"
+
+# One outer named group per form; ``match.lastgroup`` says which matched.
+# Text is lowercased up front instead of using IGNORECASE. The leading
+# assertions reject most positions cheaply: only a digit or a letter that
+# can start a keyword, at the start of a word, goes on to the alternation,
+# and word-led forms are only tried where one of their keywords begins.
+_DIGIT_FORMS = [
+    r"(?P<iso>(?P<iso_y>\d{4})-(?P<iso_m>\d{1,2})-(?P<iso_d>\d{1,2})"
+    r"(?:[T ](?P<iso_h>[01]\d|2[0-3]):(?P<iso_min>[0-5]\d))?)",
+    r"(?P<dmy>(?P<dmy_d>\d{1,2})[/.-](?P<dmy_m>\d{1,2})[/.-](?P<dmy_y>\d{4})\b)",
+    rf"(?P<day_month>(?P<dm_d>\d{{1,2}}){_ORDINAL}\s+(?:of\s+)?(?P<dm_m>{_MONTH})\b\.?"
+    r"(?:,?\s+(?P<dm_y>\d{4})\b)?)",
+    r"(?P<clock12>(?P<h12>1[0-2]|0?[1-9])(?::(?P<min12>[0-5]\d))?\s*(?P<ampm>[ap])\.?m\.?(?!\w))",
+    r"(?P<clock24>(?P<h24>[01]?\d|2[0-3]):(?P<min24>[0-5]\d)\b)",
+    r"(?P<duration>(?P<dur>\d+(?:\.\d+)?)\s*(?P<dur_unit>hours?|hrs?|minutes?|mins?)\b)",
+]
+_WORD_FORMS = [
+    rf"(?P<month_day>(?P<md_m>{_MONTH})\.?\s+(?P<md_d>\d{{1,2}}){_ORDINAL}\b"
+    r"(?:,?\s+(?P<md_y>\d{4})\b)?)",
+    r"(?P<relative>(?:day after tomorrow|today|tonight|tomorrow)\b)",
+    rf"(?P<weekday>(?:(?P<wd_next>next)\s+)?(?P<wd>{'|'.join(_WEEKDAYS)})\b)",
+    r"(?P<noon>(?:noon|midday)\b)",
+    r"(?P<word_duration>(?P<wdur>half an?|an?)\s+(?P<wdur_unit>hours?|hrs?)\b)",
+]
+_KEYWORD_START = (
+    r"(?=jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|to[dnm]|day|next"
+    r"|mon|tue|wed|thu|fri|sat|sun|noon|midday|half|an?\s)"
+)
+_TOKEN_RE = re.compile(
+    rf"(?<!\w)(?=[\djfmasondtwh])(?:(?=\d)(?:{'|'.join(_DIGIT_FORMS)})"
+    rf"|{_KEYWORD_START}(?:{'|'.join(_WORD_FORMS)}))"
+)
+
+
+@dataclass(frozen=True)
+class Candidate:
+    kind: str        # "date" | "time" | "duration"
+    value: object    # date | time | int minutes
+    start: int
+    end: int
+    text: str
+    relative: bool = False   # today/tomorrow/weekday dates, resolved against *today*
+
+
+_RELATIVE_FORMS = ("relative", "weekday")
+
+
+@dataclass(frozen=True)
+class EventTime:
+    start: datetime
+    duration_minutes: int
+    candidates: list[Candidate]
+
+
+def _next_on_or_after(today: date, month: int, day: int) -> date:
+    candidate = date(today.year, month, day)
+    return candidate if candidate >= today else date(today.year + 1, month, day)
+
+
+def _resolve(match: re.Match, today: date) -> list[tuple[str, object]]:
+    form = match.lastgroup
+    g = match.group
+    if form == "iso":
+        found: list[tuple[str, object]] = [("date", date(int(g("iso_y")), int(g("iso_m")), int(g("iso_d"))))]
+        if g("iso_h"):
+            found.append(("time", time(int(g("iso_h")), int(g("iso_min")))))
+        return found
+    if form == "dmy":
+        return [("date", date(int(g("dmy_y")), int(g("dmy_m")), int(g("dmy_d"))))]
+    if form in ("day_month", "month_day"):
+        prefix = "dm" if form == "day_month" else "md"
+        month = _MONTHS[g(f"{prefix}_m")[:3]]
+        day = int(g(f"{prefix}_d"))
+        year = g(f"{prefix}_y")
+        return [("date", date(int(year), month, day) if year else _next_on_or_after(today, month, day))]
+    if form == "relative":
+        word = match.group()
+        offset = 2 if word.startswith("day after") else 1 if word == "tomorrow" else 0
+        return [("date", today + timedelta(days=offset))]
+    if form == "weekday":
+        ahead = (_WEEKDAYS.index(g("wd")) - today.weekday()) % 7
+        if g("wd_next") and ahead == 0:
+            ahead = 7
+        return [("date", today + timedelta(days=ahead))]
+    if form == "clock12":
+        hour = int(g("h12")) % 12 + (12 if g("ampm") == "p" else 0)
+        return [("time", time(hour, int(g("min12") or 0)))]
+    if form == "clock24":
+        return [("time", time(int(g("h24")), int(g("min24"))))]
+    if form == "noon":
+        return [("time", time(12, 0))]
+    if form == "word_duration":
+        amount = 0.5 if g("wdur").startswith("half") else 1.0
+        unit = g("wdur_unit")
+    else:
+        amount, unit = float(g("dur")), g("dur_unit")
+    minutes = amount * (60 if unit.startswith("h") else 1)
+    return [("duration", int(round(minutes)))]
+
+
+def extract_candidates(text: str, today: date | None = None) -> list[Candidate]:
+    """Every date, time and duration mention in *text*, in text order.
+
+    Relative dates and month-day dates without a year resolve against
+    *today*. Impossible dates (``31/02/2026``) are skipped.
+    """
+    today = today or date.today()
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # A few characters lowercase to two; keep offsets aligned with *text*
+        lowered = "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+    candidates = []
+    for match in _TOKEN_RE.finditer(lowered):
+        try:
+            resolved = _resolve(match, today)
+        except ValueError:
+            continue
+        relative = match.lastgroup in _RELATIVE_FORMS
+        for kind, value in resolved:
+            candidates.append(
+                Candidate(kind, value, match.start(), match.end(), text[match.start():match.end()], relative)
+            )
+    return candidates
+
+
+def find_event_time(
+    text: str,
+    tz: tzinfo,
+    today: date | None = None,
+    default_time: time = DEFAULT_TIME,
+    default_duration: int = DEFAULT_DURATION_MINUTES,
+) -> EventTime | None:
+    """The event start and length described by *text*, or None if undated.
+
+    Uses the first absolute date (a relative word like "today" only if
+    there is none, so "Sale ends today! Meeting on 20/04/2026" means the
+    20th), the time mentioned closest to it, and the first duration;
+    missing parts fall back to the defaults.
+    """
+    today = today or datetime.now(tz).date()
+    candidates = extract_candidates(text, today)
+    dates = [c for c in candidates if c.kind == "date"]
+    if not dates:
+        return None
+    first = next((c for c in dates if not c.relative), dates[0])
+    times = [c for c in candidates if c.kind == "time"]
+    at = min(times, key=lambda c: abs(c.start - first.start)).value if times else default_time
+    duration = next((c.value for c in candidates if c.kind == "duration"), default_duration)
+    start = datetime.combine(first.value, at).replace(tzinfo=tz)
+    return EventTime(start, duration, candidates)
@@ -0,0 +1,186 @@
+"""Event Bus — in-process change feed behind the ``GET /events`` SSE stream.
+
+Mutations publish small delta events (``task.updated``,
+``followup.created``, ``insight.changed`` …) from any thread. Each event
+gets a monotonically increasing id, prefixed with a per-process epoch
+(``<epoch>-<n>``), and is kept in a bounded history so a reconnecting
+client can resume from its ``Last-Event-ID``.
+
+Every subscriber has its own bounded queue. A subscriber that falls more
+than ``queue_size`` events behind is dropped rather than slowing down
+publishers or buffering without limit; its stream ends, and the browser's
+EventSource reconnects with the last id it saw and replays from history.
+If that id has already left the history, or comes from an earlier
+process (a restart starts counting at 1 again), the first event is
+``reset``, telling the client to refetch everything.
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger("event_bus")
+
+HISTORY_SIZE = 1000
+CLIENT_QUEUE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class Event:
+    id: int
+    topic: str
+    data: dict[str, Any]
+    published_at: float = field(default_factory=time.time)
+    epoch: str = ""
+
+    @property
+    def event_id(self) -> str:
+        """The SSE id: ``<epoch>-<n>``."""
+        return f"{self.epoch}-{self.id}"
+
+
+class Subscription:
+    """One client's view of the bus; read it with ``await next_event()``.
+
+    Delivery happens on the subscriber's event loop via
+    ``call_soon_threadsafe``, so publishers never block on a client.
+    """
+
+    def __init__(self, bus: "EventBus", loop: asyncio.AbstractEventLoop, queue_size: int):
+        self._bus = bus
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+        self.closed = False
+
+    def _deliver(self, event: Event) -> None:
+        # Runs on the subscriber's loop
+        if self.closed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.info("Dropping slow event subscriber after event %s", event.id)
+            # The queue is full, so the reader drains it and then sees the end
+            self.overflowed = True
+            self.close()
+
+    def deliver_threadsafe(self, event: Event) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._deliver, event)
+        except RuntimeError:  # loop already closed
+            self.close()
+
+    async def next_event(self, timeout: float | None = None) -> Event | None:
+        """The next event, or None on timeout or once the subscription ended."""
+        if self.closed and self._queue.empty():
+            return None
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._bus._unsubscribe(self)
+
+
+class EventBus:
+    def __init__(self, history_size: int = HISTORY_SIZE, queue_size: int = CLIENT_QUEUE_SIZE):
+        self._history: deque[Event] = deque(maxlen=history_size)
+        self._ids = itertools.count(1)
+        # Tells ids from this process apart from a previous one's
+        self.epoch = uuid.uuid4().hex[:8]
+        self._queue_size = queue_size
+        self._subscribers: set[Subscription] = set()
+        self._listeners: list[Callable[[Event], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def last_id(self) -> int:
+        with self._lock:
+            return self._history[-1].id if self._history else 0
+
+    def publish(self, topic: str, data: dict[str, Any]) -> Event:
+        """Record and fan out an event. Safe to call from any thread."""
+        with self._lock:
+            event = Event(next(self._ids), topic, data, epoch=self.epoch)
+            self._history.append(event)
+            subscribers = list(self._subscribers)
+            listeners = list(self._listeners)
+        for subscription in subscribers:
+            subscription.deliver_threadsafe(event)
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception as exc:
+                logger.warning("Event listener failed for %s: %s", topic, exc)
+        return event
+
+    def add_listener(self, listener: Callable[[Event], None]) -> None:
+        """Call *listener* synchronously (in the publisher's thread) per event."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def subscribe(self, last_event_id: str | int | None = None) -> tuple[Subscription, list[Event]]:
+        """Register a subscriber on the running loop.
+
+        *last_event_id* is an ``<epoch>-<n>`` id as sent, or a bare number
+        taken to be from this process. Returns the subscription and the
+        events to replay first: those after it, or a single ``reset`` event
+        if it is from another epoch or history no longer reaches back that
+        far.
+        """
+        subscription = Subscription(self, asyncio.get_running_loop(), self._queue_size)
+        with self._lock:
+            self._subscribers.add(subscription)
+            if last_event_id is None:
+                return subscription, []
+            last = self._history[-1].id if self._history else 0
+            oldest = self._history[0].id if self._history else last + 1
+            reset = [Event(last, "reset", {"reason": "history_unavailable"}, epoch=self.epoch)]
+            if isinstance(last_event_id, str):
+                epoch, _, n = last_event_id.strip().rpartition("-")
+                # Another epoch means the server restarted since the client's last event
+                if epoch != self.epoch or not n.isdigit():
+                    return subscription, reset
+                last_event_id = int(n)
+            # Ids beyond ours or before the history mean events were lost
+            if last_event_id > last or last_event_id < oldest - 1:
+                return subscription, reset
+            return subscription, [e for e in self._history if e.id > last_event_id]
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "history": len(self._history),
+                "last_id": self._history[-1].id if self._history else 0,
+            }
+
+
+_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    return _bus
+
+
+def publish(topic: str, data: dict[str, Any]) -> None:
+    """Publish on the shared bus; never lets a bus failure break a mutation."""
+    try:
+        _bus.publish(topic, data)
+    except Exception as exc:
+        logger.warning("Could not publish %s: %s", topic, exc)
@@ -1,84 +1,257 @@
-import requests
+"""Journal Extract — sync Notion journal pages into the knowledge hub.
+
+This used to run at import time: one database query page (ignoring
+``has_more``), each page's blocks fetched serially (again only the first
+page of them), and a fresh ``requests`` connection per call.
+
+``JournalSync.sync`` instead:
+
+- follows ``next_cursor`` through every page of the database query
+- fetches page blocks on a bounded thread pool over one pooled
+  ``requests.Session``, following block pagination too
+- syncs incrementally: the query asks only for pages edited at or after
+  the checkpointed ``last_edited_time``. Notion timestamps have minute
+  precision, so the ids already synced at that exact time are kept too
+  and skipped on the next run
+- merges each page into the knowledge log with ``store_entry`` under the
+  key ``notion:<page id>``, superseding older copies of the same page and
+  leaving meeting and other entries alone. Title and text go under
+  ``data`` as ``title``/``summary``, the shape meeting entries use, so
+  the hub's view and search read them the same way
+
+Usage:
+    python -m backend.extract_journal [--full]
+"""
+
+import argparse
 import json
+import logging
 import os
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.knowledge_hub import store_entry
 
-# ======================
-# LOAD ENV VARIABLES
-# ======================
+logger = logging.getLogger("extract_journal")
 
 load_dotenv()
 
-NOTION_JOURNAL_TOKEN = os.getenv("NOTION_JOURNAL_TOKEN")
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CHECKPOINT_FILE = PROJECT_ROOT / "journal_sync.json"
 DATABASE_ID = "27e61e92-5a94-81c6-a160-ed144b73e771"
+NOTION_VERSION = "2022-06-28"
+PAGE_SIZE = 100
+WORKERS = 4
+MAX_RETRIES = 4
+TIMEOUT = (5, 30)
 
-headers = {
-    "Authorization": f"Bearer {NOTION_JOURNAL_TOKEN}",
-    "Notion-Version": "2022-06-28",
-    "Content-Type": "application/json"
-}
 
-# ======================
-# GET PAGE CONTENT
-# ======================
+def notion_endpoint() -> str:
+    """Notion API base URL; ``NOTION_API_ENDPOINT`` points it elsewhere (tests)."""
+    return (os.getenv("NOTION_API_ENDPOINT") or "https://api.notion.com/v1").rstrip("/")
 
-def get_page_content(page_id):
 
-    url = f"https://api.notion.com/v1/blocks/{page_id}/children"
+def page_title(page: dict[str, Any]) -> str:
+    for prop in page.get("properties", {}).values():
+        if prop.get("type") == "title" and prop.get("title"):
+            return prop["title"][0]["plain_text"]
+    return "Untitled"
 
-    res = requests.get(url, headers=headers)
-    data = res.json()
 
+def block_text(blocks: list[dict[str, Any]]) -> str:
     text = []
+    for block in blocks:
+        if block.get("type") == "paragraph":
+            for t in block["paragraph"]["rich_text"]:
+                text.append(t["plain_text"])
+    return "\n".join(text)
 
-    for block in data.get("results", []):
 
-        if block["type"] == "paragraph":
+class JournalSync:
+    """Incremental Notion database → knowledge hub sync."""
 
-            for t in block["paragraph"]["rich_text"]:
-                text.append(t["plain_text"])
+    def __init__(
+        self,
+        token: str,
+        database_id: str = DATABASE_ID,
+        checkpoint_path: Path = CHECKPOINT_FILE,
+        endpoint: str | None = None,
+        workers: int = WORKERS,
+        page_size: int = PAGE_SIZE,
+        store: Callable[[dict], Any] = store_entry,
+    ):
+        self.database_id = database_id
+        self.checkpoint_path = Path(checkpoint_path)
+        self.endpoint = (endpoint or notion_endpoint()).rstrip("/")
+        self.workers = workers
+        self.page_size = page_size
+        self._store = store
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers, max_retries=0)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update({
+            "Authorization": f"Bearer {token}",
+            "Notion-Version": NOTION_VERSION,
+            "Content-Type": "application/json",
+        })
+        self._calls_lock = threading.Lock()
+        self._calls = {"query": 0, "blocks": 0, "retries": 0}
 
-    return "\n".join(text)
+    # ------------------------------------------------------------------
+    # Checkpoint
+    # ------------------------------------------------------------------
+
+    def checkpoint(self) -> dict[str, Any]:
+        try:
+            data = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+            return {"since": data.get("since"), "seen": list(data.get("seen", []))}
+        except FileNotFoundError:
+            return {"since": None, "seen": []}
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable %s: %s", self.checkpoint_path, exc)
+            return {"since": None, "seen": []}
+
+    def _save(self, since: str | None, seen: list[str]) -> None:
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.checkpoint_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"since": since, "seen": seen}, f)
+            os.replace(tmp, self.checkpoint_path)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
 
+    def _request(self, kind: str, method: str, path: str, **kwargs) -> dict[str, Any]:
+        attempt = 0
+        while True:
+            with self._calls_lock:
+                self._calls[kind] += 1
+            response = self._session.request(method, self.endpoint + path, timeout=TIMEOUT, **kwargs)
+            # Notion rate-limits at ~3 requests/s per integration
+            if response.status_code not in (429, 502, 503, 504) or attempt >= MAX_RETRIES:
+                response.raise_for_status()
+                return response.json()
+            with self._calls_lock:
+                self._calls["retries"] += 1
+            time.sleep(float(response.headers.get("Retry-After") or 0.5 * 2 ** attempt))
+            attempt += 1
 
-# ======================
-# QUERY DATABASE
-# ======================
+    def query_pages(self, since: str | None) -> list[dict[str, Any]]:
+        """Every database page edited at or after *since*, oldest edit first."""
+        body: dict[str, Any] = {
+            "page_size": self.page_size,
+            "sorts": [{"timestamp": "last_edited_time", "direction": "ascending"}],
+        }
+        if since:
+            body["filter"] = {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": since}}
+        pages = []
+        while True:
+            data = self._request("query", "POST", f"/databases/{self.database_id}/query", json=body)
+            pages.extend(data.get("results", []))
+            if not data.get("has_more"):
+                return pages
+            body["start_cursor"] = data["next_cursor"]
 
-url = f"https://api.notion.com/v1/databases/{DATABASE_ID}/query"
+    def page_blocks(self, page_id: str) -> list[dict[str, Any]]:
+        blocks, params = [], {"page_size": self.page_size}
+        while True:
+            data = self._request("blocks", "GET", f"/blocks/{page_id}/children", params=params)
+            blocks.extend(data.get("results", []))
+            if not data.get("has_more"):
+                return blocks
+            params["start_cursor"] = data["next_cursor"]
 
-response = requests.post(url, headers=headers)
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
 
-data = response.json()
+    def sync(self, full: bool = False) -> dict[str, Any]:
+        """Store every new or edited journal page; returns a summary.
 
-journals = []
+        The checkpoint only advances once every changed page is stored, so
+        a failed run is simply repeated (re-storing a page supersedes it).
+        """
+        started = time.perf_counter()
+        with self._calls_lock:
+            self._calls = {"query": 0, "blocks": 0, "retries": 0}
+        checkpoint = {"since": None, "seen": []} if full else self.checkpoint()
+        since, seen = checkpoint["since"], set(checkpoint["seen"])
 
-for page in data.get("results", []):
+        listed = self.query_pages(since)
+        changed = [p for p in listed if not (p.get("last_edited_time") == since and p["id"] in seen)]
 
-    page_id = page["id"]
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="journal-blocks") as pool:
+            contents = list(pool.map(lambda page: block_text(self.page_blocks(page["id"])), changed))
 
-    title = "Untitled"
+        for page, content in zip(changed, contents):
+            self._store({
+                "type": "journal",
+                "source": "Journal AI",
+                "date": str(datetime.now()),
+                "key": f"notion:{page['id']}",
+                "data": {"title": page_title(page), "summary": content},
+                "last_edited_time": page.get("last_edited_time"),
+            })
 
-    props = page.get("properties", {})
+        if listed:
+            latest = max(p.get("last_edited_time") or "" for p in listed)
+            at_latest = [p["id"] for p in listed if p.get("last_edited_time") == latest]
+            if latest == since:
+                at_latest = sorted(seen | set(at_latest))
+            self._save(latest, at_latest)
 
-    for p in props.values():
+        with self._calls_lock:
+            calls = dict(self._calls)
+        return {
+            "mode": "full" if not since else "incremental",
+            "since": since,
+            "listed": len(listed),
+            "stored": len(changed),
+            "skipped": len(listed) - len(changed),
+            "query_calls": calls["query"],
+            "block_calls": calls["blocks"],
+            "retries": calls["retries"],
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
 
-        if p["type"] == "title" and p["title"]:
-            title = p["title"][0]["plain_text"]
 
-    content = get_page_content(page_id)
+def sync_journal(full: bool = False) -> dict[str, Any]:
+    """Sync with ``NOTION_JOURNAL_TOKEN`` from the environment."""
+    token = os.getenv("NOTION_JOURNAL_TOKEN")
+    if not token:
+        raise RuntimeError("NOTION_JOURNAL_TOKEN is not set")
+    return JournalSync(token).sync(full=full)
 
-    journals.append({
-        "title": title,
-        "content": content
-    })
 
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Sync Notion journal pages into the knowledge hub")
+    parser.add_argument("--full", action="store_true", help="ignore the checkpoint and re-sync every page")
+    args = parser.parse_args(argv)
 
-# ======================
-# SAVE FILE
-# ======================
+    result = sync_journal(full=args.full)
+    print("Extracted", result["stored"], "journal entries")
+    print(json.dumps(result))
+    return 0
 
-with open("knowledge_base.json", "w", encoding="utf-8") as f:
-    json.dump(journals, f, indent=4, ensure_ascii=False)
 
-print("Extracted", len(journals), "full journal entries")
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,15 @@
 """Follow-Up Agent — AI-powered extraction of follow-ups from emails, meetings & knowledge."""
 import json
+import os
 import random
+import tempfile
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from backend.event_bus import publish
+from backend.indexed_collection import IndexedCollection
+
 FOLLOWUPS_FILE = Path(__file__).resolve().parent.parent / "followups.json"
 
 # ---------------------------------------------------------------------------
@@ -85,25 +91,39 @@ def _load_followups():
 
 
 def _save_followups(followups):
-    """Persist the follow-up list to the JSON file."""
-    with open(FOLLOWUPS_FILE, "w", encoding="utf-8") as f:
-        json.dump(followups, f, indent=2)
-
-
-def _next_id(followups: list) -> str:
-    """Generate a simple unique id string."""
-    if not followups:
-        return "1"
-    existing = set()
-    for f in followups:
-        try:
-            existing.add(int(f["id"]))
-        except (ValueError, KeyError):
-            pass
-    candidate = 1
-    while candidate in existing:
-        candidate += 1
-    return str(candidate)
+    """Persist the follow-up list to the JSON file (atomic rename)."""
+    try:
+        mode = FOLLOWUPS_FILE.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_path = tempfile.mkstemp(dir=FOLLOWUPS_FILE.parent, suffix=".tmp")
+    try:
+        # mkstemp creates 0600; keep the file readable as before
+        os.chmod(tmp_path, mode)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(followups, f, indent=2)
+        os.replace(tmp_path, FOLLOWUPS_FILE)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+# The follow-ups are loaded once per process into an id-indexed collection;
+# every mutation goes through it under _lock and is then written back.
+_collection: IndexedCollection | None = None
+_lock = threading.RLock()
+
+
+def _followups() -> IndexedCollection:
+    """Return the in-memory follow-up collection, loading it on first use."""
+    global _collection
+    if _collection is None:
+        _collection = IndexedCollection(_load_followups())
+    return _collection
+
+
+def _persist() -> None:
+    _save_followups(_followups().to_list())
 
 
 # ---------------------------------------------------------------------------
@@ -130,28 +150,28 @@ def scan_sources() -> dict:
     random.shuffle(extracted)
 
     # Store them so GET /followups returns them
-    existing = _load_followups()
-    # Only keep previously accepted/dismissed items, replace pending
-    kept = [f for f in existing if f.get("status") in ("accepted", "dismissed")]
-
-    new_items = []
-    for item in extracted:
-        new_items.append({
-            "id": _next_id(kept + new_items),
-            "source": item["source"],
-            "extracted_action": item["extracted_action"],
-            "confidence": item["confidence"],
-            "priority": item["priority"],
-            "due_date": item.get("due_date", ""),
-            "context": item.get("context", ""),
-            "status": "pending",
-            "scan_id": scan_id,
-            "created_at": datetime.now().isoformat(),
-            "resolved_at": None,
-        })
+    with _lock:
+        collection = _followups()
+        # Only keep previously accepted/dismissed items, replace pending
+        for stale in [f for f in collection if f.get("status") not in ("accepted", "dismissed")]:
+            collection.remove(stale["id"])
 
-    combined = kept + new_items
-    _save_followups(combined)
+        new_items = []
+        for item in extracted:
+            new_items.append(collection.add({
+                "source": item["source"],
+                "extracted_action": item["extracted_action"],
+                "confidence": item["confidence"],
+                "priority": item["priority"],
+                "due_date": item.get("due_date", ""),
+                "context": item.get("context", ""),
+                "status": "pending",
+                "scan_id": scan_id,
+                "created_at": datetime.now().isoformat(),
+                "resolved_at": None,
+            }))
+        _persist()
+    publish("followups.rescanned", {"scan_id": scan_id, "count": len(new_items)})
 
     return {
         "scan_id": scan_id,
@@ -171,29 +191,29 @@ def scan_sources() -> dict:
 
 def create_followup(title: str, source: str, due_date: str, priority: str) -> dict:
     """Create a new follow-up manually and persist it."""
-    followups = _load_followups()
-    followup = {
-        "id": _next_id(followups),
-        "title": title.strip(),
-        "source": source,
-        "due_date": due_date,
-        "priority": priority,
-        "status": "pending",
-        "created_at": datetime.now().isoformat(),
-        "completed_at": None,
-    }
-    followups.append(followup)
-    _save_followups(followups)
-    return followup
+    with _lock:
+        followup = _followups().add({
+            "title": title.strip(),
+            "source": source,
+            "due_date": due_date,
+            "priority": priority,
+            "status": "pending",
+            "created_at": datetime.now().isoformat(),
+            "completed_at": None,
+        })
+        _persist()
+    publish("followup.created", {"followup": dict(followup)})
+    return dict(followup)
 
 def get_all_followups() -> list[dict]:
     """Return all follow-ups."""
-    return _load_followups()
+    with _lock:
+        return [dict(f) for f in _followups()]
 
 
 def get_followup_stats() -> dict:
     """Compute aggregate statistics for the UI."""
-    followups = _load_followups()
+    followups = get_all_followups()
     total = len(followups)
     pending = sum(1 for f in followups if f.get("status") == "pending")
     accepted = sum(1 for f in followups if f.get("status") == "accepted")
@@ -219,28 +239,30 @@ def get_followup_stats() -> dict:
 
 def update_followup(followup_id: str, data: dict) -> dict | None:
     """Update a follow-up's fields. Returns updated follow-up or None."""
-    followups = _load_followups()
-    for followup in followups:
-        if followup["id"] == followup_id:
-            if "status" in data:
-                followup["status"] = data["status"]
-                followup["resolved_at"] = (
-                    datetime.now().isoformat()
-                    if data["status"] in ("accepted", "dismissed")
-                    else None
-                )
-            if "priority" in data:
-                followup["priority"] = data["priority"]
-            _save_followups(followups)
-            return followup
-    return None
+    with _lock:
+        followup = _followups().get(followup_id)
+        if followup is None:
+            return None
+        if "status" in data:
+            followup["status"] = data["status"]
+            followup["resolved_at"] = (
+                datetime.now().isoformat()
+                if data["status"] in ("accepted", "dismissed")
+                else None
+            )
+        if "priority" in data:
+            followup["priority"] = data["priority"]
+        _persist()
+        updated = dict(followup)
+    publish("followup.updated", {"followup": updated})
+    return updated
 
 
 def delete_followup(followup_id: str) -> bool:
     """Remove a follow-up by id. Returns True if deleted, False if not found."""
-    followups = _load_followups()
-    new_followups = [f for f in followups if f["id"] != followup_id]
-    if len(new_followups) == len(followups):
-        return False
-    _save_followups(new_followups)
+    with _lock:
+        if _followups().remove(followup_id) is None:
+            return False
+        _persist()
+    publish("followup.deleted", {"id": str(followup_id)})
     return True
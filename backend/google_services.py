@@ -0,0 +1,223 @@
+"""Google Services — process-wide cache of authenticated Gmail and Calendar clients.
+
+Loading ``token.json`` and building a discovery client used to happen on
+every email endpoint call. ``GoogleServiceCache`` loads the credentials
+once and refreshes them under a lock shortly *before* they expire, so a
+request never waits on the 401 → refresh → retry loop and concurrent
+requests share a single refresh. ``token.json`` is rewritten only after a
+refresh. Built clients are cached per thread (the underlying httplib2
+connection is not thread-safe) and per credentials object, so they are
+rebuilt once credentials are reloaded.
+
+Callers that hit an auth error (revoked token, 401) hand it to
+``invalidate_on_auth_error``; the next call reloads from disk.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("google_services")
+
+BACKEND_DIR = Path(__file__).resolve().parent
+TOKEN_FILE = BACKEND_DIR / "token.json"
+CREDENTIALS_FILE = BACKEND_DIR / "credentials.json"
+
+SCOPES = [
+    "https://www.googleapis.com/auth/gmail.modify",
+    "https://www.googleapis.com/auth/calendar",
+]
+
+# Refresh this long before the access token expires
+REFRESH_MARGIN = timedelta(minutes=5)
+
+
+class GoogleAuthError(RuntimeError):
+    """No usable credentials without re-authorising interactively."""
+
+
+def _utcnow() -> datetime:
+    # google-auth keeps ``expiry`` as a naive UTC datetime
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _build(name: str, version: str, credentials=None):
+    from googleapiclient.discovery import build
+
+    kwargs: dict[str, Any] = {"credentials": credentials, "cache_discovery": False}
+    # e.g. GMAIL_API_ENDPOINT, to point a client at a local fake API
+    endpoint = os.getenv(f"{name.upper()}_API_ENDPOINT")
+    if endpoint:
+        kwargs["client_options"] = {"api_endpoint": endpoint}
+    return build(name, version, **kwargs)
+
+
+def is_auth_error(exc: BaseException) -> bool:
+    """True for errors that mean the cached credentials are no good."""
+    if isinstance(exc, GoogleAuthError):
+        return True
+    try:
+        from google.auth.exceptions import RefreshError
+
+        if isinstance(exc, RefreshError):
+            return True
+    except ImportError:
+        pass
+    return getattr(getattr(exc, "resp", None), "status", None) == 401
+
+
+class GoogleServiceCache:
+    def __init__(
+        self,
+        token_file: Path = TOKEN_FILE,
+        credentials_file: Path = CREDENTIALS_FILE,
+        scopes: list[str] = SCOPES,
+        builder: Callable[..., Any] = _build,
+        clock: Callable[[], datetime] = _utcnow,
+    ):
+        self._token_file = Path(token_file)
+        self._credentials_file = Path(credentials_file)
+        self._scopes = scopes
+        self._builder = builder
+        self._clock = clock
+        self._creds = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {"loads": 0, "refreshes": 0, "builds": 0, "invalidations": 0}
+
+    # ------------------------------------------------------------------
+    # Credentials
+    # ------------------------------------------------------------------
+
+    def _load(self):
+        from google.oauth2.credentials import Credentials
+
+        if not self._token_file.exists():
+            return None
+        self._stats["loads"] += 1
+        return Credentials.from_authorized_user_file(str(self._token_file), self._scopes)
+
+    def _needs_refresh(self, creds) -> bool:
+        if not creds.token:
+            return True
+        return creds.expiry is not None and creds.expiry - self._clock() <= REFRESH_MARGIN
+
+    def _still_valid(self, creds) -> bool:
+        return bool(creds.token) and creds.expiry is not None and creds.expiry > self._clock()
+
+    def _refresh(self, creds) -> None:
+        from google.auth.transport.requests import Request
+
+        creds.refresh(Request())
+        self._stats["refreshes"] += 1
+        self._save(creds)
+        logger.info("Refreshed Google credentials; new expiry %s", creds.expiry)
+
+    def _save(self, creds) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self._token_file.parent, prefix=".token.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(creds.to_json())
+            os.replace(tmp, self._token_file)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _authorise_interactively(self):
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
+        flow = InstalledAppFlow.from_client_secrets_file(str(self._credentials_file), self._scopes)
+        creds = flow.run_local_server(port=0)
+        self._save(creds)
+        return creds
+
+    def credentials(self, interactive: bool = False):
+        """Return valid credentials, refreshing them if they expire soon.
+
+        With *interactive*, falls back to the browser consent flow (CLI
+        use only); otherwise raises ``GoogleAuthError``.
+        """
+        with self._lock:
+            creds = self._creds or self._load()
+            if creds is not None and self._needs_refresh(creds):
+                if creds.refresh_token:
+                    try:
+                        self._refresh(creds)
+                    except Exception as exc:
+                        if self._still_valid(creds):
+                            # Early refresh only; try again on the next call
+                            logger.warning("Google credential refresh failed, token still valid: %s", exc)
+                        else:
+                            logger.warning("Google credential refresh failed: %s", exc)
+                            creds = None
+                elif creds.expired or not creds.token:
+                    creds = None
+            if creds is None and interactive:
+                creds = self._authorise_interactively()
+            if creds is None:
+                self._creds = None
+                if not self._token_file.exists():
+                    raise GoogleAuthError("Google credentials not configured (token.json missing).")
+                raise GoogleAuthError("Google token expired and cannot be refreshed without re-authorising.")
+            self._creds = creds
+            return creds
+
+    # ------------------------------------------------------------------
+    # Services
+    # ------------------------------------------------------------------
+
+    def service(self, name: str, version: str, credentials=None, builder: Callable[..., Any] | None = None):
+        """This thread's client for *name*/*version*, built on first use."""
+        creds = credentials if credentials is not None else self.credentials()
+        services = getattr(self._local, "services", None)
+        if services is None:
+            services = self._local.services = {}
+        cached = services.get((name, version))
+        if cached is not None and cached[0] is creds:
+            return cached[1]
+        service = (builder or self._builder)(name, version, credentials=creds)
+        services[(name, version)] = (creds, service)
+        with self._lock:
+            self._stats["builds"] += 1
+        return service
+
+    def gmail(self):
+        return self.service("gmail", "v1")
+
+    def calendar(self):
+        return self.service("calendar", "v3")
+
+    def invalidate(self) -> None:
+        """Forget the credentials; every thread rebuilds its clients next use."""
+        with self._lock:
+            self._creds = None
+            self._stats["invalidations"] += 1
+
+    def invalidate_on_auth_error(self, exc: BaseException) -> bool:
+        if is_auth_error(exc):
+            logger.warning("Google auth error, dropping cached credentials: %s", exc)
+            self.invalidate()
+            return True
+        return False
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_google_services() -> GoogleServiceCache:
+    """Return the shared service cache, creating it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = GoogleServiceCache()
+        return _cache
@@ -0,0 +1,69 @@
+"""Indexed Collection — id-keyed records with a monotonic id counter.
+
+Shared by the task store and the follow-up agent so that lookups, updates,
+deletes and id allocation are O(1) instead of scanning a list.
+"""
+
+from collections.abc import Iterable, Iterator
+
+
+def _numeric_id(record_id) -> int | None:
+    try:
+        return int(record_id)
+    except (TypeError, ValueError):
+        return None
+
+
+class IndexedCollection:
+    """Insertion-ordered ``{id: record}`` map plus a never-decreasing counter.
+
+    Ids are strings (as stored in the JSON files and returned by the API).
+    The counter starts one past the highest numeric id loaded and only
+    moves forward, so ids are never reissued within a process.
+    """
+
+    def __init__(self, records: Iterable[dict] = ()):
+        self._items: dict[str, dict] = {}
+        self._next_id = 1
+        for record in records:
+            self.add(record)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, record_id) -> bool:
+        return str(record_id) in self._items
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._items.values())
+
+    @property
+    def next_id(self) -> int:
+        return self._next_id
+
+    def allocate_id(self) -> str:
+        """Reserve and return the next id."""
+        record_id = self._next_id
+        self._next_id += 1
+        return str(record_id)
+
+    def add(self, record: dict) -> dict:
+        """Insert *record*, assigning an id if it has none. Returns the record."""
+        if record.get("id") is None:
+            record["id"] = self.allocate_id()
+        record_id = str(record["id"])
+        numeric = _numeric_id(record_id)
+        if numeric is not None and numeric >= self._next_id:
+            self._next_id = numeric + 1
+        self._items[record_id] = record
+        return record
+
+    def get(self, record_id) -> dict | None:
+        return self._items.get(str(record_id))
+
+    def remove(self, record_id) -> dict | None:
+        """Delete and return the record, or None if the id is unknown."""
+        return self._items.pop(str(record_id), None)
+
+    def to_list(self) -> list[dict]:
+        return list(self._items.values())
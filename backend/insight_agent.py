@@ -2,22 +2,39 @@
 
 Data sources:
   - Email Intelligence:  followups.json (follow-ups extracted from emails)
-  - Meeting Intelligence: knowledge_base.json (meeting summaries, actions, decisions)
+  - Meeting Intelligence: knowledge hub log (meeting summaries, actions, decisions)
   - Organizational Knowledge: ChromaDB via org-knowledge vector_store module
-  - Analytics:  tasks.json (completion rates, stale tasks)
+  - Analytics:  task store via journal_ai (completion rates, stale tasks)
                  + followups.json (overdue/pending analytics)
-                 + knowledge_base.json (meeting activity metrics)
+                 + knowledge hub log (meeting activity metrics)
+
+Results are materialized in an ``InsightStore``: each source is recomputed
+only when its inputs change, and each item is re-rendered only when the
+clock crosses one of its thresholds (age 24h/72h, a due date, the 2/7-day
+meeting windows). Stats come from the same snapshot.
 """
 import json
 import logging
 import sys
+import threading
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Any
 
+from backend.insight_store import (
+    InsightSource,
+    InsightStore,
+    InsightUnit,
+    file_fingerprint,
+    next_boundary,
+)
+
 logger = logging.getLogger("insight_agent")
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
+# ``modules.organization_knowledge`` is imported lazily from the project root
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 
 # ---------------------------------------------------------------------------
@@ -38,6 +55,17 @@ def _load_json(relative_path: str) -> list[dict]:
         return []
 
 
+def _load_meetings() -> list[dict]:
+    """Meeting entries from the knowledge hub (only those lines are parsed)."""
+    from backend.knowledge_hub import get_knowledge_log
+
+    try:
+        return get_knowledge_log().entries(entry_type="meeting")
+    except (OSError, ValueError) as exc:
+        logger.warning("Could not load knowledge hub entries: %s", exc)
+        return []
+
+
 def _parse_dt(iso_str: str, fallback: datetime) -> datetime:
     """Parse ISO datetime, ensure timezone-aware."""
     if not iso_str:
@@ -49,153 +77,185 @@ def _parse_dt(iso_str: str, fallback: datetime) -> datetime:
         return fallback
 
 
+# Age thresholds (hours) used by _priority_from_age
+MEDIUM_AGE_HOURS = 24
+HIGH_AGE_HOURS = 72
+# A pending task counts as stale once it is older than this (hours)
+STALE_TASK_HOURS = 1
+# Meeting windows (days): action items are urgent, next steps are current
+MEETING_ACTIONS_URGENT_DAYS = 2
+MEETING_NEXT_STEPS_CURRENT_DAYS = 7
+
+# Comparisons below use ``>`` on ages and due dates, so a status flips just
+# after the threshold instant
+_JUST_AFTER = timedelta(microseconds=1)
+
+
 def _priority_from_age(age_hours: float) -> str:
     """Derive priority based on age in hours."""
-    if age_hours > 72:
+    if age_hours > HIGH_AGE_HOURS:
         return "high"
-    if age_hours > 24:
+    if age_hours > MEDIUM_AGE_HOURS:
         return "medium"
     return "low"
 
 
-# ---------------------------------------------------------------------------
-# 1. Email Intelligence — from followups.json
-# ---------------------------------------------------------------------------
+def _age_boundaries(created_at: datetime, *hours: float) -> list[datetime]:
+    """Instants at which an item created at *created_at* crosses each age."""
+    return [created_at + timedelta(hours=h) + _JUST_AFTER for h in hours]
 
-def _get_email_insights() -> list[dict[str, Any]]:
-    """Insights derived from followups.json — real follow-ups from emails."""
-    insights: list[dict[str, Any]] = []
-    now = datetime.now(timezone.utc)
-    followups = _load_json("followups.json")
 
-    for fu in followups:
-        title = fu.get("title", "Untitled")
-        source = fu.get("source", "Email")
-        priority = fu.get("priority", "medium")
-        status = fu.get("status", "pending")
-        due_date = fu.get("due_date", "")
-        created_at = _parse_dt(fu.get("created_at", ""), now)
+def _due_datetime(due_date: str) -> datetime | None:
+    if not due_date:
+        return None
+    try:
+        return datetime.strptime(due_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    except (ValueError, TypeError):
+        return None
 
-        if status != "pending":
-            continue
 
-        overdue = False
-        if due_date:
-            try:
-                due_dt = datetime.strptime(due_date, "%Y-%m-%d").replace(
-                    tzinfo=timezone.utc
-                )
-                overdue = due_dt < now
-            except (ValueError, TypeError):
-                pass
-
-        if overdue:
-            insights.append({
-                "title": f"Overdue Follow-up: {title}",
-                "description": (
-                    f"Follow-up from {source} was due {due_date}. "
-                    f"Requires immediate attention."
-                ),
-                "source": "Email",
-                "priority": "high",
-                "detected_at": created_at.isoformat(),
-                "icon": "⚠️",
-            })
-        else:
-            age_hours = max(0.0, (now - created_at).total_seconds() / 3600)
-            effective_priority = (
-                _priority_from_age(age_hours) if priority == "medium" else priority
-            )
-            insights.append({
-                "title": f"Pending Follow-up: {title}",
-                "description": (
-                    f"Follow-up from {source}. "
-                    f"Created {int(age_hours)}h ago. "
-                    f"Due: {due_date or 'Not set'}."
-                ),
-                "source": "Email",
-                "priority": effective_priority,
-                "detected_at": created_at.isoformat(),
-                "icon": "📌",
-            })
+def _static(insights: list[dict[str, Any]]):
+    """Render function for insights that do not change with time."""
+    return lambda now: (insights, None)
 
-    return insights
+
+# ---------------------------------------------------------------------------
+# 1. Email Intelligence — from followups.json
+# ---------------------------------------------------------------------------
+
+def _render_followup(fu: dict, now: datetime) -> tuple[list[dict[str, Any]], datetime | None]:
+    """Insight for one pending follow-up, and when its status next changes."""
+    title = fu.get("title", "Untitled")
+    source = fu.get("source", "Email")
+    priority = fu.get("priority", "medium")
+    due_date = fu.get("due_date", "")
+    created_at = _parse_dt(fu.get("created_at", ""), now)
+    due_dt = _due_datetime(due_date)
+
+    if due_dt is not None and due_dt < now:
+        return [{
+            "title": f"Overdue Follow-up: {title}",
+            "description": (
+                f"Follow-up from {source} was due {due_date}. "
+                f"Requires immediate attention."
+            ),
+            "source": "Email",
+            "priority": "high",
+            "detected_at": created_at.isoformat(),
+            "icon": "⚠️",
+        }], None
+
+    age_hours = max(0.0, (now - created_at).total_seconds() / 3600)
+    effective_priority = (
+        _priority_from_age(age_hours) if priority == "medium" else priority
+    )
+    boundaries = [due_dt + _JUST_AFTER if due_dt else None]
+    if priority == "medium":
+        boundaries += _age_boundaries(created_at, MEDIUM_AGE_HOURS, HIGH_AGE_HOURS)
+    return [{
+        "title": f"Pending Follow-up: {title}",
+        "description": (
+            f"Follow-up from {source}. "
+            f"Created {int(age_hours)}h ago. "
+            f"Due: {due_date or 'Not set'}."
+        ),
+        "source": "Email",
+        "priority": effective_priority,
+        "detected_at": created_at.isoformat(),
+        "icon": "📌",
+    }], next_boundary(now, *boundaries)
+
+
+def _email_units(now: datetime) -> list[InsightUnit]:
+    """Units derived from followups.json — real follow-ups from emails."""
+    units = []
+    for n, fu in enumerate(_load_json("followups.json")):
+        if fu.get("status", "pending") != "pending":
+            continue
+        key = str(fu.get("id") or f"#{n}")
+        units.append(InsightUnit(key, lambda at, fu=fu: _render_followup(fu, at)))
+    return units
 
 
 # ---------------------------------------------------------------------------
-# 2. Meeting Intelligence — from knowledge_base.json
+# 2. Meeting Intelligence — from the knowledge hub
 # ---------------------------------------------------------------------------
 
-def _get_meeting_insights() -> list[dict[str, Any]]:
-    """Insights from knowledge_base.json meeting summaries."""
+def _render_meeting(entry: dict, now: datetime) -> tuple[list[dict[str, Any]], datetime | None]:
+    """Insights for one meeting summary, and when their priorities change."""
     insights: list[dict[str, Any]] = []
-    now = datetime.now(timezone.utc)
-    entries = _load_json("knowledge_base.json")
+    data = entry.get("data", {})
+    title = data.get("title", "Untitled")
+    summary = data.get("summary", "")
+    actions = data.get("actions", [])
+    decisions = data.get("decisions", [])
+    next_steps = data.get("next_steps", [])
+    date_iso = entry.get("date", "")
+    meeting_date = _parse_dt(date_iso, now)
+    age_days = (now - meeting_date).days
+    summary_prefix = f"{summary[:200]}{'...' if len(summary) > 200 else ''}"
+
+    if actions:
+        items = "; ".join(actions[:3])
+        if len(actions) > 3:
+            items += f" (+{len(actions) - 3} more)"
+        insights.append({
+            "title": f"Meeting Actions: {title}",
+            "description": f"{summary_prefix} Action items: {items}",
+            "source": "Meeting",
+            "priority": "high" if age_days < MEETING_ACTIONS_URGENT_DAYS else "medium",
+            "detected_at": date_iso or now.isoformat(),
+            "icon": "📋",
+        })
 
-    for entry in entries:
-        if entry.get("type") != "meeting":
-            continue
+    if decisions:
+        items = "; ".join(decisions[:2])
+        insights.append({
+            "title": f"Meeting Decisions: {title}",
+            "description": f"{summary_prefix} Decisions: {items}",
+            "source": "Meeting",
+            "priority": "medium",
+            "detected_at": date_iso or now.isoformat(),
+            "icon": "✅",
+        })
 
-        data = entry.get("data", {})
-        title = data.get("title", "Untitled")
-        summary = data.get("summary", "")
-        actions = data.get("actions", [])
-        decisions = data.get("decisions", [])
-        next_steps = data.get("next_steps", [])
-        date_iso = entry.get("date", "")
-        meeting_date = _parse_dt(date_iso, now)
-        age_days = (now - meeting_date).days
-        summary_prefix = f"{summary[:200]}{'...' if len(summary) > 200 else ''}"
-
-        if actions:
-            items = "; ".join(actions[:3])
-            if len(actions) > 3:
-                items += f" (+{len(actions) - 3} more)"
-            insights.append({
-                "title": f"Meeting Actions: {title}",
-                "description": f"{summary_prefix} Action items: {items}",
-                "source": "Meeting",
-                "priority": "high" if age_days < 2 else "medium",
-                "detected_at": date_iso or now.isoformat(),
-                "icon": "📋",
-            })
+    if next_steps:
+        items = "; ".join(next_steps[:2])
+        insights.append({
+            "title": f"Meeting Next Steps: {title}",
+            "description": f"Next steps: {items}",
+            "source": "Meeting",
+            "priority": "medium" if age_days < MEETING_NEXT_STEPS_CURRENT_DAYS else "low",
+            "detected_at": date_iso or now.isoformat(),
+            "icon": "➡️",
+        })
 
-        if decisions:
-            items = "; ".join(decisions[:2])
-            insights.append({
-                "title": f"Meeting Decisions: {title}",
-                "description": f"{summary_prefix} Decisions: {items}",
-                "source": "Meeting",
-                "priority": "medium",
-                "detected_at": date_iso or now.isoformat(),
-                "icon": "✅",
-            })
+    # ``timedelta.days`` floors, so each window closes exactly N days later
+    return insights, next_boundary(
+        now,
+        meeting_date + timedelta(days=MEETING_ACTIONS_URGENT_DAYS) if actions else None,
+        meeting_date + timedelta(days=MEETING_NEXT_STEPS_CURRENT_DAYS) if next_steps else None,
+    )
 
-        if next_steps:
-            items = "; ".join(next_steps[:2])
-            insights.append({
-                "title": f"Meeting Next Steps: {title}",
-                "description": f"Next steps: {items}",
-                "source": "Meeting",
-                "priority": "medium" if age_days < 7 else "low",
-                "detected_at": date_iso or now.isoformat(),
-                "icon": "➡️",
-            })
 
-    return insights
+def _meeting_units(now: datetime) -> list[InsightUnit]:
+    """Units from knowledge hub meeting summaries, one per meeting."""
+    return [
+        InsightUnit(f"{entry.get('date', '')}#{n}", lambda at, e=entry: _render_meeting(e, at))
+        for n, entry in enumerate(_load_meetings())
+        if entry.get("type") == "meeting"
+    ]
 
 
 # ---------------------------------------------------------------------------
 # 3. Organizational Knowledge — from ChromaDB
 # ---------------------------------------------------------------------------
 
-def _get_knowledge_insights() -> list[dict[str, Any]]:
+def _knowledge_units(now: datetime) -> list[InsightUnit]:
     """Insights from Organization Knowledge ChromaDB vector store."""
     insights: list[dict[str, Any]] = []
-    now = datetime.now(timezone.utc)
 
     try:
-        sys.path.insert(0, str(PROJECT_ROOT))
         from modules.organization_knowledge.vector_store import (
             get_collection_count,
             get_stored_document_names,
@@ -234,155 +294,263 @@ def _get_knowledge_insights() -> list[dict[str, Any]]:
     except Exception as exc:
         logger.warning("Failed to query org knowledge: %s", exc)
 
-    return insights
+    return [InsightUnit("documents", _static(insights))] if insights else []
 
 
 # ---------------------------------------------------------------------------
-# 4. Analytics — computed from tasks.json, followups.json, knowledge_base.json
+# 4. Analytics — computed from tasks, followups.json, knowledge hub
 # ---------------------------------------------------------------------------
 
-def _get_analytics_insights() -> list[dict[str, Any]]:
-    """Analytics computed from real task / follow-up / meeting data."""
+def _render_task_analytics(tasks: list[dict], now: datetime):
     insights: list[dict[str, Any]] = []
-    now = datetime.now(timezone.utc)
-
-    # --- Task analytics ---
-    tasks = _load_json("tasks.json")
     total_tasks = len(tasks)
     done_tasks = sum(1 for t in tasks if t.get("done"))
     pending_tasks = total_tasks - done_tasks
+    if total_tasks == 0:
+        return insights, None
+
+    completion_rate = round((done_tasks / total_tasks) * 100, 1)
+    insights.append({
+        "title": f"Task Completion: {done_tasks}/{total_tasks} ({completion_rate}%)",
+        "description": (
+            f"{pending_tasks} pending, {done_tasks} completed. "
+            f"{'On track!' if completion_rate > 50 else 'Focus on clearing pending tasks.'}"
+        ),
+        "source": "Analytics",
+        "priority": "medium" if completion_rate < 50 else "low",
+        "detected_at": now.isoformat(),
+        "icon": "📊",
+    })
+
+    pending = [t for t in tasks if not t.get("done")]
+    if not pending:
+        return insights, None
+    oldest = min(
+        pending,
+        key=lambda t: _parse_dt(t.get("created_at", ""), now),
+    )
+    oldest_created = _parse_dt(oldest.get("created_at", ""), now)
+    age_hours = max(0.0, (now - oldest_created).total_seconds() / 3600)
 
-    if total_tasks > 0:
-        completion_rate = round((done_tasks / total_tasks) * 100, 1)
+    if age_hours > STALE_TASK_HOURS:
         insights.append({
-            "title": f"Task Completion: {done_tasks}/{total_tasks} ({completion_rate}%)",
+            "title": f"Stale Task: '{oldest.get('title', 'untitled')}'",
             "description": (
-                f"{pending_tasks} pending, {done_tasks} completed. "
-                f"{'On track!' if completion_rate > 50 else 'Focus on clearing pending tasks.'}"
+                f"Pending for {int(age_hours)}h ({age_hours/24:.1f}d). "
+                f"{'Consider breaking it down.' if age_hours > HIGH_AGE_HOURS else 'Review if still relevant.'}"
             ),
             "source": "Analytics",
-            "priority": "medium" if completion_rate < 50 else "low",
-            "detected_at": now.isoformat(),
-            "icon": "📊",
+            "priority": _priority_from_age(age_hours),
+            "detected_at": oldest_created.isoformat(),
+            "icon": "⏰",
         })
+    return insights, next_boundary(
+        now, *_age_boundaries(oldest_created, STALE_TASK_HOURS, MEDIUM_AGE_HOURS, HIGH_AGE_HOURS)
+    )
 
-        pending = [t for t in tasks if not t.get("done")]
-        if pending:
-            oldest = min(
-                pending,
-                key=lambda t: _parse_dt(t.get("created_at", ""), now),
-            )
-            oldest_created = _parse_dt(oldest.get("created_at", ""), now)
-            age_hours = max(0.0, (now - oldest_created).total_seconds() / 3600)
-
-            if age_hours > 1:
-                insights.append({
-                    "title": f"Stale Task: '{oldest.get('title', 'untitled')}'",
-                    "description": (
-                        f"Pending for {int(age_hours)}h ({age_hours/24:.1f}d). "
-                        f"{'Consider breaking it down.' if age_hours > 72 else 'Review if still relevant.'}"
-                    ),
-                    "source": "Analytics",
-                    "priority": _priority_from_age(age_hours),
-                    "detected_at": oldest_created.isoformat(),
-                    "icon": "⏰",
-                })
 
-    # --- Follow-up analytics ---
-    followups = _load_json("followups.json")
+def _render_followup_analytics(followups: list[dict], now: datetime):
     total_fu = len(followups)
+    if total_fu == 0:
+        return [], None
     pending_fu = sum(1 for f in followups if f.get("status") == "pending")
-    overdue_fu = 0
-    for f in followups:
-        due = f.get("due_date", "")
-        if due and f.get("status") == "pending":
-            try:
-                due_dt = datetime.strptime(due, "%Y-%m-%d").replace(
-                    tzinfo=timezone.utc
-                )
-                if due_dt < now:
-                    overdue_fu += 1
-            except (ValueError, TypeError):
-                pass
-
-    if total_fu > 0:
-        insights.append({
-            "title": (
-                f"Follow-ups: {pending_fu} Pending"
-                f"{', ' + str(overdue_fu) + ' Overdue' if overdue_fu else ''}"
-            ),
-            "description": (
-                f"{total_fu} total, {pending_fu} pending"
-                f"{', ' + str(overdue_fu) + ' overdue' if overdue_fu else ''}. "
-                f"{'Action needed!' if overdue_fu else 'All up to date.'}"
-            ),
-            "source": "Analytics",
-            "priority": "high" if overdue_fu > 0 else "low",
-            "detected_at": now.isoformat(),
-            "icon": "📊",
-        })
-
-    # --- Meeting analytics ---
-    meetings = _load_json("knowledge_base.json")
+    due_dates = [
+        due for f in followups
+        if f.get("status") == "pending" and (due := _due_datetime(f.get("due_date", ""))) is not None
+    ]
+    overdue_fu = sum(1 for due in due_dates if due < now)
+
+    return [{
+        "title": (
+            f"Follow-ups: {pending_fu} Pending"
+            f"{', ' + str(overdue_fu) + ' Overdue' if overdue_fu else ''}"
+        ),
+        "description": (
+            f"{total_fu} total, {pending_fu} pending"
+            f"{', ' + str(overdue_fu) + ' overdue' if overdue_fu else ''}. "
+            f"{'Action needed!' if overdue_fu else 'All up to date.'}"
+        ),
+        "source": "Analytics",
+        "priority": "high" if overdue_fu > 0 else "low",
+        "detected_at": now.isoformat(),
+        "icon": "📊",
+    }], next_boundary(now, *(due + _JUST_AFTER for due in due_dates))
+
+
+def _meeting_analytics(meetings: list[dict], now: datetime) -> list[dict[str, Any]]:
     meeting_count = sum(1 for e in meetings if e.get("type") == "meeting")
-    if meeting_count > 0:
-        total_actions = sum(
-            len(e.get("data", {}).get("actions", []))
-            for e in meetings if e.get("type") == "meeting"
-        )
-        insights.append({
-            "title": f"Meeting Activity: {meeting_count} Meeting(s)",
-            "description": (
-                f"{meeting_count} meeting(s) analyzed with {total_actions} action item(s). "
-                f"Review pending actions to stay on track."
-            ),
-            "source": "Analytics",
-            "priority": "low",
-            "detected_at": now.isoformat(),
-            "icon": "📊",
-        })
+    if meeting_count == 0:
+        return []
+    total_actions = sum(
+        len(e.get("data", {}).get("actions", []))
+        for e in meetings if e.get("type") == "meeting"
+    )
+    return [{
+        "title": f"Meeting Activity: {meeting_count} Meeting(s)",
+        "description": (
+            f"{meeting_count} meeting(s) analyzed with {total_actions} action item(s). "
+            f"Review pending actions to stay on track."
+        ),
+        "source": "Analytics",
+        "priority": "low",
+        "detected_at": now.isoformat(),
+        "icon": "📊",
+    }]
+
+
+def _analytics_units(now: datetime) -> list[InsightUnit]:
+    """Analytics computed from real task / follow-up / meeting data."""
+    from backend.journal_ai import get_tasks
 
-    return insights
+    tasks = get_tasks()
+    followups = _load_json("followups.json")
+    meetings = _load_meetings()
+    return [
+        InsightUnit("tasks", lambda at: _render_task_analytics(tasks, at)),
+        InsightUnit("followups", lambda at: _render_followup_analytics(followups, at)),
+        InsightUnit("meetings", _static(_meeting_analytics(meetings, now))),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Materialized store — each source recomputes only when its inputs change
+# ---------------------------------------------------------------------------
+
+def _followups_fingerprint():
+    return file_fingerprint(PROJECT_ROOT / "followups.json")
+
+
+def _meetings_fingerprint():
+    from backend.knowledge_hub import get_knowledge_log
+
+    return get_knowledge_log().version
+
+
+def _tasks_fingerprint():
+    from backend.journal_ai import task_version
+
+    return task_version()
+
+
+def _org_knowledge_fingerprint():
+    try:
+        from modules.organization_knowledge.config import get_settings
+    except ImportError:
+        return None
+    return file_fingerprint(Path(get_settings().chroma_db_path) / "chroma.sqlite3")
+
+
+def _analytics_fingerprint():
+    return (_tasks_fingerprint(), _followups_fingerprint(), _meetings_fingerprint())
+
+
+_store: InsightStore | None = None
+
+
+def get_insight_store() -> InsightStore:
+    global _store
+    if _store is None:
+        _store = InsightStore([
+            InsightSource("email", _followups_fingerprint, _email_units),
+            InsightSource("meeting", _meetings_fingerprint, _meeting_units),
+            InsightSource("knowledge", _org_knowledge_fingerprint, _knowledge_units),
+            InsightSource("analytics", _analytics_fingerprint, _analytics_units),
+        ])
+    return _store
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def get_all_insights() -> list[dict[str, Any]]:
-    """Return all insights from real data sources. No mock data."""
-    insights: list[dict[str, Any]] = []
+def get_insights_snapshot() -> dict[str, Any]:
+    """Return ``{"insights", "stats"}`` from one consistent snapshot."""
+    return get_insight_store().snapshot()
 
-    insights.extend(_get_email_insights())
-    insights.extend(_get_meeting_insights())
-    insights.extend(_get_knowledge_insights())
-    insights.extend(_get_analytics_insights())
-
-    # Sort: high priority first, then by detected_at descending
-    priority_order = {"high": 0, "medium": 1, "low": 2}
-    insights.sort(
-        key=lambda x: (
-            priority_order.get(x.get("priority", "low"), 2),
-            x.get("detected_at", ""),
-        )
-    )
 
-    return insights
+def get_all_insights() -> list[dict[str, Any]]:
+    """Return all insights from real data sources. No mock data."""
+    return get_insights_snapshot()["insights"]
 
 
 def get_insight_stats() -> dict[str, int]:
     """Calculate summary statistics for the UI top cards."""
-    insights = get_all_insights()
-    total = len(insights)
-    high_priority = sum(1 for i in insights if i.get("priority") == "high")
-    action_required = sum(
-        1 for i in insights if i.get("priority") in ("high", "medium")
-    )
-    informational = sum(1 for i in insights if i.get("priority") == "low")
-
-    return {
-        "total": total,
-        "high_priority": high_priority,
-        "action_required": action_required,
-        "informational": informational,
-    }
+    return get_insights_snapshot()["stats"]
+
+
+# ---------------------------------------------------------------------------
+# Change feed — insight deltas on the event bus
+# ---------------------------------------------------------------------------
+
+# Upper bound on how long the watcher sleeps, to notice inputs changed by
+# other processes (followups.json, the Chroma store) without an event
+INSIGHT_WATCH_MAX_WAIT = 60.0
+
+
+class InsightPublisher:
+    """Diffs successive snapshots by insight id and publishes the deltas."""
+
+    def __init__(self, store: InsightStore, publish):
+        self._store = store
+        self._publish = publish
+        self._published: dict[str, dict[str, Any]] | None = None
+
+    def publish_changes(self) -> int:
+        """Publish ``insight.added/changed/removed``; returns how many.
+
+        The first call only records a baseline — clients load the full list
+        from ``/insights`` and then apply deltas.
+        """
+        snapshot = self._store.snapshot()
+        current = {i["id"]: i for i in snapshot["insights"]}
+        previous, self._published = self._published, current
+        if previous is None:
+            return 0
+        changes = 0
+        for key, insight in current.items():
+            if key not in previous:
+                self._publish("insight.added", {"insight": insight})
+                changes += 1
+            elif previous[key] != insight:
+                self._publish("insight.changed", {"insight": insight})
+                changes += 1
+        for key in previous.keys() - current.keys():
+            self._publish("insight.removed", {"id": key})
+            changes += 1
+        if changes:
+            self._publish("insight.stats", {"stats": snapshot["stats"]})
+        return changes
+
+
+def start_insight_watcher(bus=None, stop: threading.Event | None = None) -> threading.Thread:
+    """Publish insight deltas whenever a source changes or a boundary passes.
+
+    Wakes on any non-insight event from *bus* (task, follow-up, knowledge
+    changes), or when the store's next time boundary arrives.
+    """
+    from backend.event_bus import get_event_bus
+
+    bus = bus or get_event_bus()
+    stop = stop or threading.Event()
+    wake = threading.Event()
+    bus.add_listener(lambda event: None if event.topic.startswith("insight.") else wake.set())
+    store = get_insight_store()
+    publisher = InsightPublisher(store, bus.publish)
+
+    def _run():
+        while not stop.is_set():
+            try:
+                publisher.publish_changes()
+            except Exception as exc:
+                logger.warning("Insight watcher failed: %s", exc)
+            timeout = INSIGHT_WATCH_MAX_WAIT
+            boundary = store.next_refresh_at()
+            if boundary is not None:
+                until = (boundary - datetime.now(timezone.utc)).total_seconds()
+                timeout = min(timeout, max(0.0, until))
+            wake.wait(timeout)
+            wake.clear()
+
+    thread = threading.Thread(target=_run, name="insight-watcher", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,183 @@
+"""Insight Store — materialized insights with change and time-boundary tracking.
+
+Each insight source (follow-ups, meetings, org knowledge, analytics) has a
+cheap fingerprint — file mtime/size, task-store version, knowledge-log
+version — and a ``compute(now)`` that turns its inputs into *units*: one
+input record plus a pure ``render(now)`` that returns the record's
+insights and the next instant at which they would render differently
+(a priority threshold, a due date passing, a meeting window closing).
+
+``snapshot()`` recomputes a source only when its fingerprint changed, and
+otherwise re-renders just the units whose boundary has been reached,
+found with a min-heap. The merged, sorted list plus stats is served from
+memory. The clock is injectable so tests can drive time.
+"""
+
+import heapq
+import logging
+import threading
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("insight_store")
+
+PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+Render = Callable[[datetime], tuple[list[dict[str, Any]], datetime | None]]
+
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def file_fingerprint(path: Path) -> tuple | None:
+    """``(mtime_ns, size)`` of *path*, or None if it does not exist."""
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def next_boundary(now: datetime, *candidates: datetime | None) -> datetime | None:
+    """The earliest candidate strictly after *now*, or None."""
+    future = [c for c in candidates if c is not None and c > now]
+    return min(future) if future else None
+
+
+@dataclass
+class InsightUnit:
+    """One input record and the pure function that renders it at a time."""
+
+    key: str
+    render: Render
+
+
+@dataclass
+class InsightSource:
+    name: str
+    fingerprint: Callable[[], Hashable]
+    compute: Callable[[datetime], list[InsightUnit]]
+
+
+@dataclass
+class _Materialized:
+    fingerprint: Hashable = None
+    computed: bool = False
+    generation: int = 0
+    units: dict[str, InsightUnit] = field(default_factory=dict)
+    insights: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+
+
+def summarize(insights: list[dict[str, Any]]) -> dict[str, int]:
+    """Stats for the UI top cards, in one pass."""
+    stats = {"total": 0, "high_priority": 0, "action_required": 0, "informational": 0}
+    for insight in insights:
+        priority = insight.get("priority")
+        stats["total"] += 1
+        if priority == "high":
+            stats["high_priority"] += 1
+        if priority in ("high", "medium"):
+            stats["action_required"] += 1
+        if priority == "low":
+            stats["informational"] += 1
+    return stats
+
+
+class InsightStore:
+    """Materialized insights for a fixed set of sources.
+
+    ``_schedule`` is a heap of ``(boundary, source, generation, unit_key)``;
+    entries from an older generation of a source (before it was fully
+    recomputed) are discarded when popped.
+    """
+
+    def __init__(self, sources: list[InsightSource], clock: Callable[[], datetime] = utc_now):
+        self._sources = {source.name: source for source in sources}
+        self._clock = clock
+        self._state = {name: _Materialized() for name in self._sources}
+        self._schedule: list[tuple[datetime, str, int, str]] = []
+        self._snapshot: dict[str, Any] | None = None
+        self._lock = threading.Lock()
+
+    def _render(self, name: str, unit: InsightUnit, now: datetime) -> None:
+        state = self._state[name]
+        insights, boundary = unit.render(now)
+        keyed = []
+        for n, insight in enumerate(insights):
+            suffix = f"#{n + 1}" if n else ""
+            keyed.append({**insight, "id": f"{name}:{unit.key}{suffix}"})
+        state.insights[unit.key] = keyed
+        if boundary is not None:
+            heapq.heappush(self._schedule, (boundary, name, state.generation, unit.key))
+
+    def _recompute(self, name: str, fingerprint: Hashable, now: datetime) -> None:
+        source, state = self._sources[name], self._state[name]
+        try:
+            units = source.compute(now)
+        except Exception as exc:
+            logger.warning("Insight source %s failed: %s", name, exc)
+            return
+        state.fingerprint, state.computed = fingerprint, True
+        state.generation += 1
+        state.units = {unit.key: unit for unit in units}
+        state.insights = {}
+        for unit in units:
+            self._render(name, unit, now)
+
+    def refresh(self) -> list[str]:
+        """Bring every source up to date.
+
+        Returns what was redone: source names that were recomputed, and
+        ``source:unit`` keys that were re-rendered at a time boundary.
+        """
+        changed = []
+        with self._lock:
+            now = self._clock()
+            for name, source in self._sources.items():
+                state = self._state[name]
+                fingerprint = source.fingerprint()
+                if not state.computed or fingerprint != state.fingerprint:
+                    self._recompute(name, fingerprint, now)
+                    changed.append(name)
+            while self._schedule and self._schedule[0][0] <= now:
+                _boundary, name, generation, key = heapq.heappop(self._schedule)
+                state = self._state[name]
+                if generation != state.generation or key not in state.units:
+                    continue
+                self._render(name, state.units[key], now)
+                changed.append(f"{name}:{key}")
+            if changed or self._snapshot is None:
+                self._snapshot = self._build_snapshot()
+        return changed
+
+    def next_refresh_at(self) -> datetime | None:
+        """The next instant at which some insight changes with time alone."""
+        with self._lock:
+            while self._schedule:
+                _boundary, name, generation, key = self._schedule[0]
+                if generation == self._state[name].generation and key in self._state[name].units:
+                    return self._schedule[0][0]
+                heapq.heappop(self._schedule)
+            return None
+
+    def _build_snapshot(self) -> dict[str, Any]:
+        insights = [
+            insight
+            for state in self._state.values()
+            for rendered in state.insights.values()
+            for insight in rendered
+        ]
+        # High priority first, then by detected_at
+        insights.sort(
+            key=lambda x: (PRIORITY_ORDER.get(x.get("priority", "low"), 2), x.get("detected_at", ""))
+        )
+        return {"insights": insights, "stats": summarize(insights)}
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return ``{"insights", "stats"}``, refreshing what is stale first."""
+        self.refresh()
+        return self._snapshot
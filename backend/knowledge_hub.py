@@ -1,16 +1,446 @@
+"""Knowledge Hub — append-only log of meeting summaries and other entries.
+
+Entries live in ``knowledge_base.jsonl`` (one JSON object per line) at the
+project root. Storing an entry is a single append, never a rewrite. A
+compact index (``knowledge_base.idx.json``) records each entry's byte
+offset, length, date, type, source and key, so readers can tail recent
+entries or seek by date/type without parsing the whole log.
+
+- Lines appended by another process are picked up by scanning only the
+  bytes past the indexed end.
+- Entries with a ``key`` supersede older entries with the same key;
+  compaction rewrites the log without superseded or torn lines. Appends
+  and compaction hold an exclusive ``flock`` on ``knowledge_base.jsonl.lock``,
+  so a line another process appends can't land in the file being replaced;
+  readers hold it shared, so compaction can't move lines they are seeking.
+- An existing ``knowledge_base.json`` is imported once on first use and
+  renamed to ``knowledge_base.json.migrated``.
+- Observers (e.g. the full-text search index) are told about every entry
+  added or superseded, so derived indexes stay current without re-reading.
+- Each entry carries a precomputed ``view`` (source label, display title,
+  summary) so readers only project it; ``--backfill-views`` adds it to
+  entries written before views existed.
+
+Usage:
+    python -m backend.knowledge_hub --backfill-views
+    python -m backend.knowledge_hub --compact
+"""
+
+import argparse
 import json
+import os
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from bisect import bisect_left
 from datetime import datetime
+from pathlib import Path
 
-DB_FILE = "knowledge_base.json"
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, single writer assumed
+    fcntl = None
 
+from backend.event_bus import publish
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+LOG_FILE = PROJECT_ROOT / "knowledge_base.jsonl"
+INDEX_FILE = PROJECT_ROOT / "knowledge_base.idx.json"
+LEGACY_FILE = PROJECT_ROOT / "knowledge_base.json"
+
+# Persist the index after this many appends (the tail scan covers the rest)
+INDEX_FLUSH_EVERY = 25
+# Compact once dead lines exceed this count and half the live entries
+COMPACT_MIN_DEAD = 100
+
+# Raw source / type (lower-cased) -> display label
+SOURCE_LABELS = {
+    "meeting": "Meeting Intelligence",
+    "meeting intelligence": "Meeting Intelligence",
+    "pipeline": "Meeting Pipeline",
+    "meeting pipeline": "Meeting Pipeline",
+    "research": "Research Copilot",
+    "research copilot": "Research Copilot",
+    "journal": "Journal AI",
+    "journal ai": "Journal AI",
+    "live transcript": "Live Transcript",
+    "live transcription": "Live Transcript",
+}
+
+# Index record fields, stored as lists to keep the index file small
+_OFFSET, _LENGTH, _DATE, _TYPE, _SOURCE, _KEY = range(6)
+
+
+def normalize_entry(entry: dict) -> dict:
+    """Build the display view of an entry: type, source label, title, summary."""
+    raw = {k: v for k, v in entry.items() if k != "view"}
+    data = raw.get("data") if isinstance(raw.get("data"), dict) else {}
+
+    raw_source = str(raw.get("source") or raw.get("type", "Knowledge Hub"))
+    source = SOURCE_LABELS.get(raw_source.lower(), raw_source.title())
+
+    # Placeholder titles/summaries come from the summarizer's JSON template
+    title = data.get("title") or raw.get("title") or ""
+    if not title or title.strip().lower() == "short meeting title":
+        snippet = (data.get("summary") or "").strip()
+        if snippet and snippet.lower() != "short summary":
+            title = snippet.split(".")[0][:60]
+        else:
+            title = f"{source} Entry"
+
+    return {
+        "type": raw.get("type", "entry"),
+        "source": source,
+        "title": title,
+        "summary": data.get("summary") or json.dumps(data or raw, ensure_ascii=False),
+    }
+
+
+def _index_record(offset: int, length: int, entry: dict) -> list:
+    return [
+        offset,
+        length,
+        str(entry.get("date") or ""),
+        entry.get("type"),
+        entry.get("source"),
+        entry.get("key"),
+    ]
 
-def store_meeting(meeting_data, source="Meeting Intelligence"):
 
+def _record_date(record: list) -> str:
+    return record[_DATE]
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
     try:
-        with open(DB_FILE, "r") as f:
-            data = json.load(f)
-    except:
-        data = []
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class KnowledgeLog:
+    """Append-only JSON-lines log with an offset index.
+
+    ``_records`` holds the index record of every live entry in log order;
+    ``_size`` is the log length the index covers. Reads open the log and
+    seek straight to the wanted lines.
+    """
+
+    def __init__(
+        self,
+        log_path: Path = LOG_FILE,
+        index_path: Path = INDEX_FILE,
+        legacy_path: Path | None = LEGACY_FILE,
+    ):
+        self.log_path = Path(log_path)
+        self.index_path = Path(index_path)
+        self.legacy_path = Path(legacy_path) if legacy_path else None
+        self.lock_path = self.log_path.with_name(self.log_path.name + ".lock")
+        self._lock = threading.RLock()
+        self._observers = []
+        self._unflushed = 0
+        self._flocked = False
+        self._reset()
+        with self._lock, self._file_lock():
+            self._migrate_legacy_json()
+            self._load_index()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _migrate_legacy_json(self) -> None:
+        if not self.legacy_path or not self.legacy_path.exists() or self.log_path.exists():
+            return
+        try:
+            entries = json.loads(self.legacy_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            entries = []
+        lines = [json.dumps(e, ensure_ascii=False) + "\n" for e in entries if isinstance(e, dict)]
+        _atomic_write(self.log_path, "".join(lines).encode("utf-8"))
+        self.legacy_path.rename(self.legacy_path.with_name(self.legacy_path.name + ".migrated"))
+
+    def _load_index(self) -> None:
+        try:
+            saved = json.loads(self.index_path.read_text(encoding="utf-8"))
+            records, size, dead = saved["entries"], saved["log_size"], saved.get("dead", 0)
+            if saved.get("inode") != self.log_path.stat().st_ino:
+                raise KeyError("inode")
+        except (OSError, json.JSONDecodeError, KeyError, TypeError):
+            # Missing, unreadable or describing a different log — full scan
+            records, size, dead = [], 0, 0
+        self._reset()
+        for record in records:
+            self._track(record)
+        self._size, self._dead = size, dead
+        self._catch_up()
+
+    def _reset(self) -> None:
+        self._records, self._by_key = [], {}
+        self._size = self._dead = 0
+        self._inode = None
+        self._dates_sorted = True
+        for observer in self._observers:
+            observer.reset()
+
+    def _catch_up(self) -> None:
+        """Index lines appended past ``_size`` (by us before a crash, or by
+        another process). A torn last line is left for the next call.
+
+        If the log was replaced (compacted elsewhere) or truncated, the
+        index is rebuilt with a full scan.
+        """
+        try:
+            stat = self.log_path.stat()
+        except FileNotFoundError:
+            if self._size:
+                self._reset()
+            return
+        replaced = self._inode is not None and stat.st_ino != self._inode
+        if replaced or stat.st_size < self._size:
+            self._reset()
+        self._inode = stat.st_ino
+        if stat.st_size == self._size:
+            return
+        with open(self.log_path, "rb") as f:
+            f.seek(self._size)
+            offset = self._size
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    self._dead += 1
+                else:
+                    self._track(_index_record(offset, len(line), entry), entry)
+                offset += len(line)
+                self._unflushed += 1
+            self._size = offset
+
+    def _track(self, record: list, entry: dict | None = None) -> None:
+        key = record[_KEY]
+        if key is not None:
+            previous = self._by_key.get(key)
+            if previous is not None:
+                self._records.remove(previous)
+                self._dead += 1
+                for observer in self._observers:
+                    observer.removed(previous)
+            self._by_key[key] = record
+        if self._records and record[_DATE] < self._records[-1][_DATE]:
+            self._dates_sorted = False
+        self._records.append(record)
+        if entry is not None:
+            for observer in self._observers:
+                observer.added(record, entry)
+
+    def add_observer(self, observer) -> None:
+        """Register *observer* and replay every live entry to it.
+
+        Observers implement ``reset()``, ``added(record, entry)`` and
+        ``removed(record)``; all calls happen under the log lock. Index
+        records are updated in place by compaction, so observers may keep
+        them as handles and pass them back to ``read``.
+        """
+        with self._lock, self._file_lock(shared=True):
+            self._catch_up()
+            self._observers.append(observer)
+            observer.reset()
+            for record, entry in zip(self._records, self._read(self._records)):
+                observer.added(record, entry)
+
+    @contextmanager
+    def _file_lock(self, shared: bool = False):
+        """Inter-process lock on the log; caller holds ``_lock``.
+
+        Writers take it exclusive, readers shared. Nested calls run under
+        the outer lock (re-locking through a new fd could deadlock).
+        """
+        if fcntl is None or self._flocked:
+            yield
+            return
+        fd = os.open(self.lock_path, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            self._flocked = True
+            yield
+        finally:
+            self._flocked = False
+            os.close(fd)   # releases the lock
+
+    def _flush_index(self) -> None:
+        payload = {
+            "inode": self._inode,
+            "log_size": self._size,
+            "dead": self._dead,
+            "entries": self._records,
+        }
+        _atomic_write(self.index_path, json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+        self._unflushed = 0
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, entry: dict) -> dict:
+        """Append *entry* as one line and index it. Returns the entry."""
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            with self._file_lock():
+                self._catch_up()
+                # O_APPEND makes the single write land at the current end
+                # even if another process appended meanwhile
+                fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    # Bytes past the indexed end are a torn line from a
+                    # crashed writer; end it so ours starts on its own line
+                    if os.fstat(fd).st_size > self._size:
+                        line = b"\n" + line
+                    os.write(fd, line)
+                finally:
+                    os.close(fd)
+                self._catch_up()
+            if self._unflushed >= INDEX_FLUSH_EVERY:
+                self._flush_index()
+            if self._dead >= COMPACT_MIN_DEAD and self._dead > len(self._records) // 2:
+                self.compact()
+        return entry
+
+    def compact(self, transform=None) -> dict:
+        """Rewrite the log with only live entries; returns before/after sizes.
+
+        *transform*, if given, maps each entry to the entry to write back.
+        It must not change the fields observers index (it is used to add
+        derived data such as views).
+        """
+        with self._lock, self._file_lock():
+            # Appends from other processes wait on the file lock, so the
+            # catch-up below sees every line the new file must carry over
+            self._catch_up()
+            before = self._size
+            with open(self.log_path, "rb") as f:
+                lines = [self._read_line(record, f) for record in self._records]
+            if transform is not None:
+                lines = [
+                    (json.dumps(transform(json.loads(line)), ensure_ascii=False) + "\n").encode("utf-8")
+                    for line in lines
+                ]
+            _atomic_write(self.log_path, b"".join(lines))
+            offset = 0
+            for record, line in zip(self._records, lines):
+                record[_OFFSET], record[_LENGTH] = offset, len(line)
+                offset += len(line)
+            self._inode = self.log_path.stat().st_ino
+            self._size, self._dead = offset, 0
+            self._flush_index()
+            return {"bytes_before": before, "bytes_after": offset, "entries": len(self._records)}
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _read_line(record: list, f) -> bytes:
+        f.seek(record[_OFFSET])
+        return f.read(record[_LENGTH])
+
+    def _read(self, records: list[list]) -> list[dict]:
+        if not records:
+            return []
+        with open(self.log_path, "rb") as f:
+            return [json.loads(self._read_line(r, f)) for r in records]
+
+    @property
+    def version(self) -> tuple:
+        """Changes whenever the log gains, loses or rewrites entries."""
+        with self._lock, self._file_lock(shared=True):
+            self._catch_up()
+            return (self._inode, self._size)
+
+    def __len__(self) -> int:
+        with self._lock, self._file_lock(shared=True):
+            self._catch_up()
+            return len(self._records)
+
+    def tail(self, limit: int) -> list[dict]:
+        """The *limit* most recent entries, oldest first."""
+        with self._lock, self._file_lock(shared=True):
+            self._catch_up()
+            return self._read(self._records[-limit:] if limit > 0 else [])
+
+    def entries(
+        self,
+        entry_type: str | None = None,
+        source: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> list[dict]:
+        """Entries matching the filters, oldest first.
+
+        Filtering happens on the index; only matching lines are parsed.
+        ``since``/``until`` compare against the entry's ``date`` string
+        (``until`` is exclusive), so ``"2026-05-01"`` works as a bound.
+        """
+        with self._lock, self._file_lock(shared=True):
+            self._catch_up()
+            records = self._records
+            if (since or until) and self._dates_sorted:
+                lo = bisect_left(records, since, key=_record_date) if since else 0
+                hi = bisect_left(records, until, key=_record_date) if until else len(records)
+                records = records[lo:hi]
+            elif since or until:
+                records = [
+                    r for r in records
+                    if (not since or r[_DATE] >= since) and (not until or r[_DATE] < until)
+                ]
+            if entry_type is not None:
+                records = [r for r in records if r[_TYPE] == entry_type]
+            if source is not None:
+                records = [r for r in records if r[_SOURCE] == source]
+            return self._read(records)
+
+    @contextmanager
+    def read_lock(self):
+        """Catch up with the log and hold its locks, so index records handed
+        to observers stay valid (no compaction, here or in another process)
+        until the block exits."""
+        with self._lock, self._file_lock(shared=True):
+            self._catch_up()
+            yield
+
+    def read(self, records: list[list]) -> list[dict]:
+        """Parse the entries for index *records* handed out to observers."""
+        with self._lock:
+            return self._read(records)
+
+_log = None
+_log_lock = threading.Lock()
+
+
+def get_knowledge_log() -> KnowledgeLog:
+    """Return the shared knowledge log, opening it on first use."""
+    global _log
+    with _log_lock:
+        if _log is None:
+            _log = KnowledgeLog()
+        return _log
+
+
+def store_entry(entry: dict) -> dict:
+    """Attach the precomputed view to *entry* and append it to the log."""
+    entry["view"] = normalize_entry(entry)
+    get_knowledge_log().append(entry)
+    publish("knowledge.added", {"date": entry.get("date"), "key": entry.get("key"), "view": entry["view"]})
+    return entry
+
+
+def store_meeting(meeting_data, source="Meeting Intelligence"):
 
     entry = {
         "type": "meeting",
@@ -19,9 +449,46 @@ def store_meeting(meeting_data, source="Meeting Intelligence"):
         "data": meeting_data
     }
 
-    data.append(entry)
-
-    with open(DB_FILE, "w") as f:
-        json.dump(data, f, indent=4)
+    store_entry(entry)
 
     print(f"✅ Meeting stored in Knowledge Hub (Source: {source})")
+
+
+def backfill_views(log: KnowledgeLog | None = None) -> dict:
+    """Add ``view`` to entries written before views existed (rewrites the log)."""
+    log = log or get_knowledge_log()
+    added = 0
+
+    def _with_view(entry: dict) -> dict:
+        nonlocal added
+        if "view" not in entry:
+            entry["view"] = normalize_entry(entry)
+            added += 1
+        return entry
+
+    result = log.compact(transform=_with_view)
+    return {**result, "views_added": added}
+
+
+# ===================================================================
+# CLI
+# ===================================================================
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Knowledge hub maintenance")
+    parser.add_argument("--backfill-views", action="store_true", help="add display views to legacy entries")
+    parser.add_argument("--compact", action="store_true", help="drop superseded and torn lines")
+    args = parser.parse_args(argv)
+
+    if args.backfill_views:
+        print(json.dumps(backfill_views()))
+    elif args.compact:
+        print(json.dumps(get_knowledge_log().compact()))
+    else:
+        parser.print_help()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""Knowledge Search — in-memory inverted index over knowledge hub entries.
+
+Indexes the title, summary, actions, decisions and next steps of each
+entry (plus ``content`` for journal entries) and ranks matches with BM25,
+weighting title hits above body hits. Every query term also matches words
+it is a prefix of, so partially typed queries work. The index subscribes
+to the knowledge log, so appends, superseded entries and compactions are
+reflected without re-reading the log; only the requested page of results
+is parsed from disk.
+"""
+
+import heapq
+import math
+import re
+import threading
+from bisect import bisect_left
+from collections import Counter
+
+from backend.knowledge_hub import KnowledgeLog, get_knowledge_log
+
+# Field -> weight applied to its term frequencies
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "summary": 1.0,
+    "actions": 1.0,
+    "decisions": 1.0,
+    "next_steps": 1.0,
+    "content": 1.0,
+}
+# Score multiplier for a prefix (non-exact) term match
+PREFIX_PENALTY = 0.8
+# Cap on vocabulary expansions per query term
+MAX_PREFIX_EXPANSIONS = 64
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _field_text(value) -> str:
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(v) for v in value)
+    return str(value) if value else ""
+
+
+def _entry_fields(entry: dict) -> dict[str, str]:
+    """The searchable fields of an entry (meeting data or top-level)."""
+    data = entry.get("data") if isinstance(entry.get("data"), dict) else {}
+    return {
+        field: _field_text(data.get(field) or entry.get(field))
+        for field in FIELD_WEIGHTS
+    }
+
+
+class KnowledgeSearchIndex:
+    """BM25 inverted index kept in step with a ``KnowledgeLog``.
+
+    Each live log record gets an integer doc id. ``_postings`` maps a term
+    to ``{doc_id: weighted term frequency}``; a sorted vocabulary (rebuilt
+    lazily when new terms appear) serves prefix expansion by bisection.
+    """
+
+    def __init__(self, log: KnowledgeLog):
+        self._log = log
+        self._lock = threading.Lock()
+        log.add_observer(self)
+
+    # ------------------------------------------------------------------
+    # Log observer callbacks (called under the log lock)
+    # ------------------------------------------------------------------
+
+    def reset(self) -> None:
+        with self._lock:
+            self._postings: dict[str, dict[int, float]] = {}
+            self._doc_terms: dict[int, tuple[str, ...]] = {}
+            self._doc_length: dict[int, float] = {}
+            self._records: dict[int, list] = {}
+            self._doc_of: dict[int, int] = {}
+            self._total_length = 0.0
+            self._next_doc = 0
+            self._vocabulary: list[str] = []
+            self._vocabulary_dirty = False
+
+    def added(self, record: list, entry: dict) -> None:
+        weights: Counter = Counter()
+        for field, text in _entry_fields(entry).items():
+            counts = Counter(tokenize(text))
+            if FIELD_WEIGHTS[field] != 1.0:
+                counts = Counter({t: n * FIELD_WEIGHTS[field] for t, n in counts.items()})
+            weights.update(counts)
+        with self._lock:
+            doc = self._next_doc
+            self._next_doc += 1
+            self._records[doc] = record
+            self._doc_of[id(record)] = doc
+            postings = self._postings
+            for term, weight in weights.items():
+                if term in postings:
+                    postings[term][doc] = weight
+                else:
+                    postings[term] = {doc: weight}
+                    self._vocabulary_dirty = True
+            self._doc_terms[doc] = tuple(weights)
+            self._doc_length[doc] = sum(weights.values())
+            self._total_length += self._doc_length[doc]
+
+    def removed(self, record: list) -> None:
+        with self._lock:
+            doc = self._doc_of.pop(id(record), None)
+            if doc is None:
+                return
+            del self._records[doc]
+            for term in self._doc_terms.pop(doc):
+                postings = self._postings[term]
+                postings.pop(doc, None)
+                if not postings:
+                    del self._postings[term]
+                    self._vocabulary_dirty = True
+            self._total_length -= self._doc_length.pop(doc)
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _expand(self, token: str) -> list[tuple[str, float]]:
+        """Vocabulary terms matching *token* exactly or by prefix."""
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        matches = []
+        start = bisect_left(self._vocabulary, token)
+        for term in self._vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not term.startswith(token):
+                break
+            matches.append((term, 1.0 if term == token else PREFIX_PENALTY))
+        return matches
+
+    def _score(self, tokens: list[str]) -> dict[int, float]:
+        """BM25 scores of the docs matching every token (AND semantics)."""
+        docs = len(self._records)
+        avg_length = self._total_length / docs if docs else 0.0
+        scores: dict[int, float] | None = None
+        for token in tokens:
+            token_scores: dict[int, float] = {}
+            for term, factor in self._expand(token):
+                postings = self._postings[term]
+                idf = math.log(1 + (docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc, tf in postings.items():
+                    if scores is not None and doc not in scores:
+                        continue
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_length[doc] / avg_length)
+                    value = factor * idf * tf * (BM25_K1 + 1) / (tf + norm)
+                    if value > token_scores.get(doc, 0.0):
+                        token_scores[doc] = value
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {doc: scores[doc] + value for doc, value in token_scores.items()}
+            if not scores:
+                return {}
+        return scores or {}
+
+    def search(self, query: str, limit: int = 20, offset: int = 0) -> dict:
+        """Return ``{"total", "entries"}`` for one page of ranked matches.
+
+        Equal scores go to the most recently added entry.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return {"total": 0, "entries": []}
+        with self._log.read_lock(), self._lock:
+            scores = self._score(tokens)
+            top = heapq.nlargest(offset + limit, scores.items(), key=lambda item: (item[1], item[0]))
+            records = [self._records[doc] for doc, _score in top[offset:]]
+            return {"total": len(scores), "entries": self._log.read(records)}
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_search_index() -> KnowledgeSearchIndex:
+    """Return the shared search index, building it from the log on first use."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = KnowledgeSearchIndex(get_knowledge_log())
+        return _index
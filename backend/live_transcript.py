@@ -3,19 +3,24 @@ Live Transcription Module
 
 Provides real-time audio transcription using Faster-Whisper with:
 - Singleton model (loaded once, reused for all requests)
+- Background warm-up so the API is ready before the model is
 - Local model directory (backend/models/whisper/) instead of HF cache
-- Auto-download and corruption detection/recovery
+- Auto-download and checksum-manifest corruption detection/recovery
 - Fallback to OpenAI Whisper if Faster-Whisper is unrecoverable
 - Detailed logging and exception handling
 """
 
+import hashlib
 import io
 import json
 import logging
+import math
 import os
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -40,12 +45,15 @@ if not logger.handlers:
 
 try:
     import numpy as np
+except ImportError:
+    np = None
+
+try:
     from faster_whisper import WhisperModel
 
-    FASTER_WHISPER_AVAILABLE = True
+    FASTER_WHISPER_AVAILABLE = np is not None
     logger.info("faster-whisper is available")
 except ImportError as e:
-    np = None
     WhisperModel = None
     FASTER_WHISPER_AVAILABLE = False
     logger.warning("faster-whisper not installed (%s)", e)
@@ -66,6 +74,11 @@ except ImportError:
     sf = None
     SOUNDFILE_AVAILABLE = False
 
+try:
+    from scipy.signal import resample_poly
+except ImportError:
+    resample_poly = None
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -77,6 +90,21 @@ MODELS_DIR = Path(__file__).resolve().parent / "models" / "whisper"
 MODEL_SIZE = "tiny"
 MODEL_SUBDIR = MODELS_DIR / MODEL_SIZE
 
+# Checksum manifest written next to the model files after a verified load
+MANIFEST_NAME = ".manifest.json"
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+# Half-length of the anti-alias filter used when scipy is not installed
+_LOWPASS_HALF_TAPS = 50
+
+# Seconds a client should wait before retrying while the model warms up
+WARMUP_RETRY_AFTER = 5
+
+# Segments above this no-speech probability *and* below this average log
+# probability are treated as silence and dropped (same rule Whisper uses)
+NO_SPEECH_PROB_THRESHOLD = 0.6
+LOGPROB_THRESHOLD = -1.0
+
 # HF repo for the given model size
 HF_REPO_IDS = {
     "tiny": "Systran/faster-whisper-tiny",
@@ -97,21 +125,137 @@ def _model_bin_path(model_dir: Path) -> Path:
     return model_dir / "model.bin"
 
 
+def _manifest_path(model_dir: Path) -> Path:
+    """Return the path to the checksum manifest inside a model directory."""
+    return model_dir / MANIFEST_NAME
+
+
+def _file_sha256(path: Path) -> str:
+    """Hash a file in fixed-size chunks so large models never sit in memory."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _is_lfs_pointer(path: Path) -> bool:
+    """True if *path* is a git-lfs pointer stub rather than real content."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(24).startswith(b"version https://git-lfs")
+    except OSError:
+        return False
+
+
+def _load_manifest(model_dir: Path) -> dict | None:
+    """Read the checksum manifest, or None if it is missing / unreadable."""
+    path = _manifest_path(model_dir)
+    if not path.exists():
+        return None
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError) as exc:
+        logger.warning("Ignoring unreadable manifest at %s: %s", path, exc)
+        return None
+    return manifest if isinstance(manifest.get("files"), dict) else None
+
+
+def _write_manifest(model_dir: Path, expected: dict[str, str] | None = None) -> dict:
+    """Hash every model file and record (size, mtime, sha256) per file.
+
+    If *expected* maps file names to upstream sha256 digests, each listed
+    file must match or a ``RuntimeError`` is raised and nothing is written.
+    """
+    files = {}
+    for path in sorted(model_dir.iterdir()):
+        if not path.is_file() or path.name.startswith("."):
+            continue
+        stat = path.stat()
+        digest = _file_sha256(path)
+        if expected and path.name in expected and expected[path.name] != digest:
+            raise RuntimeError(
+                f"Checksum mismatch for {path.name}: "
+                f"expected {expected[path.name]}, got {digest}"
+            )
+        files[path.name] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest,
+        }
+
+    manifest = {
+        "verified_upstream": sorted(expected or {}),
+        "files": files,
+    }
+    _manifest_path(model_dir).write_text(
+        json.dumps(manifest, indent=2), encoding="utf-8"
+    )
+    logger.info("Wrote checksum manifest for %d file(s) in %s", len(files), model_dir)
+    return manifest
+
+
 def _is_model_healthy(model_dir: Path) -> bool:
-    """Check whether model.bin exists and has reasonable size (> 10 MB)."""
+    """Verify the local model against its cached checksum manifest.
+
+    Files whose size and mtime still match the manifest are trusted without
+    being re-read, so a warm restart costs one ``stat`` per file. Only files
+    that were touched since the manifest was written are re-hashed.
+    """
     bin_path = _model_bin_path(model_dir)
     if not bin_path.exists():
         logger.warning("model.bin not found at %s", bin_path)
         return False
-    size_mb = bin_path.stat().st_size / (1024 * 1024)
-    if size_mb < 10:
+    if _is_lfs_pointer(bin_path):
+        logger.warning("model.bin at %s is a git-lfs pointer, not model data", bin_path)
+        return False
+
+    manifest = _load_manifest(model_dir)
+    if manifest is None:
+        # First run against a model that predates manifests: hash it once
+        # and trust that snapshot from now on. Nothing vouches for these
+        # bytes, so say so rather than reporting the model as verified.
         logger.warning(
-            "model.bin at %s is too small (%.1f MB) — corrupt download",
-            bin_path,
-            size_mb,
+            "No checksum manifest in %s — model NOT verified against upstream "
+            "checksums; recording its current files as the baseline",
+            model_dir,
         )
+        _write_manifest(model_dir)
+        return True
+
+    if "model.bin" not in manifest["files"]:
+        logger.warning("Manifest in %s does not cover model.bin", model_dir)
         return False
-    logger.info("model.bin at %s is healthy (%.1f MB)", bin_path, size_mb)
+
+    refreshed = False
+    for name, entry in manifest["files"].items():
+        path = model_dir / name
+        try:
+            stat = path.stat()
+        except OSError:
+            logger.warning("Model file %s listed in manifest is missing", path)
+            return False
+        if stat.st_size != entry.get("size"):
+            logger.warning(
+                "Model file %s changed size (%d != %s) — corrupt",
+                path,
+                stat.st_size,
+                entry.get("size"),
+            )
+            return False
+        if stat.st_mtime_ns == entry.get("mtime_ns"):
+            continue
+        if _file_sha256(path) != entry.get("sha256"):
+            logger.warning("Model file %s failed checksum verification", path)
+            return False
+        entry["mtime_ns"] = stat.st_mtime_ns
+        refreshed = True
+
+    if refreshed:
+        _manifest_path(model_dir).write_text(
+            json.dumps(manifest, indent=2), encoding="utf-8"
+        )
+    logger.info("Model at %s matches its checksum manifest", model_dir)
     return True
 
 
@@ -156,9 +300,33 @@ def _download_model(model_size: str = MODEL_SIZE) -> Path:
         logger.error("Failed to download model %s: %s", repo_id, exc)
         raise
 
+    _write_manifest(local_dir, _upstream_checksums(repo_id))
     return local_dir
 
 
+def _upstream_checksums(repo_id: str) -> dict[str, str]:
+    """Return ``{filename: sha256}`` for the LFS files published on the Hub.
+
+    Returns an empty dict when the Hub metadata cannot be fetched; the
+    manifest is then built from the downloaded files alone.
+    """
+    try:
+        from huggingface_hub import HfApi
+
+        info = HfApi().model_info(repo_id, files_metadata=True)
+    except Exception as exc:
+        logger.warning("Could not fetch upstream checksums for %s: %s", repo_id, exc)
+        return {}
+
+    checksums = {}
+    for sibling in info.siblings or []:
+        lfs = getattr(sibling, "lfs", None)
+        sha256 = getattr(lfs, "sha256", None) if lfs else None
+        if sha256:
+            checksums[sibling.rfilename] = sha256
+    return checksums
+
+
 def _ensure_model_downloaded(model_size: str = MODEL_SIZE) -> Path:
     """Return the local model path, downloading (or re-downloading) if needed.
 
@@ -188,15 +356,21 @@ def _ensure_model_downloaded(model_size: str = MODEL_SIZE) -> Path:
 # TranscriptionEngine — Singleton
 # ===================================================================
 
+# Serialises model loads so a lazy call and the warm-up thread never
+# load two copies of the weights at once.
+_load_lock = threading.Lock()
+
 
 class TranscriptionEngine:
     """Singleton that owns the Whisper model instance.
 
     Responsibilities:
-      - Load Faster-Whisper once at startup (or lazily on first call)
+      - Load Faster-Whisper once, in a background thread at startup
+        (``start_background_init``) or lazily on first call
       - Detect corruption and auto-recover by re-downloading
       - Fall back to OpenAI Whisper if Faster-Whisper is unrecoverable
       - Provide a ``transcribe()`` method that returns the standard dict
+      - Report warm-up state and cold-start timings via ``status()``
     """
 
     def __init__(self):
@@ -207,6 +381,14 @@ class TranscriptionEngine:
         self._initialized = False
         self._init_error = None
 
+        # Warm-up bookkeeping
+        self._init_lock = threading.Lock()
+        self._init_thread = None
+        self._state = "cold"  # cold | loading | ready | failed
+        self._started_at = None  # monotonic time warm-up was requested
+        self._ready_at = None
+        self._first_result_at = None
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -215,38 +397,118 @@ class TranscriptionEngine:
     def backend(self) -> str:
         return self._backend or "none"
 
-    def ensure_initialized(self) -> bool:
-        """Try to initialize (or re-initialize) the model.
+    @property
+    def is_ready(self) -> bool:
+        return self._state == "ready"
 
-        Returns True if the model is usable, False otherwise.
-        """
-        if self._model is not None:
-            return True
+    @property
+    def state(self) -> str:
+        return self._state
 
-        try:
-            self._init_faster_whisper()
-            return True
-        except Exception as exc:
-            logger.warning(
-                "Faster-Whisper init failed: %s. Trying OpenAI Whisper fallback …",
-                exc,
+    def start_background_init(self) -> None:
+        """Begin loading the model on a daemon thread and return immediately.
+
+        Safe to call repeatedly; only one warm-up thread is ever started
+        while a load is pending.
+        """
+        with self._init_lock:
+            if self._state in ("ready", "loading"):
+                return
+            if self._started_at is None:
+                self._started_at = time.monotonic()
+            self._state = "loading"
+            self._init_thread = threading.Thread(
+                target=self.ensure_initialized,
+                name="whisper-warmup",
+                daemon=True,
             )
+            self._init_thread.start()
 
-        try:
-            self._init_openai_whisper()
+    def wait_until_ready(self, timeout: float | None = None) -> bool:
+        """Block until a pending warm-up finishes. Returns ``is_ready``."""
+        thread = self._init_thread
+        if thread is not None:
+            thread.join(timeout)
+        return self.is_ready
+
+    def status(self) -> dict:
+        """Return warm-up state and cold-start timings for ``/health``."""
+
+        def _since_start(moment):
+            if moment is None or self._started_at is None:
+                return None
+            return round(moment - self._started_at, 3)
+
+        return {
+            "state": self._state,
+            "backend": self.backend,
+            "error": self._init_error,
+            "cold_start_seconds": _since_start(self._ready_at),
+            "first_transcript_seconds": _since_start(self._first_result_at),
+        }
+
+    def ensure_initialized(self) -> bool:
+        """Try to initialize (or re-initialize) the model.
+
+        Returns True if the model is usable, False otherwise. Concurrent
+        callers wait for a single load instead of loading twice.
+        """
+        if self._model is not None or self._fallback_model is not None:
             return True
-        except Exception as exc:
-            logger.error("OpenAI Whisper fallback also failed: %s", exc)
-            self._init_error = str(exc)
-            return False
 
-    def transcribe(self, audio_data, language: str = "en") -> dict:
+        with self._init_lock:
+            if self._started_at is None:
+                self._started_at = time.monotonic()
+            self._state = "loading"
+
+        ok = self._load_any_backend()
+
+        with self._init_lock:
+            if ok:
+                self._state = "ready"
+                self._init_error = None
+                if self._ready_at is None:
+                    self._ready_at = time.monotonic()
+            else:
+                self._state = "failed"
+        return ok
+
+    def _load_any_backend(self) -> bool:
+        """Load Faster-Whisper, falling back to OpenAI Whisper."""
+        with _load_lock:
+            if self._model is not None or self._fallback_model is not None:
+                return True
+
+            try:
+                self._init_faster_whisper()
+                return True
+            except Exception as exc:
+                logger.warning(
+                    "Faster-Whisper init failed: %s. Trying OpenAI Whisper fallback …",
+                    exc,
+                )
+
+            try:
+                self._init_openai_whisper()
+                return True
+            except Exception as exc:
+                logger.error("OpenAI Whisper fallback also failed: %s", exc)
+                self._init_error = str(exc)
+                return False
+
+    def transcribe(
+        self, audio_data, language: str = "en", word_timestamps: bool = False
+    ) -> dict:
         """Transcribe a float32 numpy array.
 
         Returns the standard dict with keys:
           transcript, segments, sample_rate
         or on error:
           transcript, segments, error
+
+        Each segment carries ``text``, ``start``/``end`` (seconds),
+        ``avg_logprob`` and ``no_speech_prob``; with *word_timestamps* it
+        also carries a ``words`` list with per-word timing and probability.
         """
         if not self.ensure_initialized():
             return {
@@ -255,10 +517,45 @@ class TranscriptionEngine:
                 "error": self._init_error or "No transcription backend available",
             }
 
+        try:
+            segments = list(self.iter_segments(audio_data, language, word_timestamps))
+        except Exception as exc:
+            logger.error("%s transcription failed: %s", self.backend, exc)
+            return {
+                "transcript": "",
+                "segments": [],
+                "error": str(exc),
+            }
+
+        if self._first_result_at is None:
+            self._first_result_at = time.monotonic()
+        return {
+            "transcript": " ".join(seg["text"] for seg in segments),
+            "segments": segments,
+            "sample_rate": samplerate,
+        }
+
+    def iter_segments(
+        self, audio_data, language: str = "en", word_timestamps: bool = False
+    ):
+        """Yield segment dicts as the model decodes them.
+
+        Faster-Whisper decodes lazily, so the first segment is available
+        long before the clip is finished. Empty and no-speech segments are
+        skipped. Raises on failure instead of returning an error dict.
+        """
+        if not self.ensure_initialized():
+            raise RuntimeError(self._init_error or "No transcription backend available")
+
         if self._backend == "faster-whisper":
-            return self._transcribe_faster(audio_data, language)
+            raw_segments = self._iter_faster(audio_data, language, word_timestamps)
         else:
-            return self._transcribe_openai(audio_data, language)
+            raw_segments = self._iter_openai(audio_data, language, word_timestamps)
+
+        for segment in raw_segments:
+            if not segment["text"] or _is_no_speech(segment):
+                continue
+            yield segment
 
     # ------------------------------------------------------------------
     # Faster-Whisper
@@ -285,23 +582,22 @@ class TranscriptionEngine:
         self._backend = "faster-whisper"
         logger.info("Faster-Whisper model loaded successfully")
 
-    def _transcribe_faster(self, audio_data, language: str) -> dict:
-        """Transcribe using Faster-Whisper."""
-        try:
-            segments, info = self._model.transcribe(audio_data, language=language)
-            lines = [seg.text.strip() for seg in segments if seg.text.strip()]
-            return {
-                "transcript": " ".join(lines),
-                "segments": [{"text": line} for line in lines],
-                "sample_rate": samplerate,
-            }
-        except Exception as exc:
-            logger.error("Faster-Whisper transcription failed: %s", exc)
-            return {
-                "transcript": "",
-                "segments": [],
-                "error": str(exc),
-            }
+    def _iter_faster(self, audio_data, language: str, word_timestamps: bool):
+        """Yield segments from Faster-Whisper's lazy segment generator."""
+        segments, _info = self._model.transcribe(
+            audio_data, language=language, word_timestamps=word_timestamps
+        )
+        for seg in segments:
+            yield _segment_dict(
+                text=seg.text,
+                start=seg.start,
+                end=seg.end,
+                avg_logprob=seg.avg_logprob,
+                no_speech_prob=seg.no_speech_prob,
+                words=[
+                    (w.word, w.start, w.end, w.probability) for w in seg.words
+                ] if word_timestamps and seg.words else None,
+            )
 
     # ------------------------------------------------------------------
     # OpenAI Whisper (fallback)
@@ -325,35 +621,69 @@ class TranscriptionEngine:
         self._backend = "openai-whisper"
         logger.info("OpenAI Whisper fallback loaded successfully")
 
-    def _transcribe_openai(self, audio_data, language: str) -> dict:
-        """Transcribe using OpenAI Whisper (local fallback)."""
-        try:
-            import whisper
-        except ImportError:
-            return {
-                "transcript": "",
-                "segments": [],
-                "error": "openai-whisper not installed for fallback",
-            }
-
-        try:
-            result = self._fallback_model.transcribe(
-                audio_data, language=language, fp16=False
+    def _iter_openai(self, audio_data, language: str, word_timestamps: bool):
+        """Yield segments from OpenAI Whisper (decodes the whole clip first)."""
+        result = self._fallback_model.transcribe(
+            audio_data,
+            language=language,
+            fp16=False,
+            word_timestamps=word_timestamps,
+        )
+        for seg in result.get("segments", []):
+            yield _segment_dict(
+                text=seg["text"],
+                start=seg["start"],
+                end=seg["end"],
+                avg_logprob=seg.get("avg_logprob"),
+                no_speech_prob=seg.get("no_speech_prob"),
+                words=[
+                    (w["word"], w["start"], w["end"], w.get("probability"))
+                    for w in seg.get("words", [])
+                ] if word_timestamps else None,
             )
-            segments_list = result.get("segments", [])
-            lines = [seg["text"].strip() for seg in segments_list if seg["text"].strip()]
-            return {
-                "transcript": " ".join(lines),
-                "segments": [{"text": line} for line in lines],
-                "sample_rate": samplerate,
-            }
-        except Exception as exc:
-            logger.error("OpenAI Whisper transcription failed: %s", exc)
-            return {
-                "transcript": "",
-                "segments": [],
-                "error": str(exc),
+
+
+# ---------------------------------------------------------------------------
+# Segment helpers
+# ---------------------------------------------------------------------------
+
+
+def _round(value, digits: int = 3):
+    return None if value is None else round(float(value), digits)
+
+
+def _segment_dict(text, start, end, avg_logprob, no_speech_prob, words=None) -> dict:
+    """Build the engine's segment shape from backend-specific fields."""
+    segment = {
+        "text": text.strip(),
+        "start": _round(start),
+        "end": _round(end),
+        "avg_logprob": _round(avg_logprob, 4),
+        "no_speech_prob": _round(no_speech_prob, 4),
+    }
+    if words is not None:
+        segment["words"] = [
+            {
+                "word": word.strip(),
+                "start": _round(w_start),
+                "end": _round(w_end),
+                "probability": _round(probability, 4),
             }
+            for word, w_start, w_end, probability in words
+        ]
+    return segment
+
+
+def _is_no_speech(segment: dict) -> bool:
+    """Whisper's silence rule: likely no speech *and* a low-confidence decode."""
+    no_speech_prob = segment.get("no_speech_prob")
+    avg_logprob = segment.get("avg_logprob")
+    if no_speech_prob is None or avg_logprob is None:
+        return False
+    return (
+        no_speech_prob > NO_SPEECH_PROB_THRESHOLD
+        and avg_logprob < LOGPROB_THRESHOLD
+    )
 
 
 # ===================================================================
@@ -478,16 +808,45 @@ def _convert_with_tempfile(audio_bytes):
         tmp_path = tmp.name
     try:
         data, sr = sf.read(tmp_path, dtype="float32")
+        if data.ndim > 1:
+            data = data.mean(axis=1)
         return data, sr
     finally:
         if os.path.exists(tmp_path):
             os.unlink(tmp_path)
 
 
+def _lowpass(data, cutoff: float):
+    """Windowed-sinc FIR low-pass; *cutoff* is a fraction of the sample rate."""
+    taps = np.arange(-_LOWPASS_HALF_TAPS, _LOWPASS_HALF_TAPS + 1)
+    kernel = 2 * cutoff * np.sinc(2 * cutoff * taps) * np.hamming(len(taps))
+    return np.convolve(data, kernel / kernel.sum(), mode="same")
+
+
+def resample(data, orig_sr: int, target_sr: int = samplerate):
+    """Resample a mono float32 array; no-op when rates match.
+
+    Uses scipy's polyphase resampler when installed. Otherwise downsampling
+    low-passes below the new Nyquist frequency before interpolating, so
+    e.g. 44.1 kHz -> 16 kHz doesn't fold high frequencies into speech.
+    """
+    if orig_sr == target_sr or len(data) == 0:
+        return data
+    if resample_poly is not None:
+        g = math.gcd(orig_sr, target_sr)
+        return resample_poly(data, target_sr // g, orig_sr // g).astype(np.float32)
+    if target_sr < orig_sr:
+        data = _lowpass(data, 0.45 * target_sr / orig_sr)
+    n_out = int(round(len(data) * target_sr / orig_sr))
+    positions = np.arange(n_out, dtype=np.float64) * (orig_sr / target_sr)
+    return np.interp(positions, np.arange(len(data)), data).astype(np.float32)
+
+
 def convert_audio_to_float32(audio_bytes: bytes):
-    """Convert audio bytes (WebM/WAV/etc.) to float32 numpy array.
+    """Convert audio bytes (WebM/WAV/etc.) to a mono float32 numpy array.
 
-    Tries multiple strategies in order:
+    Returns ``(data, sample_rate)``; pass the result through ``resample``
+    for 16 kHz. Tries multiple strategies in order:
     1. pydub (requires ffmpeg installed on system)
     2. Direct ffmpeg subprocess call
     3. Temp file fallback (only works if already WAV format)
@@ -528,34 +887,59 @@ def convert_audio_to_float32(audio_bytes: bytes):
 # ===================================================================
 
 
-def transcribe_audio_file(audio_bytes: bytes) -> dict:
-    """Transcribe audio from raw file bytes (WebM, WAV, etc.) using Whisper.
-
-    This is the function called from the API endpoint when the browser
-    sends recorded audio. Returns the same dict shape as before.
-    """
+def _decode_upload(audio_bytes: bytes):
+    """Decode uploaded audio. Returns ``(samples, None)`` or ``(None, error)``."""
     # Convert browser audio (WebM / MP4 / etc.) to WAV PCM for Whisper
     try:
         data, sr = convert_audio_to_float32(audio_bytes)
     except Exception as e:
         logger.error("Audio conversion failed: %s", e)
-        return {
-            "transcript": "",
-            "segments": [],
-            "error": f"Audio conversion failed: {e}",
-        }
+        return None, f"Audio conversion failed: {e}"
 
     # Check if we got valid audio data
     if data is None or len(data) == 0:
         logger.warning("Decoded audio is empty")
+        return None, "Decoded audio is empty"
+
+    # ffmpeg already delivers 16 kHz; the soundfile fallback keeps the source rate
+    return resample(data, sr), None
+
+
+def transcribe_audio_file(audio_bytes: bytes, word_timestamps: bool = False) -> dict:
+    """Transcribe audio from raw file bytes (WebM, WAV, etc.) using Whisper.
+
+    This is the function called from the API endpoint when the browser
+    sends recorded audio. Returns the same dict shape as before, with
+    timing and confidence metadata on every segment.
+    """
+    data, error = _decode_upload(audio_bytes)
+    if error:
         return {
             "transcript": "",
             "segments": [],
-            "error": "Decoded audio is empty",
+            "error": error,
         }
 
     # Transcribe with the engine (handles Faster-Whisper or fallback)
-    return _engine.transcribe(data, language="en")
+    return _engine.transcribe(data, language="en", word_timestamps=word_timestamps)
+
+
+def stream_audio_file(audio_bytes: bytes, word_timestamps: bool = False):
+    """Yield segment dicts for uploaded audio as soon as each is decoded.
+
+    Yields a single ``{"error": ...}`` dict instead if decoding or
+    transcription fails part-way.
+    """
+    data, error = _decode_upload(audio_bytes)
+    if error:
+        yield {"error": error}
+        return
+
+    try:
+        yield from _engine.iter_segments(data, "en", word_timestamps)
+    except Exception as exc:
+        logger.error("Streaming transcription failed: %s", exc)
+        yield {"error": str(exc)}
 
 
 # ===================================================================
@@ -0,0 +1,395 @@
+"""
+Long-form Transcription
+
+Handles recordings that are too long to decode and transcribe in one call:
+- Streams the decode through ffmpeg so only a few blocks of PCM are held
+- Splits audio on silence into ~30 second pieces with a short overlap
+- Transcribes pieces in parallel across a pool of model replicas
+- Stitches results back together, removing words repeated in the overlap
+- Reports the real-time factor (processing time / audio duration)
+"""
+
+import io
+import logging
+import os
+import queue
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backend import live_transcript
+
+logger = logging.getLogger("long_transcript")
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+samplerate = live_transcript.samplerate
+
+# Decoded PCM is pulled from ffmpeg in blocks of this many seconds
+DECODE_BLOCK_SECONDS = 5.0
+
+# Piece sizing: aim for TARGET, look back/forward SEARCH seconds for the
+# quietest point, never exceed MAX. OVERLAP is re-sent to the next piece.
+TARGET_PIECE_SECONDS = 30.0
+SEARCH_WINDOW_SECONDS = 5.0
+MAX_PIECE_SECONDS = 40.0
+OVERLAP_SECONDS = 1.0
+
+# RMS frame used to find silence
+FRAME_SECONDS = 0.03
+
+# Number of model replicas used for parallel transcription
+REPLICAS = max(1, int(os.getenv("AGENTX_TRANSCRIBE_REPLICAS", "2")))
+
+# Longest run of words compared when removing overlap duplicates
+_MAX_OVERLAP_WORDS = 12
+
+
+# ---------------------------------------------------------------------------
+# Streaming decode
+# ---------------------------------------------------------------------------
+
+
+def _pcm16_to_float32(raw: bytes):
+    return np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+
+
+def _stream_with_ffmpeg(path: str, block_samples: int):
+    """Yield float32 blocks from an ffmpeg process writing raw PCM to stdout."""
+    proc = subprocess.Popen(
+        [
+            "ffmpeg",
+            "-nostdin",
+            "-loglevel",
+            "error",
+            "-i",
+            path,
+            "-f",
+            "s16le",
+            "-ac",
+            "1",
+            "-ar",
+            str(samplerate),
+            "pipe:1",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        block_bytes = block_samples * 2
+        while True:
+            raw = proc.stdout.read(block_bytes)
+            if not raw:
+                break
+            yield _pcm16_to_float32(raw[: len(raw) - len(raw) % 2])
+        if proc.wait() != 0:
+            raise RuntimeError(
+                f"ffmpeg exited with {proc.returncode}: "
+                f"{proc.stderr.read().decode(errors='ignore')[-300:]}"
+            )
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        proc.stderr.close()
+
+
+def _stream_with_soundfile(audio_bytes: bytes, block_samples: int):
+    """Yield float32 blocks read incrementally with soundfile (WAV/FLAC/OGG)."""
+    with sf.SoundFile(io.BytesIO(audio_bytes)) as f:
+        native_block = max(1, int(block_samples * f.samplerate / samplerate))
+        for block in f.blocks(blocksize=native_block, dtype="float32", always_2d=True):
+            yield live_transcript.resample(block.mean(axis=1), f.samplerate, samplerate)
+
+
+def stream_decode(audio_bytes: bytes, block_seconds: float = DECODE_BLOCK_SECONDS):
+    """Yield mono 16 kHz float32 blocks of roughly *block_seconds* each.
+
+    Uses ffmpeg when available (any container/codec), otherwise soundfile.
+    Only one block is materialised at a time.
+    """
+    if np is None:
+        raise RuntimeError("numpy is required for long-form transcription")
+
+    block_samples = int(block_seconds * samplerate)
+
+    if live_transcript._check_ffmpeg():
+        with tempfile.NamedTemporaryFile(suffix=".audio", delete=False) as tmp:
+            tmp.write(audio_bytes)
+            tmp_path = tmp.name
+        try:
+            yield from _stream_with_ffmpeg(tmp_path, block_samples)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        return
+
+    if sf is None:
+        raise RuntimeError("No streaming decoder available — install ffmpeg or soundfile")
+    yield from _stream_with_soundfile(audio_bytes, block_samples)
+
+
+# ---------------------------------------------------------------------------
+# Silence splitting
+# ---------------------------------------------------------------------------
+
+
+def _quietest_offset(samples, lo: int, hi: int) -> int:
+    """Return the sample index of the lowest-energy frame in ``[lo, hi)``."""
+    frame = max(1, int(FRAME_SECONDS * samplerate))
+    window = samples[lo:hi]
+    n_frames = len(window) // frame
+    if n_frames == 0:
+        return hi
+    energy = np.square(window[: n_frames * frame]).reshape(n_frames, frame).mean(axis=1)
+    return lo + int(np.argmin(energy)) * frame + frame // 2
+
+
+def split_on_silence(
+    blocks,
+    target_seconds: float = TARGET_PIECE_SECONDS,
+    search_seconds: float = SEARCH_WINDOW_SECONDS,
+    max_seconds: float = MAX_PIECE_SECONDS,
+    overlap_seconds: float = OVERLAP_SECONDS,
+):
+    """Regroup decoded blocks into pieces cut at the quietest nearby point.
+
+    Yields ``(start_seconds, cut_seconds, samples)`` where *start_seconds* is
+    the piece's position in the recording and *cut_seconds* is where the
+    piece's own territory ends; anything after it is overlap that the next
+    piece also covers. At most *max_seconds* of audio is buffered.
+    """
+    target = int(target_seconds * samplerate)
+    search = int(search_seconds * samplerate)
+    limit = int(max_seconds * samplerate)
+    overlap = int(overlap_seconds * samplerate)
+
+    buffer = np.zeros(0, dtype=np.float32)
+    buffer_start = 0  # absolute sample index of buffer[0]
+
+    def _emit(cut: int):
+        end = min(len(buffer), cut + overlap)
+        return (
+            buffer_start / samplerate,
+            (buffer_start + cut) / samplerate,
+            buffer[:end],
+        )
+
+    for block in blocks:
+        buffer = np.concatenate([buffer, np.asarray(block, dtype=np.float32)])
+        while len(buffer) >= min(target + search, limit) + overlap:
+            cut = _quietest_offset(buffer, target - search, min(target + search, limit))
+            yield _emit(cut)
+            buffer = buffer[cut:]
+            buffer_start += cut
+
+    if len(buffer):
+        yield _emit(len(buffer))
+
+
+# ---------------------------------------------------------------------------
+# Stitching
+# ---------------------------------------------------------------------------
+
+
+def _normalise_word(word: str) -> str:
+    return "".join(ch for ch in word.lower() if ch.isalnum())
+
+
+def _overlap_length(previous: list[str], current: list[str]) -> int:
+    """Longest k such that the last k words of *previous* start *current*."""
+    prev = [_normalise_word(w) for w in previous[-_MAX_OVERLAP_WORDS:]]
+    curr = [_normalise_word(w) for w in current[:_MAX_OVERLAP_WORDS]]
+    for k in range(min(len(prev), len(curr)), 0, -1):
+        if prev[-k:] == curr[:k]:
+            return k
+    return 0
+
+
+def stitch_pieces(pieces: list[dict]) -> list[dict]:
+    """Merge per-piece segments into one timeline without duplicates.
+
+    Each piece is ``{"start": s, "cut": c, "segments": [...]}`` with segment
+    times relative to the piece. A segment belongs to the piece whose
+    territory (previous cut .. own cut) contains its midpoint; words that
+    still repeat across the seam are trimmed from the first segment(s) of
+    the later piece. Segments inside a piece are never trimmed.
+    """
+    stitched: list[dict] = []
+    previous_cut = 0.0
+
+    for piece in pieces:
+        offset = piece["start"]
+        at_seam = bool(stitched)
+        for segment in piece["segments"]:
+            start = segment["start"] + offset
+            end = segment["end"] + offset
+            midpoint = (start + end) / 2
+            if midpoint < previous_cut or midpoint >= piece["cut"]:
+                continue
+
+            shifted = dict(segment, start=round(start, 3), end=round(end, 3))
+            if "words" in segment:
+                shifted["words"] = [
+                    dict(w, start=round(w["start"] + offset, 3), end=round(w["end"] + offset, 3))
+                    for w in segment["words"]
+                ]
+
+            if at_seam:
+                repeated = _overlap_length(stitched[-1]["text"].split(), shifted["text"].split())
+                if repeated:
+                    shifted["text"] = " ".join(shifted["text"].split()[repeated:])
+                    if "words" in shifted:
+                        shifted["words"] = shifted["words"][repeated:]
+                if not shifted["text"]:
+                    continue   # wholly repeated; the next segment is still at the seam
+                at_seam = False
+            stitched.append(shifted)
+        previous_cut = piece["cut"]
+
+    return stitched
+
+
+# ---------------------------------------------------------------------------
+# Replica pool
+# ---------------------------------------------------------------------------
+
+
+class ReplicaPool:
+    """Fixed-size pool of TranscriptionEngine replicas.
+
+    Replica 0 is the shared singleton engine; the others are created and
+    loaded on first use. ``checkout()`` blocks until a replica is free.
+    """
+
+    def __init__(self, size: int = REPLICAS, engine_factory=None):
+        self.size = max(1, size)
+        self._factory = engine_factory or live_transcript.TranscriptionEngine
+        self._free: queue.Queue = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _new_engine(self):
+        if self._created == 0 and self._factory is live_transcript.TranscriptionEngine:
+            return live_transcript.get_engine()
+        return self._factory()
+
+    def checkout(self):
+        with self._lock:
+            if self._free.empty() and self._created < self.size:
+                engine = self._new_engine()
+                self._created += 1
+                return engine
+        return self._free.get()
+
+    def checkin(self, engine) -> None:
+        self._free.put(engine)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_replica_pool() -> ReplicaPool:
+    """Return the process-wide replica pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ReplicaPool()
+        return _pool
+
+
+# ===================================================================
+# Main long-form API (called from api.py)
+# ===================================================================
+
+
+def transcribe_long_audio(
+    audio_bytes: bytes,
+    word_timestamps: bool = False,
+    language: str = "en",
+    pool: ReplicaPool | None = None,
+) -> dict:
+    """Transcribe a long recording piece by piece across model replicas.
+
+    Returns the standard transcription dict plus a ``stats`` entry with
+    ``audio_seconds``, ``processing_seconds``, ``real_time_factor``,
+    ``pieces`` and ``replicas``. At most two pieces per replica are in
+    flight, which bounds memory regardless of recording length.
+    """
+    pool = pool or get_replica_pool()
+    started = time.perf_counter()
+    in_flight = threading.BoundedSemaphore(pool.size * 2)
+
+    def _run(piece_start, cut, samples):
+        engine = None
+        try:
+            engine = pool.checkout()
+            result = engine.transcribe(samples, language=language, word_timestamps=word_timestamps)
+        finally:
+            if engine is not None:
+                pool.checkin(engine)
+            in_flight.release()
+        return {"start": piece_start, "cut": cut, **result}
+
+    futures = []
+    audio_seconds = 0.0
+    try:
+        with ThreadPoolExecutor(max_workers=pool.size, thread_name_prefix="long-transcribe") as executor:
+            for piece_start, cut, samples in split_on_silence(stream_decode(audio_bytes)):
+                in_flight.acquire()
+                futures.append(executor.submit(_run, piece_start, cut, samples))
+                audio_seconds = piece_start + len(samples) / samplerate
+            pieces = [f.result() for f in futures]
+    except Exception as exc:
+        logger.error("Long-form transcription failed: %s", exc)
+        return {
+            "transcript": "",
+            "segments": [],
+            "error": f"Long-form transcription failed: {exc}",
+        }
+
+    errors = [p["error"] for p in pieces if p.get("error")]
+    if errors:
+        return {
+            "transcript": "",
+            "segments": [],
+            "error": errors[0],
+        }
+
+    segments = stitch_pieces(pieces)
+    elapsed = time.perf_counter() - started
+    logger.info(
+        "Transcribed %.1fs of audio in %.1fs (%d pieces, %d replicas)",
+        audio_seconds,
+        elapsed,
+        len(pieces),
+        pool.size,
+    )
+    return {
+        "transcript": " ".join(seg["text"] for seg in segments),
+        "segments": segments,
+        "sample_rate": samplerate,
+        "stats": {
+            "audio_seconds": round(audio_seconds, 3),
+            "processing_seconds": round(elapsed, 3),
+            "real_time_factor": round(elapsed / audio_seconds, 4) if audio_seconds else None,
+            "pieces": len(pieces),
+            "replicas": pool.size,
+        },
+    }
@@ -0,0 +1,233 @@
+"""Mailbox Sync — incremental Gmail processing driven by history ids.
+
+The automation loop used to re-list the five newest ``UNREAD`` messages
+each cycle, so a burst of mail was handled late or not at all. ``MailboxSync``
+instead keeps a checkpoint with the last Gmail ``historyId`` and asks
+``users.history.list`` only for messages added since then, following every
+page. The first run (or one whose history id Gmail has expired) seeds the
+checkpoint from ``getProfile`` and backfills only the newest
+``BACKFILL_LIMIT`` unread messages, so a long unread backlog is not handed
+to the handler in one go.
+
+New message ids are written to the checkpoint as ``pending`` before any of
+them is handled, then fetched and handled in batches of ``batch_size``;
+the checkpoint shrinks after each batch. A crash therefore resumes with the
+unhandled remainder (handlers may see a message twice). An id whose fetch
+fails (429/5xx inside the batch) or whose handler raises stays pending for
+the next sync, up to ``MAX_ATTEMPTS`` tries, after which it is dropped
+with a warning.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from backend.gmail_fetch import GmailFetcher
+
+logger = logging.getLogger("mailbox_sync")
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CHECKPOINT_FILE = PROJECT_ROOT / "mailbox_sync.json"
+
+SYNC_LABEL = "UNREAD"
+BATCH_SIZE = 25
+HISTORY_PAGE_SIZE = 500
+BACKFILL_LIMIT = 20
+MAX_ATTEMPTS = 5
+
+
+def _http_status(exc: BaseException) -> int | None:
+    return getattr(getattr(exc, "resp", None), "status", None)
+
+
+class MailboxSync:
+    def __init__(
+        self,
+        checkpoint_path: Path = CHECKPOINT_FILE,
+        label: str = SYNC_LABEL,
+        batch_size: int = BATCH_SIZE,
+        user_id: str = "me",
+    ):
+        self._path = Path(checkpoint_path)
+        self._label = label
+        self._batch_size = batch_size
+        self._user_id = user_id
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Checkpoint
+    # ------------------------------------------------------------------
+
+    def checkpoint(self) -> dict[str, Any]:
+        try:
+            return json.loads(self._path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {"history_id": None, "pending": [], "attempts": {}}
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable mailbox checkpoint %s: %s", self._path, exc)
+            return {"history_id": None, "pending": [], "attempts": {}}
+
+    def _save(self, history_id: str | None, pending: list[str], attempts: dict[str, int]) -> None:
+        data = {
+            "history_id": history_id,
+            "pending": pending,
+            "attempts": attempts,
+            "updated_at": datetime.now().isoformat(),
+        }
+        fd, tmp = tempfile.mkstemp(dir=self._path.parent, prefix=".mailbox_sync.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self._path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    # ------------------------------------------------------------------
+    # Listing changes
+    # ------------------------------------------------------------------
+
+    def _history_since(self, gmail, history_id: str) -> tuple[list[str], str]:
+        """Ids of messages added with our label since *history_id*."""
+        ids: dict[str, None] = {}
+        latest = history_id
+        page_token = None
+        while True:
+            kwargs: dict[str, Any] = {
+                "userId": self._user_id,
+                "startHistoryId": history_id,
+                "historyTypes": ["messageAdded"],
+                "maxResults": HISTORY_PAGE_SIZE,
+            }
+            if page_token:
+                kwargs["pageToken"] = page_token
+            response = gmail.users().history().list(**kwargs).execute()
+            for record in response.get("history", []):
+                for added in record.get("messagesAdded", []):
+                    message = added.get("message", {})
+                    if self._label in message.get("labelIds", [self._label]):
+                        ids[message["id"]] = None
+            latest = response.get("historyId", latest)
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return list(ids), latest
+
+    def _backfill(self, gmail) -> tuple[list[str], str]:
+        # Take the history id first so mail arriving mid-listing is seen next time
+        history_id = gmail.users().getProfile(userId=self._user_id).execute()["historyId"]
+        ids = GmailFetcher(gmail, user_id=self._user_id).list_ids(
+            label_ids=(self._label,), max_results=BACKFILL_LIMIT
+        )
+        return list(reversed(ids)), history_id
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    def sync(
+        self,
+        gmail,
+        handler: Callable[[dict], None],
+        before_batch: Callable[[list[dict]], None] | None = None,
+    ) -> dict[str, Any]:
+        """Hand every new message to *handler*; returns a summary.
+
+        *before_batch*, if given, sees each fetched batch first (e.g. to
+        classify it in one LLM call). A handler exception is logged,
+        counted and retried on later syncs (up to ``MAX_ATTEMPTS``), but
+        it does not stop this one, so one bad message cannot wedge the
+        checkpoint.
+        """
+        with self._lock:
+            started = time.perf_counter()
+            state = self.checkpoint()
+            pending = list(state.get("pending") or [])
+            attempts = dict(state.get("attempts") or {})
+            history_id = state.get("history_id")
+            mode = "incremental"
+            if history_id is not None:
+                try:
+                    new_ids, history_id = self._history_since(gmail, history_id)
+                except Exception as exc:
+                    # 404 means Gmail no longer keeps history that far back
+                    if _http_status(exc) != 404:
+                        raise
+                    logger.info("History id %s expired; backfilling recent %s mail", history_id, self._label)
+                    history_id = None
+            if history_id is None:
+                mode = "backfill"
+                new_ids, history_id = self._backfill(gmail)
+            known = set(pending)
+            pending.extend(i for i in new_ids if i not in known)
+            self._save(history_id, pending, attempts)
+
+            summary = {"mode": mode, "listed": len(new_ids), "processed": 0, "skipped": 0,
+                       "failed": 0, "retrying": 0, "dropped": 0, "batches": 0, "history_id": history_id}
+            # Ids that failed wait for the next sync rather than spin here
+            retry: list[str] = []
+
+            def _retry_later(message_id: str, what: str) -> None:
+                attempts[message_id] = attempts.get(message_id, 0) + 1
+                if attempts[message_id] < MAX_ATTEMPTS:
+                    retry.append(message_id)
+                else:
+                    logger.warning("Dropping %s after %d failed %s", message_id, attempts.pop(message_id), what)
+                    summary["dropped"] += 1
+
+            while pending[len(retry):]:
+                remaining = pending[len(retry):]
+                batch = remaining[:self._batch_size]
+                fetcher = GmailFetcher(gmail, user_id=self._user_id)
+                fetched = fetcher.get_messages(batch, format="full")
+                returned = {message["id"] for message in fetched}
+                for message_id in batch:
+                    if message_id not in returned:
+                        _retry_later(message_id, "fetches")
+                messages = []
+                for message in fetched:
+                    if self._label in message.get("labelIds", [self._label]):
+                        messages.append(message)
+                    else:
+                        attempts.pop(message["id"], None)
+                        summary["skipped"] += 1  # e.g. already read by the user
+                if before_batch and messages:
+                    try:
+                        before_batch(messages)
+                    except Exception as exc:
+                        logger.warning("Mailbox sync batch hook failed: %s", exc)
+                for message in messages:
+                    try:
+                        handler(message)
+                        attempts.pop(message["id"], None)
+                        summary["processed"] += 1
+                    except Exception as exc:
+                        logger.warning("Mailbox sync handler failed for %s: %s", message.get("id"), exc)
+                        summary["failed"] += 1
+                        _retry_later(message["id"], "handler runs")
+                pending = retry + remaining[len(batch):]
+                self._save(history_id, pending, attempts)
+                summary["batches"] += 1
+            summary["retrying"] = len(retry)
+            summary["seconds"] = round(time.perf_counter() - started, 3)
+            logger.info("Mailbox sync: %s", summary)
+            return summary
+
+
+_sync = None
+_sync_lock = threading.Lock()
+
+
+def get_mailbox_sync() -> MailboxSync:
+    """Return the shared mailbox sync, creating it on first use."""
+    global _sync
+    with _sync_lock:
+        if _sync is None:
+            _sync = MailboxSync()
+        return _sync
@@ -2,44 +2,41 @@ from __future__ import print_function
 
 import sys
 from pathlib import Path as _Path
-# Ensure bare imports (meeting_summarizer, knowledge_hub, etc.) resolve
+# Ensure bare imports (meeting_summarizer, etc.) resolve
 # whether main.py is run directly OR imported as `from backend import main`.
 sys.path.insert(0, str(_Path(__file__).resolve().parent))
+# ...and package imports (backend.google_services, ...) when run directly
+if str(_Path(__file__).resolve().parent.parent) not in sys.path:
+    sys.path.append(str(_Path(__file__).resolve().parent.parent))
 
 try:
     from win10toast import ToastNotifier
 except Exception:
     ToastNotifier = None  # type: ignore
 
-try:
-    from twilio.rest import Client
-except Exception:
-    Client = None  # type: ignore
-
 import os
 import base64
 import json
 from google import genai
-import time
-import re
-
-try:
-    from notion_client import Client as NotionClient
-except Exception:
-    NotionClient = None  # type: ignore
 from dotenv import load_dotenv
 
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
-from google.auth.transport.requests import Request
+from googleapiclient.errors import HttpError
 
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta, timezone
 
 # ---------------- CORE MODULES ---------------- #
 
 from meeting_summarizer import summarize_meeting
-from knowledge_hub import store_meeting
+from backend.knowledge_hub import store_meeting
+from backend.calendar_sync import CalendarIndex, event_id, run_targets
+from backend.email_classifier import EmailClassifier
+from backend.email_extract import find_event_time
+from backend.gmail_fetch import GmailFetcher
+from backend.google_services import get_google_services
+from backend.mailbox_sync import get_mailbox_sync
+from backend.outbound_queue import OutboundNotConfigured, get_outbound_queue
+from backend.reminder_scheduler import ReminderScheduler
 
 # ---------------- ADDITIONAL MODULES (SAFE IMPORT) ---------------- #
 
@@ -88,91 +85,107 @@ TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
 TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
 TWILIO_WHATSAPP_TO = os.getenv("TWILIO_WHATSAPP_TO")
 
-notion = NotionClient(auth=NOTION_TOKEN) if (NOTION_TOKEN and NotionClient) else None
-
 IST = timezone(timedelta(hours=5, minutes=30))
 
 toaster = ToastNotifier() if ToastNotifier else None
 
-SCOPES = [
-    'https://www.googleapis.com/auth/gmail.modify',
-    'https://www.googleapis.com/auth/calendar'
-]
+# Upcoming events (backend/events.json) keyed on a heap of reminder times
+reminders = ReminderScheduler(tz=IST)
+
+# Known Calendar events, for duplicate checks without a list call each
+calendar_index = CalendarIndex()
 
 
 # ---------------- WHATSAPP ---------------- #
 
-def send_whatsapp_message(text):
+def send_whatsapp_message(text, idempotency_key=None):
 
-    if not Client or not TWILIO_ACCOUNT_SID or not TWILIO_AUTH_TOKEN or not TWILIO_WHATSAPP_TO:
-        print("⚠ Twilio credentials missing or library not installed")
-        return
-
-    try:
-        client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+    if not TWILIO_ACCOUNT_SID or not TWILIO_AUTH_TOKEN or not TWILIO_WHATSAPP_TO:
+        print("⚠ Twilio credentials missing")
+        return None
 
-        message = client.messages.create(
-            from_='whatsapp:+14155238886',
-            body=text,
-            to=TWILIO_WHATSAPP_TO
-        )
+    # Sent by the outbound queue's workers, with retries
+    delivery = get_outbound_queue().enqueue(
+        "twilio",
+        f"/Accounts/{TWILIO_ACCOUNT_SID}/Messages.json",
+        {"From": "whatsapp:+14155238886", "To": TWILIO_WHATSAPP_TO, "Body": text},
+        idempotency_key=idempotency_key,
+    )
 
-        print("📲 WhatsApp sent:", message.sid)
+    print("📲 WhatsApp queued:", delivery["id"])
 
-    except Exception as e:
-        print("WhatsApp Error:", e)
+    return delivery
 
 
 # ---------------- AUTH ---------------- #
 
-def get_credentials():
-
-    creds = None
+def get_credentials(interactive=False):
 
-    if os.path.exists('token.json'):
-        creds = Credentials.from_authorized_user_file('token.json', SCOPES)
+    # Cached process-wide and refreshed shortly before expiry. Only the
+    # CLI menu may open the browser consent flow; server paths (the API,
+    # the daemon) get GoogleAuthError instead
+    return get_google_services().credentials(interactive=interactive)
 
-    if not creds or not creds.valid:
-
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                'credentials.json', SCOPES)
 
-            creds = flow.run_local_server(port=0)
+def google_service(name, version):
 
-        with open('token.json', 'w') as token:
-            token.write(creds.to_json())
-
-    return creds
+    return get_google_services().service(
+        name, version, credentials=get_credentials(), builder=build
+    )
 
 
 # ---------------- AI CLASSIFIER ---------------- #
 
-def classify_email_type(email_text):
+def classify_email_types(email_texts):
+
+    # One Gemini call for a whole batch of emails
+    emails = "\n\n".join(
+        f"[{index}]\n{text[:2000]}" for index, text in enumerate(email_texts)
+    )
 
     prompt = f"""
-Classify this email into ONE of:
+Classify each email below into ONE of:
 meeting, exam, task, interview, payment, none.
 
-Return ONLY JSON:
-{{ "type": "" }}
+Return ONLY a JSON array with one object per email:
+[{{ "index": 0, "type": "" }}]
 
-Email:
-{email_text}
+Emails:
+{emails}
 """
 
     response = client.models.generate_content(
         model=os.getenv("GEMINI_MODEL", "models/gemini-2.5-flash-lite"),
-        contents=prompt
+        contents=prompt,
+        config={"response_mime_type": "application/json"}
     )
 
-    try:
-        return json.loads(response.text).get("type", "none")
-    except:
-        return "none"
+    # A malformed reply raises (json.JSONDecodeError is a ValueError), so
+    # the classifier retries the batch; emails the reply leaves out stay
+    # None and are not cached either
+    items = json.loads(response.text)
+    if not isinstance(items, list):
+        raise ValueError(f"Expected a JSON array of classifications, got {type(items).__name__}")
+
+    types = [None] * len(email_texts)
+
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        index = item.get("index")
+        if isinstance(index, int) and 0 <= index < len(types) and item.get("type"):
+            types[index] = item["type"]
+
+    return types
+
+
+# Keyword rules first, then cache, then batched LLM calls
+email_classifier = EmailClassifier(classify_email_types)
+
+
+def classify_email_type(email_text):
+
+    return email_classifier.classify(email_text)
 
 
 # ---------------- MARK EMAIL READ ---------------- #
@@ -190,40 +203,16 @@ def mark_email_read(gmail, message_id):
 
 def event_exists(service, title, start_time):
 
-    events = service.events().list(
-        calendarId='primary',
-        timeMin=start_time.isoformat(),
-        timeMax=(start_time + timedelta(minutes=1)).isoformat(),
-        singleEvents=True
-    ).execute()
-
-    for event in events.get('items', []):
-        if event.get('summary') == title:
-            return True
-
-    return False
+    # Local lookup; the index re-syncs from Calendar at most once a minute
+    return calendar_index.contains(service, title, start_time)
 
 
 # ---------------- LOCAL STORAGE ---------------- #
 
 def save_event_locally(title, start_time):
 
-    event_data = {
-        "title": title,
-        "datetime": start_time.isoformat(),
-        "reminded": False
-    }
-
-    if os.path.exists("events.json"):
-        with open("events.json", "r") as f:
-            events = json.load(f)
-    else:
-        events = []
-
-    events.append(event_data)
-
-    with open("events.json", "w") as f:
-        json.dump(events, f, indent=2)
+    # Also schedules the reminder and wakes the reminder job
+    return reminders.add(title, start_time)
 
 
 # ---------------- NOTION ---------------- #
@@ -236,173 +225,234 @@ def add_to_notion(title, start_time):
             "Set the NOTION_MEETING_TOKEN environment variable in a .env file."
         )
 
-    if not notion:
-        raise RuntimeError("Notion client failed to initialise.")
+    page = {
+        "parent": {"database_id": NOTION_DATABASE_ID},
+        "properties": {
+            "Name": {"title": [{"text": {"content": title}}]},
+            "Date": {"date": {"start": start_time.isoformat()}},
+            "Status": {"select": {"name": "Pending"}},
+            "Source": {"rich_text": [{"text": {"content": "Created by AgentX"}}]}
+        }
+    }
 
     try:
-        notion.pages.create(
-            parent={"database_id": NOTION_DATABASE_ID},
-            properties={
-                "Name": {"title": [{"text": {"content": title}}]},
-                "Date": {"date": {"start": start_time.isoformat()}},
-                "Status": {"select": {"name": "Pending"}},
-                "Source": {"rich_text": [{"text": {"content": "Created by AgentX"}}]}
-            }
+        # One page per event, however often it is queued
+        delivery = get_outbound_queue().enqueue(
+            "notion_meeting", "/pages", page,
+            idempotency_key=f"notion-event:{title}|{start_time.isoformat()}",
         )
+    except OutboundNotConfigured as e:
+        raise RuntimeError(f"Notion API is not configured: {e}")
 
-        print("📝 Added to Notion")
+    print("📝 Queued for Notion:", delivery["id"])
 
-    except Exception as e:
-        print("Notion Error:", e)
-        raise
+    return delivery["id"]
 
 
 # ---------------- CALENDAR ---------------- #
 
+def insert_calendar_event(service, event):
+
+    try:
+        created = service.events().insert(calendarId='primary', body=event).execute()
+
+    except HttpError as e:
+        # 409: an earlier attempt already created this id (its response was lost)
+        if e.resp.status != 409:
+            raise
+
+        created = service.events().get(calendarId='primary', eventId=event['id']).execute()
+
+        if created.get('status') == 'cancelled':
+            # Deleted events keep their id; bring this one back instead
+            created = service.events().update(
+                calendarId='primary', eventId=event['id'], body={**event, 'status': 'confirmed'}
+            ).execute()
+
+    calendar_index.record(created if created.get('start') else {**event, **created})
+
+    print("🎨 Added to Google Calendar")
+
+    return created.get('id')
+
+
 def create_calendar_event(title, start_time, intent_type, duration_minutes):
 
-    creds = get_credentials()
-    service = build('calendar', 'v3', credentials=creds)
+    service = google_service('calendar', 'v3')
 
     if event_exists(service, title, start_time):
         print("⚠ Duplicate event skipped")
-        return
+        return {
+            "status": "duplicate",
+            "created": False,
+            "calendar_event_id": None,
+            "message": f"{title} is already on the calendar.",
+            "targets": {},
+        }
 
     end_time = start_time + timedelta(minutes=duration_minutes)
 
     event = {
+        # Deterministic, so a retried insert can't create a second event
+        'id': event_id(title, start_time),
         'summary': title,
         'description': f"Created by AgentX ({intent_type})",
         'start': {'dateTime': start_time.isoformat(), 'timeZone': 'Asia/Kolkata'},
         'end': {'dateTime': end_time.isoformat(), 'timeZone': 'Asia/Kolkata'}
     }
 
-    service.events().insert(calendarId='primary', body=event).execute()
+    # Calendar insert, local save and Notion page run concurrently; each
+    # is retried on transient errors and reported on its own
+    results = run_targets({
+        "calendar": lambda: insert_calendar_event(service, event),
+        "local": lambda: save_event_locally(title, start_time),
+        "notion": lambda: add_to_notion(title, start_time),
+    })
+
+    labels = {"calendar": "Calendar insert", "local": "Local save", "notion": "Notion sync"}
+    failures = [f"{labels[name]} failed: {result.error}" for name, result in results.items() if not result.ok]
+    created = results["calendar"].ok
+
+    if not failures:
+        status, message = "ok", f"Added {title} to Calendar; Notion page queued."
+    elif created:
+        status, message = "partial", f"Added {title} to Calendar. " + " ".join(failures)
+    else:
+        status, message = "failed", " ".join(failures)
 
-    print("🎨 Added to Google Calendar")
+    if failures:
+        print("⚠", message)
 
-    save_event_locally(title, start_time)
-    add_to_notion(title, start_time)
+    return {
+        "status": status,
+        "created": created,
+        "calendar_event_id": results["calendar"].value,
+        "message": message,
+        "targets": {name: result.as_dict() for name, result in results.items()},
+    }
 
 
 # ---------------- EMAIL PROCESSOR ---------------- #
 
 def process_email(original_text, gmail, message_id):
 
-    text_lower = original_text.lower()
+    # Undated emails can't become events, so skip classifying them
+    when = find_event_time(original_text, IST)
+
+    if when is None:
+        mark_email_read(gmail, message_id)
+        return
 
-    detected_type = classify_email_type(original_text)
+    detected_type = email_classifier.classify(original_text, message_id=message_id)
 
-    if "exam" in text_lower:
-        detected_type = "exam"
-    elif "meeting" in text_lower:
-        detected_type = "meeting"
+    if detected_type is None:
+        # Gemini failed or skipped it; leave it unread so the sync retries
+        raise RuntimeError(f"Email {message_id} could not be classified; left unread")
 
     if detected_type == "none":
         mark_email_read(gmail, message_id)
         return
 
-    date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', original_text)
+    title = detected_type.capitalize()
 
-    if not date_match:
-        mark_email_read(gmail, message_id)
-        return
+    print(f"🔥 Detected {detected_type} → {title}")
 
-    date_obj = datetime.strptime(date_match.group(1), "%d/%m/%Y")
+    result = create_calendar_event(title, when.start, detected_type, when.duration_minutes)
 
-    time_match = re.search(r'(\d{1,2}:\d{2}\s*(am|pm))', text_lower)
+    if not result["created"] and result["status"] != "duplicate":
+        # Calendar (or auth) is down; keep the email unread for the next pass
+        raise RuntimeError(f"Email {message_id} left unread: {result['message']}")
 
-    if time_match:
-        time_obj = datetime.strptime(time_match.group(1), "%I:%M %p").time()
-    else:
-        time_obj = datetime.strptime("09:00", "%H:%M").time()
+    mark_email_read(gmail, message_id)
 
-    dt = datetime.combine(date_obj.date(), time_obj).replace(tzinfo=IST)
 
-    duration_minutes = 60
+# ---------------- EMAIL READER ---------------- #
 
-    title = detected_type.capitalize()
+def read_emails():
 
-    print(f"🔥 Detected {detected_type} → {title}")
+    gmail = google_service('gmail', 'v1')
 
-    create_calendar_event(title, dt, detected_type, duration_minutes)
+    fetcher = GmailFetcher(gmail)
 
-    mark_email_read(gmail, message_id)
+    ids = fetcher.list_ids(max_results=5)
 
+    print("Unread found:", len(ids))
 
-# ---------------- EMAIL READER ---------------- #
+    for msg_data in fetcher.get_messages(ids, format='full'):
 
-def read_emails():
+        handle_email_message(gmail, msg_data)
 
-    creds = get_credentials()
-    gmail = build('gmail', 'v1', credentials=creds)
 
-    results = gmail.users().messages().list(
-        userId='me',
-        labelIds=['UNREAD'],
-        maxResults=5
-    ).execute()
+def email_text_parts(msg_data):
 
-    messages = results.get('messages', [])
+    for part in msg_data['payload'].get('parts', []):
 
-    print("Unread found:", len(messages))
+        if part['mimeType'] == 'text/plain':
 
-    for msg in messages:
+            yield base64.urlsafe_b64decode(
+                part['body']['data']
+            ).decode()
 
-        msg_data = gmail.users().messages().get(
-            userId='me',
-            id=msg['id'],
-            format='full'
-        ).execute()
 
-        parts = msg_data['payload'].get('parts', [])
+def handle_email_message(gmail, msg_data):
 
-        for part in parts:
+    for text in email_text_parts(msg_data):
 
-            if part['mimeType'] == 'text/plain':
+        print("\nEMAIL:\n", text)
 
-                text = base64.urlsafe_b64decode(
-                    part['body']['data']
-                ).decode()
+        process_email(text, gmail, msg_data['id'])
 
-                print("\nEMAIL:\n", text)
 
-                process_email(text, gmail, msg['id'])
+def classify_email_batch(messages):
 
+    # Classify a fetched batch in one go; process_email then hits the cache
+    email_classifier.classify_many([
+        {"id": msg_data['id'], "text": text}
+        for msg_data in messages
+        for text in email_text_parts(msg_data)
+        if find_event_time(text, IST) is not None
+    ])
 
-# ---------------- REMINDER ---------------- #
 
-def check_reminders():
+# ---------------- MAILBOX SYNC ---------------- #
 
-    if not os.path.exists("events.json"):
-        return
+def sync_mailbox():
 
-    with open("events.json", "r") as f:
-        events = json.load(f)
+    # Handles every unread message added since the last checkpointed
+    # Gmail historyId, not just the newest few
+    gmail = google_service('gmail', 'v1')
+
+    result = get_mailbox_sync().sync(
+        gmail,
+        lambda message: handle_email_message(gmail, message),
+        before_batch=classify_email_batch,
+    )
+
+    print("Mailbox synced:", result)
+    print("Classifier:", email_classifier.stats())
+
+    return result
 
-    now = datetime.now(IST)
 
-    for event in events:
+# ---------------- REMINDER ---------------- #
 
-        event_time = datetime.fromisoformat(event["datetime"])
-        reminder_time = event_time - timedelta(hours=1)
+def notify_reminder(event, event_time):
 
-        if not event["reminded"] and reminder_time <= now < event_time:
+    if toaster:
+        toaster.show_toast(
+            "🔔 AgentX Reminder",
+            f"{event['title']} at {event_time.strftime('%H:%M')}",
+            duration=10,
+            threaded=True
+        )
 
-            if toaster:
-                toaster.show_toast(
-                    "🔔 AgentX Reminder",
-                    f"{event['title']} at {event_time.strftime('%H:%M')}",
-                    duration=10,
-                    threaded=True
-                )
+    send_whatsapp_message(event['title'], idempotency_key=f"reminder:{event['id']}")
 
-            send_whatsapp_message(event['title'])
 
-            event["reminded"] = True
+def check_reminders():
 
-    with open("events.json", "w") as f:
-        json.dump(events, f, indent=2)
+    # Pops only the reminders that are due; past events are archived
+    return reminders.fire_due(notify_reminder)
 
 
 # ---------------- MEETING SUMMARIZER ---------------- #
@@ -427,11 +477,11 @@ def automation_loop():
 
     print("🤖 AgentX Running...\n")
 
-    while True:
-        read_emails()
-        check_reminders()
-        print("Cycle done...\n")
-        time.sleep(300)
+    # Mailbox sync, reminders and insight refresh each run on their own
+    # timer, so a slow Gmail call no longer delays reminders
+    from backend.automation_daemon import main as run_automation_daemon
+
+    run_automation_daemon([])
 
 
 # ---------------- MAIN MENU ---------------- #
@@ -456,6 +506,7 @@ AgentX System
         choice = input("Select option: ")
 
         if choice == "1":
+            get_credentials(interactive=True)
             automation_loop()
 
         elif choice == "2":
@@ -7,6 +7,7 @@ if str(PROJECT_ROOT) not in sys.path:
 
 from backend.meeting_summarizer import summarize_meeting
 from backend.notion_writer import write_summary
+from backend.outbound_queue import get_outbound_queue
 
 
 # ---------------- SAMPLE TRANSCRIPT ---------------- #
@@ -45,8 +46,19 @@ def run_meeting_pipeline():
     print(summary)
 
     try:
-        write_summary(summary)
-        print("\n✅ Summary saved to Notion")
+        delivery = write_summary(summary)
+
+        # The queue's workers die with this process, so wait for the write
+        delivery = get_outbound_queue().wait(delivery["id"], timeout=60)
+
+        if delivery["status"] == "delivered":
+            print("\n✅ Summary saved to Notion")
+
+        elif delivery["status"] == "dead":
+            print("\n⚠ Failed to save to Notion:", delivery["last_error"])
+
+        else:
+            print("\n⚠ Notion is not answering; the summary stays queued and is sent on the next run")
 
     except Exception as e:
         print("\n⚠ Failed to save to Notion:", e)
@@ -1,24 +1,18 @@
-import requests
+import hashlib
 import os
 import json
 from datetime import datetime
 from dotenv import load_dotenv
 
+from backend.outbound_queue import get_outbound_queue
+
 load_dotenv()
 
-NOTION_SUMMARY_TOKEN = os.getenv("NOTION_SUMMARY_TOKEN")
 DATABASE_ID = os.getenv("MEETING_DATABASE_ID")
 
-headers = {
-    "Authorization": f"Bearer {NOTION_SUMMARY_TOKEN}",
-    "Content-Type": "application/json",
-    "Notion-Version": "2022-06-28"
-}
 
 def write_summary(summary):
 
-    url = "https://api.notion.com/v1/pages"
-
     data = {
         "parent": {"database_id": DATABASE_ID},
         "properties": {
@@ -85,10 +79,11 @@ def write_summary(summary):
         }
     }
 
-    response = requests.post(url, headers=headers, json=data)
+    # Delivered by the outbound queue (retries, dead letters); the same
+    # summary queued twice on one day is only written once
+    key = "notion-summary:" + hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()[:32]
+    delivery = get_outbound_queue().enqueue("notion_summary", "/pages", data, idempotency_key=key)
+
+    print("📨 Meeting summary queued for Notion:", delivery["id"])
 
-    if response.status_code == 200:
-        print("✅ Meeting summary saved to Notion")
-    else:
-        print("❌ Error writing to Notion")
-        print(response.text)
\ No newline at end of file
+    return delivery
@@ -0,0 +1,529 @@
+"""Outbound Queue — durable, retried delivery of Notion and WhatsApp writes.
+
+``write_summary`` posted to Notion with a fresh ``requests.post`` per call,
+inline in ``/pipeline/run``, with no timeout and no retry, and
+``add_to_notion`` / ``send_whatsapp_message`` made their calls inline too.
+Now callers ``enqueue`` a delivery and get its id back at once:
+
+- deliveries are rows in a SQLite (WAL) outbox, so they survive restarts;
+  a row claimed by a worker that died is picked up again once its lease
+  expires
+- worker threads send them through pooled ``requests.Session``
+  connections, with connect/read timeouts
+- 408/429/5xx responses and connection failures are retried with
+  exponential backoff (honouring ``Retry-After``); other 4xx responses
+  are not
+- every delivery has an idempotency key, and enqueueing the same key again
+  returns the existing delivery. Neither Notion's ``POST /pages`` nor
+  Twilio's ``Messages.json`` deduplicates on the wire, so for these targets
+  an error that may have come after the request reached the API (a read
+  timeout, a dropped connection) is not retried: it is dead-lettered for a
+  person to check. Only a target with an ``idempotency_header`` the API
+  honours is retried after such errors
+- deliveries that fail permanently or run out of attempts move to the
+  ``dead_letters`` table, from where ``retry_dead`` can requeue them
+- ``wait`` blocks until a delivery settles, for short-lived CLI callers
+  whose worker threads would otherwise die with the process
+
+Credentials are never stored: a :class:`Target` resolves its headers from
+the environment when sending. Base URLs honour ``{NAME}_API_ENDPOINT``
+overrides, which is how the tests point them at local stub servers.
+"""
+
+import base64
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+logger = logging.getLogger("outbound_queue")
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DB_FILE = PROJECT_ROOT / "outbox.db"
+
+WORKERS = 2
+MAX_ATTEMPTS = 6
+BACKOFF = 2.0              # seconds before the first retry, doubled each time
+MAX_BACKOFF = 300.0
+LEASE = 120.0              # seconds a claimed delivery stays claimed
+TIMEOUT = (5, 20)          # requests (connect, read) timeouts
+RETRY_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+MAX_BODY_CHARS = 2000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS deliveries (
+    id               TEXT PRIMARY KEY,
+    idempotency_key  TEXT NOT NULL UNIQUE,
+    target           TEXT NOT NULL,
+    method           TEXT NOT NULL,
+    path             TEXT NOT NULL,
+    payload          TEXT NOT NULL,
+    status           TEXT NOT NULL,
+    attempts         INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at  REAL NOT NULL,
+    claimed_until    REAL,
+    last_error       TEXT,
+    response_status  INTEGER,
+    response_body    TEXT,
+    created_at       TEXT NOT NULL,
+    delivered_at     TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_deliveries_due ON deliveries(status, next_attempt_at);
+CREATE TABLE IF NOT EXISTS dead_letters (
+    id               TEXT PRIMARY KEY,
+    idempotency_key  TEXT NOT NULL UNIQUE,
+    target           TEXT NOT NULL,
+    method           TEXT NOT NULL,
+    path             TEXT NOT NULL,
+    payload          TEXT NOT NULL,
+    attempts         INTEGER NOT NULL,
+    last_error       TEXT,
+    response_status  INTEGER,
+    response_body    TEXT,
+    created_at       TEXT NOT NULL,
+    failed_at        TEXT NOT NULL
+);
+"""
+
+_DELIVERY_COLUMNS = (
+    "id, idempotency_key, target, method, path, payload, status, attempts, next_attempt_at, "
+    "last_error, response_status, response_body, created_at, delivered_at"
+)
+_DEAD_COLUMNS = (
+    "id, idempotency_key, target, method, path, payload, attempts, "
+    "last_error, response_status, response_body, created_at, failed_at"
+)
+
+
+class OutboundNotConfigured(RuntimeError):
+    """The target's credentials are missing from the environment."""
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _never_sent(exc: requests.RequestException) -> bool:
+    """Whether *exc* happened before the request could reach the server."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, NewConnectionError)   # e.g. connection refused
+
+
+# ---------------------------------------------------------------------------
+# Targets
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Target:
+    name: str
+    base_url: str
+    headers: Callable[[], dict[str, str]]       # resolved per send; may raise OutboundNotConfigured
+    form: bool = False                          # form-encode the payload instead of JSON
+    idempotency_header: str | None = None       # only set if the API really deduplicates on it
+
+    def check(self) -> None:
+        self.headers()
+
+
+def _endpoint(name: str, default: str) -> str:
+    return (os.getenv(f"{name.upper()}_API_ENDPOINT") or default).rstrip("/")
+
+
+def _env(name: str) -> str:
+    value = os.getenv(name)
+    if not value:
+        raise OutboundNotConfigured(f"{name} is not set")
+    return value
+
+
+def _notion_headers(token_env: str) -> Callable[[], dict[str, str]]:
+    return lambda: {"Authorization": f"Bearer {_env(token_env)}", "Notion-Version": "2022-06-28"}
+
+
+def _twilio_headers() -> dict[str, str]:
+    credentials = f"{_env('TWILIO_ACCOUNT_SID')}:{_env('TWILIO_AUTH_TOKEN')}".encode()
+    return {"Authorization": "Basic " + base64.b64encode(credentials).decode()}
+
+
+def default_targets() -> dict[str, Target]:
+    notion = _endpoint("notion", "https://api.notion.com/v1")
+    return {
+        "notion_summary": Target("notion_summary", notion, _notion_headers("NOTION_SUMMARY_TOKEN")),
+        "notion_meeting": Target("notion_meeting", notion, _notion_headers("NOTION_MEETING_TOKEN")),
+        "twilio": Target(
+            "twilio",
+            _endpoint("twilio", "https://api.twilio.com/2010-04-01"),
+            _twilio_headers,
+            form=True,
+        ),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Queue
+# ---------------------------------------------------------------------------
+
+class OutboundQueue:
+    """SQLite outbox plus the worker threads that drain it."""
+
+    def __init__(
+        self,
+        db_path: Path = DB_FILE,
+        targets: dict[str, Target] | None = None,
+        workers: int = WORKERS,
+        max_attempts: int = MAX_ATTEMPTS,
+        backoff: float = BACKOFF,
+        max_backoff: float = MAX_BACKOFF,
+        lease: float = LEASE,
+        timeout: tuple[float, float] = TIMEOUT,
+    ):
+        self.db_path = Path(db_path)
+        self.targets = targets if targets is not None else default_targets()
+        self._workers = workers
+        self._max_attempts = max_attempts
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._lease = lease
+        self._timeout = timeout
+        self._local = threading.local()
+        self._wake = threading.Condition()
+        self._pending_wake = False
+        self._settled = threading.Condition()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._stats_lock = threading.Lock()
+        self._stats = {"sent": 0, "delivered": 0, "retried": 0, "dead": 0}
+        self._conn().executescript(_SCHEMA)
+
+    # -- storage --------------------------------------------------------
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _write(self):
+        """Run a block inside ``BEGIN IMMEDIATE`` … ``COMMIT``."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _session(self) -> requests.Session:
+        # One pooled session per worker thread; connections are reused
+        # across deliveries to the same host
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._local.session = session
+        return session
+
+    # -- producers ------------------------------------------------------
+
+    def enqueue(
+        self,
+        target: str,
+        path: str,
+        payload: dict[str, Any],
+        idempotency_key: str | None = None,
+        method: str = "POST",
+    ) -> dict[str, Any]:
+        """Queue a delivery and return ``{"id", "status", "duplicate"}`` at once.
+
+        Raises ``OutboundNotConfigured`` if *target*'s credentials are
+        missing, so nothing is queued that could never be sent.
+        """
+        if target not in self.targets:
+            raise KeyError(f"Unknown outbound target: {target}")
+        self.targets[target].check()
+        key = idempotency_key or uuid.uuid4().hex
+        delivery_id = uuid.uuid4().hex
+        with self._write() as conn:
+            existing = conn.execute(
+                "SELECT id, status FROM deliveries WHERE idempotency_key = ? "
+                "UNION ALL SELECT id, 'dead' FROM dead_letters WHERE idempotency_key = ?",
+                (key, key),
+            ).fetchone()
+            if existing is not None:
+                return {"id": existing[0], "status": existing[1], "duplicate": True}
+            conn.execute(
+                "INSERT INTO deliveries (id, idempotency_key, target, method, path, payload, status, "
+                "next_attempt_at, created_at) VALUES (?, ?, ?, ?, ?, ?, 'pending', ?, ?)",
+                (delivery_id, key, target, method, path, json.dumps(payload), time.time(), _now_iso()),
+            )
+        self._notify()
+        return {"id": delivery_id, "status": "pending", "duplicate": False}
+
+    def _notify(self) -> None:
+        with self._wake:
+            self._pending_wake = True
+            self._wake.notify()
+
+    # -- lookups --------------------------------------------------------
+
+    def get(self, delivery_id: str) -> dict[str, Any] | None:
+        conn = self._conn()
+        row = conn.execute(f"SELECT {_DELIVERY_COLUMNS} FROM deliveries WHERE id = ?", (delivery_id,)).fetchone()
+        if row is not None:
+            delivery = dict(zip([c.strip() for c in _DELIVERY_COLUMNS.split(",")], row))
+        else:
+            row = conn.execute(f"SELECT {_DEAD_COLUMNS} FROM dead_letters WHERE id = ?", (delivery_id,)).fetchone()
+            if row is None:
+                return None
+            delivery = dict(zip([c.strip() for c in _DEAD_COLUMNS.split(",")], row), status="dead")
+        delivery["payload"] = json.loads(delivery["payload"])
+        delivery.pop("next_attempt_at", None)
+        return delivery
+
+    def dead_letters(self, limit: int = 50) -> list[dict[str, Any]]:
+        rows = self._conn().execute(
+            f"SELECT {_DEAD_COLUMNS} FROM dead_letters ORDER BY failed_at DESC LIMIT ?", (limit,)
+        ).fetchall()
+        names = [c.strip() for c in _DEAD_COLUMNS.split(",")]
+        return [dict(zip(names, row), payload=json.loads(row[5])) for row in rows]
+
+    def retry_dead(self, delivery_id: str) -> bool:
+        """Move a dead letter back into the queue with a fresh attempt budget."""
+        with self._write() as conn:
+            row = conn.execute(
+                "SELECT id, idempotency_key, target, method, path, payload, created_at FROM dead_letters WHERE id = ?",
+                (delivery_id,),
+            ).fetchone()
+            if row is None:
+                return False
+            conn.execute("DELETE FROM dead_letters WHERE id = ?", (delivery_id,))
+            conn.execute(
+                "INSERT INTO deliveries (id, idempotency_key, target, method, path, payload, status, "
+                "next_attempt_at, created_at) VALUES (?, ?, ?, ?, ?, ?, 'pending', ?, ?)",
+                (*row[:6], time.time(), row[6]),
+            )
+        self._notify()
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        conn = self._conn()
+        counts = dict(conn.execute("SELECT status, COUNT(*) FROM deliveries GROUP BY status").fetchall())
+        counts["dead"] = conn.execute("SELECT COUNT(*) FROM dead_letters").fetchone()[0]
+        with self._stats_lock:
+            return {"queue": counts, "workers": len(self._threads), **self._stats}
+
+    # -- delivery -------------------------------------------------------
+
+    def _claim(self, now: float) -> tuple | None:
+        with self._write() as conn:
+            row = conn.execute(
+                "SELECT id, idempotency_key, target, method, path, payload, attempts FROM deliveries "
+                "WHERE (status = 'pending' AND next_attempt_at <= ?) "
+                "   OR (status = 'in_flight' AND claimed_until <= ?) "
+                "ORDER BY next_attempt_at LIMIT 1",
+                (now, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE deliveries SET status = 'in_flight', claimed_until = ?, attempts = attempts + 1 WHERE id = ?",
+                (now + self._lease, row[0]),
+            )
+        return row
+
+    def _send(self, target: Target, method: str, path: str, payload: dict, key: str) -> requests.Response:
+        headers = dict(target.headers())
+        if target.idempotency_header:
+            headers[target.idempotency_header] = key
+        body = {"data": payload} if target.form else {"json": payload}
+        return self._session().request(method, target.base_url + path, headers=headers, timeout=self._timeout, **body)
+
+    def _retry_delay(self, attempts: int, response: requests.Response | None) -> float:
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after is not None:
+            try:
+                return min(self._max_backoff, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        delay = min(self._max_backoff, self._backoff * 2 ** (attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def process_one(self) -> bool:
+        """Claim and attempt one due delivery; False if nothing was due."""
+        claimed = self._claim(time.time())
+        if claimed is None:
+            return False
+        delivery_id, key, target_name, method, path, payload, attempts = claimed
+        attempts += 1
+        response, error, retryable = None, None, False
+        try:
+            target = self.targets[target_name]
+            with self._stats_lock:
+                self._stats["sent"] += 1
+            response = self._send(target, method, path, json.loads(payload), key)
+            if response.ok:
+                self._finish(delivery_id, response)
+                return True
+            error = f"HTTP {response.status_code}"
+            retryable = response.status_code in RETRY_STATUSES
+        except KeyError:
+            error = f"Unknown outbound target: {target_name}"
+        except OutboundNotConfigured as exc:
+            error = str(exc)
+        except requests.RequestException as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            retryable = bool(target.idempotency_header) or _never_sent(exc)
+            if not retryable:
+                error += " (may have been delivered; not retried)"
+
+        if retryable and attempts < self._max_attempts:
+            self._reschedule(delivery_id, attempts, error, response)
+        else:
+            self._bury(delivery_id, error, response)
+        return True
+
+    def _finish(self, delivery_id: str, response: requests.Response) -> None:
+        with self._write() as conn:
+            conn.execute(
+                "UPDATE deliveries SET status = 'delivered', claimed_until = NULL, last_error = NULL, "
+                "response_status = ?, response_body = ?, delivered_at = ? WHERE id = ?",
+                (response.status_code, response.text[:MAX_BODY_CHARS], _now_iso(), delivery_id),
+            )
+        with self._stats_lock:
+            self._stats["delivered"] += 1
+        with self._settled:
+            self._settled.notify_all()
+
+    def _reschedule(self, delivery_id, attempts, error, response) -> None:
+        delay = self._retry_delay(attempts, response)
+        logger.info("Delivery %s failed (%s); retry %d in %.1fs", delivery_id, error, attempts, delay)
+        with self._write() as conn:
+            conn.execute(
+                "UPDATE deliveries SET status = 'pending', claimed_until = NULL, next_attempt_at = ?, "
+                "last_error = ?, response_status = ?, response_body = ? WHERE id = ?",
+                (
+                    time.time() + delay, error,
+                    response.status_code if response is not None else None,
+                    response.text[:MAX_BODY_CHARS] if response is not None else None,
+                    delivery_id,
+                ),
+            )
+        with self._stats_lock:
+            self._stats["retried"] += 1
+
+    def _bury(self, delivery_id, error, response) -> None:
+        logger.warning("Delivery %s dead-lettered: %s", delivery_id, error)
+        with self._write() as conn:
+            conn.execute(
+                "INSERT INTO dead_letters (id, idempotency_key, target, method, path, payload, attempts, "
+                "last_error, response_status, response_body, created_at, failed_at) "
+                "SELECT id, idempotency_key, target, method, path, payload, attempts, ?, ?, ?, created_at, ? "
+                "FROM deliveries WHERE id = ?",
+                (
+                    error,
+                    response.status_code if response is not None else None,
+                    response.text[:MAX_BODY_CHARS] if response is not None else None,
+                    _now_iso(),
+                    delivery_id,
+                ),
+            )
+            conn.execute("DELETE FROM deliveries WHERE id = ?", (delivery_id,))
+        with self._stats_lock:
+            self._stats["dead"] += 1
+        with self._settled:
+            self._settled.notify_all()
+
+    def wait(self, delivery_id: str, timeout: float = 60.0) -> dict[str, Any] | None:
+        """Block until *delivery_id* is delivered or dead, or *timeout* passes.
+
+        Returns the delivery as ``get`` does; it is still ``pending`` on a
+        timeout and stays queued for the next process that starts workers.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            delivery = self.get(delivery_id)
+            remaining = deadline - time.monotonic()
+            if delivery is None or delivery["status"] in ("delivered", "dead") or remaining <= 0:
+                return delivery
+            with self._settled:
+                # Re-checked after at most a second: another process may settle it
+                self._settled.wait(min(remaining, 1.0))
+
+    # -- workers --------------------------------------------------------
+
+    def _seconds_until_due(self) -> float | None:
+        row = self._conn().execute(
+            "SELECT MIN(CASE status WHEN 'pending' THEN next_attempt_at ELSE claimed_until END) "
+            "FROM deliveries WHERE status IN ('pending', 'in_flight')"
+        ).fetchone()
+        return None if row[0] is None else max(0.0, row[0] - time.time())
+
+    def _worker(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if self.process_one():
+                    continue
+                wait = self._seconds_until_due()
+            except Exception as exc:
+                logger.warning("Outbound worker error: %s", exc)
+                wait = 1.0
+            with self._wake:
+                # stop() sets the event before notifying; checked under the lock
+                if not self._pending_wake and not self._stop.is_set():
+                    self._wake.wait(min(wait, 30.0) if wait is not None else 30.0)
+                self._pending_wake = False
+
+    def start(self) -> "OutboundQueue":
+        if not self._threads:
+            self._stop.clear()
+            self._threads = [
+                threading.Thread(target=self._worker, name=f"outbound-{n}", daemon=True)
+                for n in range(self._workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        with self._wake:
+            self._wake.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+
+_queue: OutboundQueue | None = None
+_queue_lock = threading.Lock()
+
+
+def get_outbound_queue() -> OutboundQueue:
+    """Return the process-wide queue, starting its workers on first use."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = OutboundQueue().start()
+        return _queue
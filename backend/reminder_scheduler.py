@@ -0,0 +1,249 @@
+"""Reminder Scheduler — min-heap of upcoming reminders over events.json.
+
+``check_reminders`` used to load all of ``events.json``, parse every event
+ever saved and rewrite the whole file on every pass, changed or not. Here
+the file is loaded once into a heap of ``(when, action, event id)``
+entries:
+
+- ``remind`` at the event time minus ``lead`` (one hour)
+- ``archive`` at the event time, moving the event out of ``events.json``
+  and appending it to ``events_archive.jsonl``
+
+``fire_due`` pops only what is due, and ``seconds_until_next`` lets the
+caller sleep until exactly the next entry. A reminder is marked sent only
+once ``notify`` returns; a failed one is retried ``RETRY_DELAY`` later
+while its event is still ahead. ``events.json`` is written
+only when a record changes, and it holds only upcoming events, so it stays
+small. If another process rewrites it, the change is noticed by its mtime
+and the heap is rebuilt.
+"""
+
+import heapq
+import itertools
+import json
+import logging
+import os
+import tempfile
+import threading
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone, tzinfo
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("reminder_scheduler")
+
+EVENTS_FILE = Path(__file__).resolve().parent / "events.json"
+ARCHIVE_FILE = Path(__file__).resolve().parent / "events_archive.jsonl"
+REMINDER_LEAD = timedelta(hours=1)
+RETRY_DELAY = timedelta(minutes=1)
+
+
+class ReminderScheduler:
+    """Fires each saved event's reminder once, ``lead`` before it starts.
+
+    Naive event datetimes are read in *tz*. *clock* returns the current
+    aware datetime (tests pass a fake one).
+    """
+
+    def __init__(
+        self,
+        events_file: Path = EVENTS_FILE,
+        archive_file: Path = ARCHIVE_FILE,
+        tz: tzinfo = timezone.utc,
+        lead: timedelta = REMINDER_LEAD,
+        clock: Callable[[], datetime] | None = None,
+    ):
+        self._events_file = Path(events_file)
+        self._archive_file = Path(archive_file)
+        self._tz = tz
+        self._lead = lead
+        self._clock = clock or (lambda: datetime.now(self._tz))
+        self._lock = threading.RLock()
+        self._records: dict[str, dict[str, Any]] = {}
+        self._heap: list[tuple[datetime, int, str, str]] = []
+        self._seq = itertools.count()
+        self._mtime_ns: int | None = None
+        self._loaded = False
+        self._listeners: list[Callable[[], None]] = []
+        self._stats = {"loads": 0, "writes": 0, "fired": 0, "archived": 0}
+
+    # ------------------------------------------------------------------
+    # Loading and persistence
+    # ------------------------------------------------------------------
+
+    def _event_time(self, record: dict[str, Any]) -> datetime:
+        when = datetime.fromisoformat(record["datetime"])
+        return when if when.tzinfo else when.replace(tzinfo=self._tz)
+
+    def _push(self, key: str, record: dict[str, Any]) -> None:
+        event_time = self._event_time(record)
+        if not record.get("reminded"):
+            heapq.heappush(self._heap, (event_time - self._lead, next(self._seq), "remind", key))
+        heapq.heappush(self._heap, (event_time, next(self._seq), "archive", key))
+
+    def _current_mtime(self) -> int | None:
+        try:
+            return self._events_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _ensure_loaded(self) -> None:
+        # Caller holds the lock
+        if self._loaded and self._current_mtime() == self._mtime_ns:
+            return
+        records, needs_ids = {}, False
+        if self._events_file.exists():
+            try:
+                data = json.loads(self._events_file.read_text(encoding="utf-8") or "[]")
+            except (OSError, ValueError) as exc:
+                logger.warning("Ignoring unreadable %s: %s", self._events_file, exc)
+                data = []
+            for record in data if isinstance(data, list) else []:
+                try:
+                    self._event_time(record)
+                except (KeyError, TypeError, ValueError):
+                    logger.warning("Skipping event without a valid datetime: %r", record)
+                    continue
+                if not record.get("id"):
+                    record["id"], needs_ids = uuid.uuid4().hex[:12], True
+                records[record["id"]] = record
+        self._records = records
+        self._heap = []
+        for key, record in records.items():
+            self._push(key, record)
+        self._mtime_ns = self._current_mtime()
+        self._loaded = True
+        self._stats["loads"] += 1
+        if needs_ids:
+            self._write()
+
+    def _write(self) -> None:
+        # Caller holds the lock
+        self._events_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self._events_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(list(self._records.values()), f, indent=2)
+            os.replace(tmp, self._events_file)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._mtime_ns = self._current_mtime()
+        self._stats["writes"] += 1
+
+    def _archive(self, records: list[dict[str, Any]]) -> None:
+        with open(self._archive_file, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        self._stats["archived"] += len(records)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def add_listener(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Call *callback* whenever an event is added; returns an unsubscribe."""
+        with self._lock:
+            self._listeners.append(callback)
+
+        def _remove():
+            with self._lock:
+                if callback in self._listeners:
+                    self._listeners.remove(callback)
+
+        return _remove
+
+    def add(self, title: str, start_time: datetime) -> dict[str, Any]:
+        """Save an event and schedule its reminder."""
+        record = {
+            "id": uuid.uuid4().hex[:12],
+            "title": title,
+            "datetime": start_time.isoformat(),
+            "reminded": False,
+        }
+        with self._lock:
+            self._ensure_loaded()
+            self._records[record["id"]] = record
+            self._push(record["id"], record)
+            self._write()
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback()
+            except Exception as exc:
+                logger.warning("Reminder listener failed: %s", exc)
+        return record
+
+    def fire_due(self, notify: Callable[[dict[str, Any], datetime], None], now: datetime | None = None) -> list[dict[str, Any]]:
+        """Notify every reminder that is due and archive finished events.
+
+        A reminder is only sent while its event is still ahead; one missed
+        entirely (the daemon was down) is archived silently, as before.
+        ``notify`` runs outside the lock, and a reminder is only marked sent
+        once it returns; if it raises, the reminder is retried later.
+        Returns the events that were reminded.
+        """
+        due, finished, missed = [], [], False
+        with self._lock:
+            self._ensure_loaded()
+            now = now or self._clock()
+            while self._heap and self._heap[0][0] <= now:
+                _when, _seq, action, key = heapq.heappop(self._heap)
+                record = self._records.get(key)
+                if record is None:
+                    continue
+                if action == "archive":
+                    finished.append(self._records.pop(key))
+                elif not record.get("reminded"):
+                    if now < self._event_time(record):
+                        due.append((key, record))
+                    else:
+                        record["reminded"] = missed = True
+            if finished:
+                self._archive(finished)
+            if finished or missed:
+                self._write()
+
+        fired, failed = [], []
+        for key, record in due:
+            try:
+                notify(record, self._event_time(record))
+                fired.append(key)
+            except Exception as exc:
+                logger.warning("Reminder for %r failed; retrying in %s: %s", record.get("title"), RETRY_DELAY, exc)
+                failed.append(key)
+
+        if due:
+            with self._lock:
+                self._ensure_loaded()
+                for key in fired:
+                    if key in self._records:
+                        self._records[key]["reminded"] = True
+                for key in failed:
+                    if key in self._records:
+                        heapq.heappush(self._heap, (now + RETRY_DELAY, next(self._seq), "remind", key))
+                if fired:
+                    self._write()
+                self._stats["fired"] += len(fired)
+        return [record for key, record in due if key in fired]
+
+    def seconds_until_next(self, now: datetime | None = None) -> float | None:
+        """Seconds until the next reminder or archive entry, or None."""
+        with self._lock:
+            self._ensure_loaded()
+            while self._heap and self._heap[0][3] not in self._records:
+                heapq.heappop(self._heap)
+            if not self._heap:
+                return None
+            now = now or self._clock()
+            return max(0.0, (self._heap[0][0] - now).total_seconds())
+
+    def upcoming(self) -> list[dict[str, Any]]:
+        with self._lock:
+            self._ensure_loaded()
+            return sorted(self._records.values(), key=self._event_time)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats, scheduled=len(self._records), heap=len(self._heap))
@@ -0,0 +1,467 @@
+"""Task Store — SQLite (WAL) storage engine behind the Journal AI task API.
+
+Replaces whole-file rewrites of ``tasks.json`` with row-level transactions:
+- WAL journal so readers never block the single writer
+- ``BEGIN IMMEDIATE`` write transactions, so concurrent API writers queue
+  on the database lock instead of overwriting each other
+- Indexes on ``done`` and ``created_at`` for filtered listings
+- ``AUTOINCREMENT`` ids, so a deleted task's id is never handed out again
+- One-time migration of an existing ``tasks.json``
+- An id-indexed in-memory copy, loaded once per process, that serves
+  point lookups and listings without touching SQLite
+- Aggregate counters (total, completed, completions per day) updated in
+  the same transaction as each mutation, so stats are O(1) to serve
+- Sorted per-status id lists for filtered, cursor-paginated listings and
+  a version token that changes on every mutation (used as an ETag). New
+  ids follow ``created_at``, so a created range is bisected on those lists
+  (migrated tasks out of that order fall back to a scan)
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import uuid
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from backend.indexed_collection import IndexedCollection
+
+logger = logging.getLogger("task_store")
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DB_FILE = PROJECT_ROOT / "tasks.db"
+LEGACY_FILE = PROJECT_ROOT / "tasks.json"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    title        TEXT    NOT NULL,
+    done         INTEGER NOT NULL DEFAULT 0,
+    created_at   TEXT    NOT NULL,
+    completed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_tasks_done ON tasks(done);
+CREATE INDEX IF NOT EXISTS ix_tasks_created_at ON tasks(created_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS task_stats (
+    key   TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS completion_days (
+    day       TEXT PRIMARY KEY,
+    completed INTEGER NOT NULL
+);
+"""
+
+_COLUMNS = "id, title, done, created_at, completed_at"
+
+
+def _row_to_task(row) -> dict:
+    """Convert a ``tasks`` row to the dict shape the API has always returned."""
+    return {
+        "id": str(row[0]),
+        "title": row[1],
+        "done": bool(row[2]),
+        "created_at": row[3],
+        "completed_at": row[4],
+    }
+
+
+def _parse_id(task_id) -> int | None:
+    try:
+        return int(task_id)
+    except (TypeError, ValueError):
+        return None
+
+
+def _completion_day(task: dict | None) -> str | None:
+    """The YYYY-MM-DD a task counts towards, or None if it is not done."""
+    if not task or not task["done"] or not task.get("completed_at"):
+        return None
+    return task["completed_at"][:10]
+
+
+def _stats_delta(old: dict | None, new: dict | None) -> tuple[int, int, dict[str, int]]:
+    """Counter changes for replacing *old* with *new* (None = absent)."""
+    total = (new is not None) - (old is not None)
+    completed = bool(new and new["done"]) - bool(old and old["done"])
+    days: dict[str, int] = {}
+    for task, step in ((old, -1), (new, 1)):
+        day = _completion_day(task)
+        if day:
+            days[day] = days.get(day, 0) + step
+    return total, completed, {d: n for d, n in days.items() if n}
+
+
+class TaskStore:
+    """Transactional task storage backed by a single SQLite file.
+
+    Each thread gets its own connection; SQLite serialises writers and WAL
+    lets readers proceed concurrently. Reads are served from an in-memory
+    ``IndexedCollection`` that mirrors the table; it is loaded once and then
+    updated under ``_mutation_lock`` by each committed write, so it assumes
+    this process is the only writer.
+    """
+
+    def __init__(self, db_path: Path = DB_FILE, legacy_path: Path | None = LEGACY_FILE):
+        self.db_path = Path(db_path)
+        self.legacy_path = Path(legacy_path) if legacy_path else None
+        self._local = threading.local()
+        self._mutation_lock = threading.Lock()
+        self._conn().executescript(_SCHEMA)
+        self._migrate_legacy_json()
+        self._index = IndexedCollection(
+            _row_to_task(r)
+            for r in self._conn().execute(f"SELECT {_COLUMNS} FROM tasks ORDER BY id")
+        )
+        self._load_stats()
+        self._ids = {"all": [], "open": [], "done": []}
+        self._created_sorted = True   # created_at never decreases along the id lists
+        for task in self._index:
+            self._track(task, 1)
+        self._epoch = uuid.uuid4().hex[:8]
+        self._version = 0
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _write(self):
+        """Run a block inside ``BEGIN IMMEDIATE`` … ``COMMIT``."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+
+    def _migrate_legacy_json(self) -> None:
+        """Import ``tasks.json`` once, then rename it to ``tasks.json.migrated``."""
+        if self.legacy_path is None or not self.legacy_path.exists():
+            return
+        try:
+            tasks = json.loads(self.legacy_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as exc:
+            logger.warning("Skipping migration of unreadable %s: %s", self.legacy_path, exc)
+            return
+
+        with self._write() as conn:
+            done = conn.execute("SELECT 1 FROM meta WHERE key = 'migrated_from_json'").fetchone()
+            if done is None:
+                rows = [
+                    (
+                        _parse_id(t.get("id")),
+                        t.get("title", ""),
+                        int(bool(t.get("done"))),
+                        t.get("created_at") or datetime.now().isoformat(),
+                        t.get("completed_at"),
+                    )
+                    for t in tasks if isinstance(t, dict)
+                ]
+                conn.executemany(
+                    f"INSERT OR IGNORE INTO tasks ({_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('migrated_from_json', ?)",
+                    (datetime.now().isoformat(),),
+                )
+                logger.info("Migrated %d task(s) from %s", len(rows), self.legacy_path)
+
+        self.legacy_path.replace(self.legacy_path.with_name(self.legacy_path.name + ".migrated"))
+
+    # ------------------------------------------------------------------
+    # CRUD
+    # ------------------------------------------------------------------
+
+    def create(self, title: str) -> dict:
+        with self._mutation_lock:
+            # Stamped under the lock so ids and created_at rise together
+            created_at = datetime.now().isoformat()
+            with self._write() as conn:
+                cur = conn.execute(
+                    "INSERT INTO tasks (title, done, created_at) VALUES (?, 0, ?)",
+                    (title, created_at),
+                )
+                task = {
+                    "id": str(cur.lastrowid),
+                    "title": title,
+                    "done": False,
+                    "created_at": created_at,
+                    "completed_at": None,
+                }
+                delta = _stats_delta(None, task)
+                self._write_stats(conn, delta)
+            self._index.add(task)
+            self._after_write(None, task, delta)
+        return dict(task)
+
+    def get(self, task_id) -> dict | None:
+        task = self._index.get(task_id)
+        return dict(task) if task else None
+
+    def list_all(self) -> list[dict]:
+        return [dict(t) for t in self._index]
+
+    def update(self, task_id, data: dict) -> dict | None:
+        key = _parse_id(task_id)
+        with self._mutation_lock:
+            task = self._index.get(task_id)
+            if task is None:
+                return None
+            changed = dict(task)
+            if "title" in data:
+                changed["title"] = data["title"]
+            if "done" in data:
+                changed["done"] = bool(data["done"])
+                changed["completed_at"] = datetime.now().isoformat() if changed["done"] else None
+            delta = _stats_delta(task, changed)
+            with self._write() as conn:
+                conn.execute(
+                    "UPDATE tasks SET title = ?, done = ?, completed_at = ? WHERE id = ?",
+                    (changed["title"], int(changed["done"]), changed["completed_at"], key),
+                )
+                self._write_stats(conn, delta)
+            previous = dict(task)
+            task.update(changed)
+            self._after_write(previous, task, delta)
+        return dict(task)
+
+    def delete(self, task_id) -> bool:
+        with self._mutation_lock:
+            task = self._index.get(task_id)
+            if task is None:
+                return False
+            delta = _stats_delta(task, None)
+            with self._write() as conn:
+                conn.execute("DELETE FROM tasks WHERE id = ?", (_parse_id(task_id),))
+                self._write_stats(conn, delta)
+            self._index.remove(task_id)
+            self._after_write(task, None, delta)
+        return True
+
+    # ------------------------------------------------------------------
+    # Filtered listing
+    # ------------------------------------------------------------------
+
+    @property
+    def version(self) -> str:
+        """Opaque token that changes whenever any task changes."""
+        return f"{self._epoch}-{self._version}"
+
+    def query(
+        self,
+        status: str = "all",
+        created_after: str | None = None,
+        created_before: str | None = None,
+        text: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> dict:
+        """Return one page of tasks in id order, the cursor for the next
+        page and the stats, all taken under one lock.
+
+        *status* is ``"all"``, ``"open"`` or ``"done"``; the created range is
+        ``[created_after, created_before)`` on ISO timestamps; *text* is a
+        case-insensitive title substring. *cursor* is the ``next_cursor`` of
+        the previous page. Raises ValueError for an unknown status or a
+        malformed cursor.
+        """
+        if status not in ("all", "open", "done"):
+            raise ValueError(f"Unknown status filter: {status}")
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be at least 1")
+        after_id = 0
+        if cursor:
+            after_id = _parse_id(cursor)
+            if after_id is None:
+                raise ValueError(f"Invalid cursor: {cursor}")
+        needle = text.strip().lower() if text else ""
+
+        with self._mutation_lock:
+            ids = self._ids[status]
+            start, stop = bisect_right(ids, after_id), len(ids)
+            ranged = self._created_sorted and (created_after or created_before)
+            if ranged:
+                def created(task_id):
+                    return self._index.get(task_id)["created_at"]
+
+                if created_after:
+                    start = max(start, bisect_left(ids, created_after, key=created))
+                if created_before:
+                    stop = bisect_left(ids, created_before, key=created)
+            page, next_cursor = [], None
+            for position in range(start, stop):
+                task = self._index.get(ids[position])
+                if not ranged:
+                    if created_after and task["created_at"] < created_after:
+                        continue
+                    if created_before and task["created_at"] >= created_before:
+                        continue
+                if needle and needle not in task["title"].lower():
+                    continue
+                if limit is not None and len(page) == limit:
+                    next_cursor = page[-1]["id"]
+                    break
+                page.append(dict(task))
+            return {
+                "tasks": page,
+                "next_cursor": next_cursor,
+                "stats": self._stats_locked(date.today()),
+                "version": self.version,
+            }
+
+    def _after_write(self, old: dict | None, new: dict | None, delta) -> None:
+        """Bring the status lists, counters and version up to date."""
+        if old is not None:
+            self._track(old, -1)
+        if new is not None:
+            self._track(new, 1)
+        self._apply_stats(delta)
+        self._version += 1
+
+    def _track(self, task: dict, step: int) -> None:
+        """Add (step=1) or remove (step=-1) a task in the sorted id lists."""
+        task_id = int(task["id"])
+        if step > 0 and self._ids["all"] and task_id > self._ids["all"][-1]:
+            last = self._index.get(self._ids["all"][-1])
+            if last is not None and task["created_at"] < last["created_at"]:
+                self._created_sorted = False
+        for key in ("all", "done" if task["done"] else "open"):
+            ids = self._ids[key]
+            if step > 0:
+                insort(ids, task_id)
+            else:
+                ids.pop(bisect_right(ids, task_id) - 1)
+
+    # ------------------------------------------------------------------
+    # Aggregates
+    # ------------------------------------------------------------------
+
+    def stats(self, today: date | None = None) -> dict:
+        """Return total / completed / pending / progress / streak in O(1).
+
+        The streak walks the per-day histogram back from *today*; the
+        result is cached until the histogram or the date changes.
+        """
+        with self._mutation_lock:
+            return self._stats_locked(today or date.today())
+
+    def completion_histogram(self) -> dict[str, int]:
+        """Return ``{YYYY-MM-DD: tasks completed that day}``."""
+        with self._mutation_lock:
+            return dict(self._days)
+
+    def _stats_locked(self, today: date) -> dict:
+        total, completed = self._total, self._completed
+        return {
+            "total": total,
+            "completed": completed,
+            "pending": total - completed,
+            "progress": round((completed / total) * 100, 1) if total > 0 else 0.0,
+            "streak": self._streak(today),
+        }
+
+    def _streak(self, today: date) -> int:
+        key = (today, self._days_version)
+        if self._streak_cache[0] != key:
+            streak = 0
+            check = today
+            while self._days.get(check.isoformat(), 0) > 0:
+                streak += 1
+                check -= timedelta(days=1)
+            self._streak_cache = (key, streak)
+        return self._streak_cache[1]
+
+    def _load_stats(self) -> None:
+        """Load persisted counters, rebuilding them if they are missing."""
+        conn = self._conn()
+        counters = dict(conn.execute("SELECT key, value FROM task_stats").fetchall())
+        if "total" not in counters:
+            with self._write() as conn:
+                self._rebuild_stats(conn)
+            counters = dict(conn.execute("SELECT key, value FROM task_stats").fetchall())
+        self._total = counters["total"]
+        self._completed = counters["completed"]
+        self._days = dict(conn.execute("SELECT day, completed FROM completion_days").fetchall())
+        self._days_version = 0
+        self._streak_cache = (None, 0)
+
+    def _rebuild_stats(self, conn) -> None:
+        """Recompute every counter from the tasks table (one full scan)."""
+        total, completed = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(done), 0) FROM tasks"
+        ).fetchone()
+        conn.execute("DELETE FROM task_stats")
+        conn.executemany(
+            "INSERT INTO task_stats (key, value) VALUES (?, ?)",
+            [("total", total), ("completed", completed)],
+        )
+        conn.execute("DELETE FROM completion_days")
+        conn.execute(
+            "INSERT INTO completion_days (day, completed) "
+            "SELECT substr(completed_at, 1, 10), COUNT(*) FROM tasks "
+            "WHERE done = 1 AND completed_at IS NOT NULL GROUP BY 1"
+        )
+
+    def _write_stats(self, conn, delta) -> None:
+        total, completed, days = delta
+        if total:
+            conn.execute("UPDATE task_stats SET value = value + ? WHERE key = 'total'", (total,))
+        if completed:
+            conn.execute("UPDATE task_stats SET value = value + ? WHERE key = 'completed'", (completed,))
+        for day, step in days.items():
+            conn.execute(
+                "INSERT INTO completion_days (day, completed) VALUES (?, ?) "
+                "ON CONFLICT(day) DO UPDATE SET completed = completed + excluded.completed",
+                (day, step),
+            )
+            conn.execute("DELETE FROM completion_days WHERE day = ? AND completed <= 0", (day,))
+
+    def _apply_stats(self, delta) -> None:
+        total, completed, days = delta
+        self._total += total
+        self._completed += completed
+        for day, step in days.items():
+            count = self._days.get(day, 0) + step
+            if count > 0:
+                self._days[day] = count
+            else:
+                self._days.pop(day, None)
+        if days:
+            self._days_version += 1
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_task_store() -> TaskStore:
+    """Return the process-wide TaskStore, opening (and migrating) on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = TaskStore()
+        return _store
@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from backend import automation_daemon
+from backend.automation_daemon import Job, Scheduler
+
+
+def _run_for(scheduler, seconds):
+    async def scenario():
+        stop = asyncio.Event()
+        asyncio.get_running_loop().call_later(seconds, stop.set)
+        await scheduler.run(stop)
+
+    asyncio.run(scenario())
+    return scheduler.metrics()["jobs"]
+
+
+def test_slow_blocking_job_does_not_delay_fast_job():
+    ticks = []
+    release = threading.Event()
+
+    def slow_sync():
+        release.wait(2)
+
+    async def reminders():
+        ticks.append(time.perf_counter())
+
+    scheduler = Scheduler([
+        Job("mailbox_sync", slow_sync, interval=0.05, timeout=0.1),
+        Job("reminders", reminders, interval=0.02),
+    ])
+    threading.Timer(0.35, release.set).start()
+    jobs = _run_for(scheduler, 0.3)
+
+    assert len(ticks) >= 10
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.1
+    sync = jobs["mailbox_sync"]
+    # Timed out once; the thread kept its slot so later ticks were skipped
+    assert (sync["runs"], sync["timed_out"]) == (1, 1)
+    assert sync["skipped"] >= 3
+
+
+def test_failures_timeouts_and_concurrency_are_counted():
+    active, peak = 0, 0
+
+    async def flaky():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            active -= 1
+        raise RuntimeError("quota")
+
+    async def hangs():
+        await asyncio.sleep(10)
+
+    scheduler = Scheduler([
+        Job("flaky", flaky, interval=0.01, concurrency=2),
+        Job("hangs", hangs, interval=0.05, timeout=0.02, run_at_start=False),
+    ])
+    jobs = _run_for(scheduler, 0.2)
+
+    assert peak == 2
+    assert jobs["flaky"]["failed"] == jobs["flaky"]["runs"] >= 4
+    assert jobs["flaky"]["skipped"] > 0
+    assert jobs["flaky"]["last_error"] == "RuntimeError: quota"
+    assert jobs["hangs"]["timed_out"] == jobs["hangs"]["runs"] >= 2
+    assert jobs["hangs"]["max_duration_ms"] < 100
+
+
+def test_default_jobs_have_independent_timers():
+    jobs = {job.name: job for job in automation_daemon.default_jobs()}
+
+    assert set(jobs) == {"mailbox_sync", "reminders", "insight_refresh"}
+    assert jobs["reminders"].interval < jobs["mailbox_sync"].interval
+    assert all(job.timeout and job.timeout < job.interval for job in jobs.values())
+
+
+def test_reminder_job_sleeps_until_next_reminder_and_wakes_on_new_events(tmp_path):
+    from backend.reminder_scheduler import ReminderScheduler
+
+    reminders_lead = timedelta(seconds=0.2)
+    reminders = ReminderScheduler(tmp_path / "events.json", tmp_path / "archive.jsonl", lead=reminders_lead)
+    fired = []
+
+    def check():
+        reminders.fire_due(lambda event, when: fired.append((event["title"], datetime.now(timezone.utc) - (when - reminders_lead))))
+
+    scheduler = Scheduler([
+        Job("reminders", check, interval=60, next_delay=reminders.seconds_until_next, wake_on=reminders.add_listener),
+    ])
+
+    async def scenario():
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, reminders.add, "Standup", datetime.now(timezone.utc) + timedelta(seconds=0.4))
+        loop.call_later(0.35, stop.set)
+        await scheduler.run(stop)
+
+    asyncio.run(scenario())
+
+    assert [title for title, _late in fired] == ["Standup"]
+    assert fired[0][1] < timedelta(seconds=0.1)
+    assert scheduler.metrics()["jobs"]["reminders"]["runs"] == 2
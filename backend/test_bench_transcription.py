@@ -0,0 +1,47 @@
+import json
+from unittest.mock import patch
+
+from backend import bench_transcription
+from backend import live_transcript
+
+
+class _FakeEngine:
+    backend = "fake"
+
+    def __init__(self):
+        self.sample_counts = []
+
+    def ensure_initialized(self):
+        return True
+
+    def transcribe(self, samples, language="en"):
+        self.sample_counts.append(len(samples))
+        return {"transcript": "hello", "segments": [{"text": "hello"}]}
+
+
+def test_synthetic_audio_decodes_at_source_rate_with_pauses():
+    audio = bench_transcription.synthesize_speech_like(3.0)
+
+    # The soundfile fallback keeps the source rate (ffmpeg would resample)
+    with patch.object(live_transcript, "PYDUB_AVAILABLE", False), \
+         patch.object(live_transcript, "_check_ffmpeg", return_value=False):
+        data, sample_rate = live_transcript.convert_audio_to_float32(audio)
+
+    assert sample_rate == bench_transcription.SYNTH_SAMPLE_RATE
+    assert len(data) == 3 * sample_rate
+    assert abs(data[2 * sample_rate:]).max() == 0.0
+    assert abs(data[:sample_rate]).max() > 0.1
+
+
+def test_run_benchmark_reports_stages_rtf_and_concurrency():
+    engine = _FakeEngine()
+    audio = bench_transcription.synthesize_speech_like(2.0)
+
+    report = bench_transcription.run_benchmark(audio, engine=engine, repeat=2, concurrency=2, requests=3)
+
+    assert set(report["stages"]) == {"decode", "resample", "model", "total"}
+    assert report["audio_seconds"] == 2.0
+    assert report["real_time_factor"]["end_to_end"] > 0
+    assert report["concurrency"]["requests"] == 3
+    assert set(engine.sample_counts) == {32000}
+    json.dumps(report)
@@ -0,0 +1,110 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from backend import calendar_sync
+
+IST = timezone(timedelta(hours=5, minutes=30))
+
+
+class FakeHttpError(Exception):
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.resp = SimpleNamespace(status=status)
+
+
+class FakeCalendar:
+    """events().list with paging and sync tokens, like the discovery client."""
+
+    def __init__(self):
+        self.stored = {}
+        self.changed = []          # ids changed since the last token
+        self.token = 0
+        self.calls = []
+
+    def put(self, event_id, summary, start, status="confirmed"):
+        self.stored[event_id] = {"id": event_id, "summary": summary, "status": status,
+                                 "start": {"dateTime": start.isoformat()}}
+        self.changed.append(event_id)
+
+    def events(self):
+        return SimpleNamespace(list=self._list)
+
+    def _list(self, calendarId, maxResults, pageToken=None, syncToken=None, **params):
+        def _execute():
+            self.calls.append("sync" if syncToken else "full")
+            if syncToken and int(syncToken) < self.token:
+                raise FakeHttpError(410)
+            if syncToken:
+                items = [self.stored[i] for i in dict.fromkeys(self.changed)]
+            else:
+                items = [e for e in self.stored.values() if e["status"] != "cancelled"]
+            start = int(pageToken or 0)
+            page = {"items": items[start:start + maxResults]}
+            if start + maxResults < len(items):
+                page["nextPageToken"] = str(start + maxResults)
+            else:
+                self.changed.clear()
+                page["nextSyncToken"] = str(self.token)
+            return page
+        return SimpleNamespace(execute=_execute)
+
+
+def test_duplicate_checks_are_local_and_follow_incremental_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(calendar_sync, "PAGE_SIZE", 2)
+    calendar = FakeCalendar()
+    start = datetime(2026, 4, 11, 10, 30, tzinfo=IST)
+    for n in range(5):
+        calendar.put(f"e{n}", f"Event {n}", start + timedelta(hours=n))
+    clock = SimpleNamespace(now=0.0)
+    index = calendar_sync.CalendarIndex(tmp_path / "index.json", max_age=60, clock=lambda: clock.now)
+
+    assert index.contains(calendar, "event 0", start.astimezone(timezone.utc) + timedelta(seconds=20))
+    assert not index.contains(calendar, "Event 0", start + timedelta(minutes=1))
+    assert calendar.calls == ["full"] * 3        # one paged listing, then local lookups
+
+    calendar.put("e0", "Event 0", start, status="cancelled")
+    calendar.put("e9", "Standup", start)
+    index.record({"id": "mine", "summary": "Review", "start": {"dateTime": start.isoformat()}})
+    assert index.contains(calendar, "Review", start)
+    assert index.contains(calendar, "Event 0", start)       # not re-synced yet
+    clock.now = 61
+    assert not index.contains(calendar, "Event 0", start)
+    assert index.contains(calendar, "Standup", start)
+    assert calendar.calls[3:] == ["sync"]
+
+    # A restarted process resumes from the saved token; an expired token relists
+    calendar.token = 1
+    reloaded = calendar_sync.CalendarIndex(tmp_path / "index.json", clock=lambda: clock.now)
+    assert reloaded.contains(calendar, "Standup", start)
+    assert calendar.calls[4:] == ["sync", "full", "full", "full"]
+    assert reloaded.stats()["full_syncs"] == 1
+
+
+def test_targets_run_concurrently_with_retry_only_on_transient_errors():
+    barrier = threading.Barrier(3, timeout=2)
+    attempts = {"calendar": 0}
+
+    def calendar():
+        attempts["calendar"] += 1
+        if attempts["calendar"] == 1:
+            barrier.wait()
+            raise FakeHttpError(503)
+        return "evt-1"
+
+    def local():
+        barrier.wait()
+        return {"id": "local"}
+
+    def notion():
+        barrier.wait()
+        raise RuntimeError("Notion API is not configured.")
+
+    results = calendar_sync.run_targets(
+        {"calendar": calendar, "local": local, "notion": notion}, retries=2, backoff=0.01
+    )
+
+    assert (results["calendar"].ok, results["calendar"].attempts, results["calendar"].value) == (True, 2, "evt-1")
+    assert results["local"].ok
+    assert (results["notion"].ok, results["notion"].attempts) == (False, 1)
+    assert results["notion"].error == "Notion API is not configured."
@@ -0,0 +1,68 @@
+from backend import email_classifier
+
+
+def _emails(count, prefix="Please review the attached document"):
+    return [{"id": f"m{n}", "subject": f"Update {n}", "text": f"{prefix} #{n}"} for n in range(count)]
+
+
+def test_rules_cache_and_batches_keep_llm_calls_low(tmp_path):
+    calls = []
+
+    def _llm(texts):
+        calls.append(len(texts))
+        return ["task" if "#3" in text else "none" for text in texts]
+
+    cache_file = tmp_path / "classifications.json"
+    classifier = email_classifier.EmailClassifier(_llm, cache_file=cache_file, max_batch=20)
+    emails = _emails(40) + [
+        {"id": "exam", "subject": "Reminder", "text": "Your exam is on 11/04/2026"},
+        {"id": "meet", "subject": "Sync", "text": "Join via https://meet.google.com/abc-defg-hij"},
+    ]
+
+    types, report = classifier.classify_many(emails)
+
+    assert calls == [20, 20]
+    assert types[3] == "task" and types[0] == "none"
+    assert types[-2:] == ["exam", "meeting"]
+    assert report == {"emails": 42, "rule_hits": 2, "cache_hits": 0, "llm_emails": 40, "llm_calls": 2}
+
+    _types, again = classifier.classify_many(emails)
+    assert (again["cache_hits"], again["llm_calls"]) == (40, 0)
+
+    reloaded = email_classifier.EmailClassifier(_llm, cache_file=cache_file)
+    assert reloaded.classify("Please review the attached document #3", "m3", "Update 3") == "task"
+    assert reloaded.classify("Edited body", "m3", "Update 3") == "none"
+    assert calls == [20, 20, 1]
+    assert reloaded.stats()["llm_calls_per_email"] == 0.5
+
+
+def test_failed_llm_batches_are_not_cached():
+    outcomes = [RuntimeError("quota"), ["payment"]]
+
+    def _llm(texts):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    classifier = email_classifier.EmailClassifier(_llm, cache_file=None)
+    email = {"id": "m1", "subject": "Invoice", "text": "Amount due by 30/04/2026"}
+
+    assert classifier.classify_many([email])[0] == [None]
+    assert classifier.classify_many([email])[0] == ["payment"]
+    assert classifier.classify_many([email])[1]["cache_hits"] == 1
+
+
+def test_emails_left_out_of_the_reply_are_retried_alone():
+    calls = []
+
+    def _llm(texts):
+        calls.append(len(texts))
+        return [None, "task"] if len(texts) == 2 else ["payment"]
+
+    classifier = email_classifier.EmailClassifier(_llm, cache_file=None)
+    emails = _emails(2)
+
+    assert classifier.classify_many(emails)[0] == [None, "task"]
+    assert classifier.classify_many(emails)[0] == ["payment", "task"]
+    assert calls == [2, 1]
@@ -0,0 +1,55 @@
+from datetime import date, time, timezone
+
+from backend import bench_email_extract, email_extract
+
+TODAY = date(2026, 4, 8)   # a Wednesday
+
+
+def test_extracts_every_form_with_offsets():
+    text = "Interview on 11/04/2026 at 10:30 am for 2 hours; backup 5th of May 3 p.m. (half an hour)"
+    found = email_extract.extract_candidates(text, TODAY)
+
+    assert [(c.kind, c.value) for c in found] == [
+        ("date", date(2026, 4, 11)),
+        ("time", time(10, 30)),
+        ("duration", 120),
+        ("date", date(2026, 5, 5)),
+        ("time", time(15, 0)),
+        ("duration", 30),
+    ]
+    assert all(text[c.start:c.end] == c.text for c in found)
+    assert found[3].text == "5th of May"
+
+    relative = email_extract.extract_candidates("Standup TOMORROW at noon, review Next Wednesday 17:30", TODAY)
+    assert [c.value for c in relative] == [date(2026, 4, 9), time(12, 0), date(2026, 4, 15), time(17, 30)]
+
+
+def test_find_event_time_picks_nearest_time_and_skips_bad_dates():
+    text = "Sent 09:15. Ignore 31/02/2026. The demo is on April 20th 2026, at 2pm, for 45 mins."
+    when = email_extract.find_event_time(text, timezone.utc, today=TODAY)
+
+    assert when.start.isoformat() == "2026-04-20T14:00:00+00:00"
+    assert when.duration_minutes == 45
+    assert email_extract.find_event_time("No date here, just 3pm", timezone.utc, today=TODAY) is None
+
+    default = email_extract.find_event_time("Due 2026-04-30", timezone.utc, today=TODAY)
+    assert (default.start.time(), default.duration_minutes) == (time(9, 0), 60)
+
+
+def test_absolute_dates_win_over_relative_words():
+    when = email_extract.find_event_time("Sale ends today! Meeting on 20/04/2026 at 3pm", timezone.utc, today=TODAY)
+    assert when.start.isoformat() == "2026-04-20T15:00:00+00:00"
+
+    call = email_extract.find_event_time("call in a minute re: exam 12/05/2026", timezone.utc, today=TODAY)
+    assert (call.start.date(), call.duration_minutes) == (date(2026, 5, 12), 60)
+
+    fallback = email_extract.find_event_time("Standup tomorrow at 10am", timezone.utc, today=TODAY)
+    assert fallback.start.isoformat() == "2026-04-09T10:00:00+00:00"
+
+
+def test_benchmark_report_shape():
+    report = bench_email_extract.run_benchmark(bench_email_extract.synthesize_corpus(50))
+
+    assert report["emails"] == 50
+    assert report["extractor"]["dated"] == report["per_form"]["dated"] == 40
+    assert report["extractor"]["dated"] > report["legacy"]["dated"]
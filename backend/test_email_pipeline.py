@@ -2,6 +2,8 @@ from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import patch
 
+import pytest
+
 from backend import api as backend_api
 from backend import main as backend_main
 
@@ -74,6 +76,7 @@ def test_create_calendar_event_returns_partial_when_notion_sync_fails():
     with patch.object(backend_main, "get_credentials", return_value=object()), \
          patch.object(backend_main, "build", return_value=FakeService()), \
          patch.object(backend_main, "event_exists", return_value=False), \
+         patch.object(backend_main.calendar_index, "record"), \
          patch.object(backend_main, "save_event_locally"), \
          patch.object(backend_main, "add_to_notion", side_effect=RuntimeError("Notion offline")):
         result = backend_main.create_calendar_event(
@@ -90,6 +93,41 @@ def test_create_calendar_event_returns_partial_when_notion_sync_fails():
     assert inserted_payload["body"]["summary"] == "Demo Event"
 
 
+def test_retried_calendar_insert_reuses_the_event_it_already_created():
+    from googleapiclient.errors import HttpError
+
+    stored = {}
+
+    class FakeEventsApi:
+        def insert(self, calendarId, body):
+            def _execute():
+                if body["id"] in stored:
+                    raise HttpError(SimpleNamespace(status=409, reason="Conflict"), b"duplicate")
+                stored[body["id"]] = body
+                raise TimeoutError("response lost")
+            return SimpleNamespace(execute=_execute)
+
+        def get(self, calendarId, eventId):
+            return SimpleNamespace(execute=lambda: dict(stored[eventId], status="confirmed"))
+
+    class FakeService:
+        def events(self):
+            return FakeEventsApi()
+
+    start = datetime(2026, 4, 11, 10, 30, tzinfo=backend_main.IST)
+    with patch.object(backend_main, "google_service", return_value=FakeService()), \
+         patch.object(backend_main, "event_exists", return_value=False), \
+         patch.object(backend_main.calendar_index, "record"), \
+         patch.object(backend_main, "save_event_locally"), \
+         patch.object(backend_main, "add_to_notion"):
+        result = backend_main.create_calendar_event("Demo Event", start, "meeting", 45)
+
+    assert result["status"] == "ok"
+    assert result["targets"]["calendar"]["attempts"] == 2
+    assert list(stored) == [result["calendar_event_id"]]
+    assert result["calendar_event_id"] == backend_main.event_id("demo event ", start)
+
+
 def test_read_emails_returns_structured_email_records():
     message_payload = {
         "payload": {
@@ -154,4 +192,28 @@ def test_scan_emails_returns_clean_response_shape():
         "emails": fake_emails,
         "events": [],
         "scanned_count": 1,
-    }
\ No newline at end of file
+    }
+
+def test_process_email_leaves_unclassified_mail_unread():
+    from backend.email_classifier import EmailClassifier
+
+    def _outage(_texts):
+        raise RuntimeError("503 from Gemini")
+
+    gmail = SimpleNamespace(users=lambda: (_ for _ in ()).throw(AssertionError("marked read")))
+    with patch.object(backend_main, "email_classifier", EmailClassifier(_outage, cache_file=None)), \
+         patch.object(backend_main, "create_calendar_event") as create:
+        with pytest.raises(RuntimeError, match="could not be classified"):
+            backend_main.process_email("Payment due on 12/12/2026 at 10:00 am", gmail, "m1")
+
+    create.assert_not_called()
+
+
+def test_process_email_leaves_mail_unread_when_the_calendar_insert_fails():
+    failed = {"status": "failed", "created": False, "message": "Calendar insert failed: HTTP 503"}
+    gmail = SimpleNamespace(users=lambda: (_ for _ in ()).throw(AssertionError("marked read")))
+
+    with patch.object(backend_main.email_classifier, "classify", return_value="payment"), \
+         patch.object(backend_main, "create_calendar_event", return_value=failed):
+        with pytest.raises(RuntimeError, match="HTTP 503"):
+            backend_main.process_email("Payment due on 12/12/2026 at 10:00 am", gmail, "m1")
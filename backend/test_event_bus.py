@@ -0,0 +1,92 @@
+import asyncio
+from unittest.mock import patch
+
+from backend import event_bus
+from backend import insight_agent
+from backend import insight_store
+from backend import journal_ai
+from backend import task_store
+
+
+def test_subscribers_receive_events_and_resume_from_last_event_id():
+    bus = event_bus.EventBus(history_size=3)
+
+    async def scenario():
+        live, replay = bus.subscribe()
+        bus.publish("task.created", {"n": 1})
+        first = await live.next_event(timeout=1)
+        for n in range(2, 5):
+            bus.publish("task.updated", {"n": n})
+
+        _resumed, resumed_replay = bus.subscribe(last_event_id=f"{bus.epoch}-2")
+        _stale, stale_replay = bus.subscribe(last_event_id=0)
+        _restarted, restarted_replay = bus.subscribe(last_event_id="0badcafe-3")
+        _legacy, legacy_replay = bus.subscribe(last_event_id="3")
+        return replay, first, resumed_replay, stale_replay, restarted_replay, legacy_replay
+
+    replay, first, resumed, stale, restarted, legacy = asyncio.run(scenario())
+
+    assert replay == []
+    assert (first.id, first.topic, first.data) == (1, "task.created", {"n": 1})
+    assert [e.id for e in resumed] == [3, 4]
+    assert [e.topic for e in stale] == ["reset"]
+    assert [e.topic for e in restarted] == ["reset"]
+    assert [e.topic for e in legacy] == ["reset"]
+    assert first.event_id == f"{bus.epoch}-1"
+
+
+def test_slow_subscriber_is_dropped_without_blocking_publishers():
+    bus = event_bus.EventBus(queue_size=2)
+
+    async def scenario():
+        slow, _ = bus.subscribe()
+        for n in range(5):
+            bus.publish("tick", {"n": n})
+        await asyncio.sleep(0)
+        received = []
+        while (event := await slow.next_event(timeout=0.1)) is not None:
+            received.append(event.id)
+        return slow, received
+
+    slow, received = asyncio.run(scenario())
+
+    assert slow.overflowed and slow.closed
+    assert received == [1, 2]
+    assert bus.stats()["subscribers"] == 0
+
+
+def test_task_mutations_and_insight_deltas_are_published(tmp_path):
+    bus = event_bus.EventBus()
+    seen = []
+    bus.add_listener(lambda event: seen.append((event.topic, event.data)))
+    store = task_store.TaskStore(tmp_path / "tasks.db", legacy_path=None)
+
+    with patch.object(event_bus, "_bus", bus), patch.object(task_store, "_store", store):
+        task = journal_ai.create_task("write tests")
+        journal_ai.update_task(task["id"], {"done": True})
+        journal_ai.delete_task(task["id"])
+        journal_ai.delete_task("404")
+
+    assert [topic for topic, _ in seen] == ["task.created", "task.updated", "task.deleted"]
+    assert seen[1][1]["task"]["done"] is True
+    assert seen[2][1]["stats"]["total"] == 0
+
+    insights = [[{"title": "A", "priority": "low"}]]
+    source = insight_store.InsightSource(
+        "email", lambda: len(insights),
+        lambda now: [insight_store.InsightUnit(i["title"], lambda at, i=i: ([i], None)) for i in insights[-1]],
+    )
+    published = []
+    publisher = insight_agent.InsightPublisher(
+        insight_store.InsightStore([source]), lambda topic, data: published.append((topic, data))
+    )
+
+    assert publisher.publish_changes() == 0
+    insights.append([{"title": "A", "priority": "high"}, {"title": "B", "priority": "low"}])
+    assert publisher.publish_changes() == 2
+    insights.append([{"title": "B", "priority": "low"}])
+    publisher.publish_changes()
+
+    topics = [topic for topic, _ in published]
+    assert topics == ["insight.changed", "insight.added", "insight.stats", "insight.removed", "insight.stats"]
+    assert published[3][1] == {"id": "email:A"}
@@ -0,0 +1,153 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from backend import extract_journal, knowledge_hub
+
+
+class FakeNotion:
+    """Database query and block children endpoints, both paginated."""
+
+    def __init__(self, pages=12, blocks_per_page=5):
+        self.pages = {}
+        self.blocks = {}
+        self.calls = {"query": 0, "blocks": 0}
+        self.active = self.peak = 0
+        self.lock = threading.Lock()
+        self.throttle_next = 0
+        for n in range(pages):
+            self.edit(f"page-{n:02d}", f"Journal {n}", f"2026-04-{1 + n // 4:02d}T09:00:00.000Z", blocks_per_page)
+
+    def edit(self, page_id, title, edited, blocks=5):
+        self.pages[page_id] = {
+            "id": page_id,
+            "last_edited_time": edited,
+            "properties": {"Name": {"type": "title", "title": [{"plain_text": title}]}},
+        }
+        self.blocks[page_id] = [
+            {"type": "paragraph", "paragraph": {"rich_text": [{"plain_text": f"{title} line {i}"}]}}
+            if i % 2 == 0 else {"type": "divider", "divider": {}}
+            for i in range(blocks)
+        ]
+
+    @staticmethod
+    def _page(items, cursor, size):
+        start = int(cursor or 0)
+        more = start + size < len(items)
+        return {"results": items[start:start + size], "has_more": more, "next_cursor": str(start + size) if more else None}
+
+    def query(self, body):
+        self.calls["query"] += 1
+        pages = sorted(self.pages.values(), key=lambda p: p["last_edited_time"])
+        since = body.get("filter", {}).get("last_edited_time", {}).get("on_or_after")
+        if since:
+            pages = [p for p in pages if p["last_edited_time"] >= since]
+        return self._page(pages, body.get("start_cursor"), body["page_size"])
+
+    def children(self, page_id, query):
+        with self.lock:
+            self.calls["blocks"] += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+        return self._page(self.blocks[page_id], query.get("start_cursor", [None])[0], int(query["page_size"][0]))
+
+
+@pytest.fixture
+def fake_notion():
+    fake = FakeNotion()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status, payload, headers=()):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            for name, value in headers:
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with fake.lock:
+                throttled, fake.throttle_next = fake.throttle_next > 0, max(0, fake.throttle_next - 1)
+            if throttled:
+                return self._send(429, {"code": "rate_limited"}, [("Retry-After", "0")])
+            self._send(200, fake.query(body))
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            page_id = url.path.split("/")[3]
+            self._send(200, fake.children(page_id, parse_qs(url.query)))
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    fake.url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    yield fake
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def log(tmp_path, monkeypatch):
+    log = knowledge_hub.KnowledgeLog(tmp_path / "kb.jsonl", tmp_path / "kb.idx.json", legacy_path=None)
+    monkeypatch.setattr(knowledge_hub, "_log", log)
+    return log
+
+
+def _sync(tmp_path, fake, **kwargs):
+    return extract_journal.JournalSync(
+        "token", "db", tmp_path / "journal_sync.json", endpoint=fake.url, workers=3, page_size=2, **kwargs
+    )
+
+
+def test_full_sync_paginates_and_fetches_blocks_concurrently(tmp_path, fake_notion, log):
+    knowledge_hub.store_meeting({"title": "Kickoff", "summary": "Agreed scope"})
+    fake_notion.throttle_next = 1
+
+    result = _sync(tmp_path, fake_notion).sync()
+
+    assert (result["mode"], result["listed"], result["stored"]) == ("full", 12, 12)
+    assert (result["query_calls"], result["retries"]) == (7, 1)      # 6 pages of 2, one 429
+    assert result["block_calls"] == 12 * 3                             # 5 blocks in pages of 2
+    assert 1 < fake_notion.peak <= 3
+    journals = log.entries(entry_type="journal")
+    assert len(journals) == 12
+    assert journals[0]["data"]["summary"] == "Journal 0 line 0\nJournal 0 line 2\nJournal 0 line 4"
+    assert journals[0]["view"]["title"] == "Journal 0"
+    assert journals[0]["view"]["summary"] == journals[0]["data"]["summary"]
+    assert len(log.entries(entry_type="meeting")) == 1
+
+
+def test_incremental_sync_only_fetches_edited_pages(tmp_path, fake_notion, log):
+    sync = _sync(tmp_path, fake_notion)
+    sync.sync()
+    assert sync.checkpoint() == {"since": "2026-04-03T09:00:00.000Z",
+                                 "seen": ["page-08", "page-09", "page-10", "page-11"]}
+
+    unchanged = sync.sync()
+    assert (unchanged["mode"], unchanged["listed"], unchanged["stored"], unchanged["block_calls"]) == (
+        "incremental", 4, 0, 0)
+
+    fake_notion.edit("page-03", "Journal 3 (edited)", "2026-04-05T10:00:00.000Z", blocks=1)
+    fake_notion.edit("page-12", "Journal 12", "2026-04-05T10:00:00.000Z", blocks=1)
+    edited = sync.sync()
+
+    assert (edited["stored"], edited["skipped"], edited["block_calls"]) == (2, 4, 2)
+    entries = log.entries(entry_type="journal")
+    journals = {e["key"]: e for e in entries}
+    assert len(entries) == len(journals) == 13     # the edit superseded page-03
+    assert journals["notion:page-03"]["data"]["title"] == "Journal 3 (edited)"
+    assert sync.checkpoint()["seen"] == ["page-03", "page-12"]
@@ -0,0 +1,73 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from backend import follow_up_agent
+from backend.indexed_collection import IndexedCollection
+
+
+def test_indexed_collection_counter_is_monotonic_across_deletes():
+    collection = IndexedCollection([{"id": "1"}, {"id": "7"}, {"id": "legacy-x"}])
+
+    assert collection.next_id == 8
+    collection.remove("7")
+    assert collection.add({"title": "new"})["id"] == "8"
+    assert collection.get("legacy-x") == {"id": "legacy-x"}
+    assert [r["id"] for r in collection] == ["1", "legacy-x", "8"]
+
+
+def _patched_store(tmp_path, records):
+    path = tmp_path / "followups.json"
+    path.write_text(json.dumps(records))
+    return patch.object(follow_up_agent, "FOLLOWUPS_FILE", path), \
+        patch.object(follow_up_agent, "_collection", None), path
+
+
+def test_followups_are_loaded_once_and_mutated_by_id(tmp_path):
+    file_patch, collection_patch, path = _patched_store(tmp_path, [
+        {"id": "1", "title": "email", "status": "pending", "priority": "medium"},
+    ])
+
+    with file_patch, collection_patch, \
+         patch.object(follow_up_agent, "_load_followups", wraps=follow_up_agent._load_followups) as loader:
+        created = follow_up_agent.create_followup("call vendor", "Task", "", "high")
+        follow_up_agent.update_followup("1", {"status": "accepted"})
+        assert follow_up_agent.delete_followup(created["id"])
+        assert not follow_up_agent.delete_followup("404")
+        assert loader.call_count == 1
+
+    saved = json.loads(path.read_text())
+    assert created["id"] == "2"
+    assert [f["id"] for f in saved] == ["1"]
+    assert saved[0]["status"] == "accepted" and saved[0]["resolved_at"]
+
+
+def test_save_keeps_file_mode_and_cleans_up_on_failure(tmp_path):
+    file_patch, collection_patch, path = _patched_store(tmp_path, [])
+    path.chmod(0o640)
+
+    with file_patch, collection_patch:
+        follow_up_agent._save_followups([{"id": "1"}])
+        assert path.stat().st_mode & 0o777 == 0o640
+        with pytest.raises(TypeError):
+            follow_up_agent._save_followups([{"id": object()}])
+
+    assert [p.name for p in tmp_path.iterdir()] == ["followups.json"]
+    assert json.loads(path.read_text()) == [{"id": "1"}]
+
+
+def test_scan_sources_replaces_pending_and_keeps_resolved(tmp_path):
+    file_patch, collection_patch, path = _patched_store(tmp_path, [
+        {"id": "1", "title": "keep", "status": "accepted"},
+        {"id": "2", "title": "drop", "status": "pending"},
+    ])
+
+    with file_patch, collection_patch:
+        scan = follow_up_agent.scan_sources()
+
+    saved = json.loads(path.read_text())
+    new_ids = [f["id"] for f in scan["followups"]]
+    assert len(new_ids) == len(follow_up_agent.MOCK_FOLLOWUPS)
+    assert new_ids == [str(i) for i in range(3, 3 + len(new_ids))]
+    assert [f["id"] for f in saved] == ["1"] + new_ids
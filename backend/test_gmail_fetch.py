@@ -0,0 +1,170 @@
+import base64
+import json
+import threading
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+import httplib2
+import pytest
+
+from backend import api as backend_api
+from backend import gmail_fetch
+from backend import task_store
+
+
+def _message(n: int) -> dict:
+    body = base64.urlsafe_b64encode(f"Meeting {n} on 11/04/2026 at 10:30 am".encode()).decode()
+    return {
+        "id": f"m{n}",
+        "snippet": f"Meeting {n} &amp; agenda",
+        "payload": {
+            "headers": [
+                {"name": "Subject", "value": f"Subject {n}"},
+                {"name": "From", "value": "team@example.com"},
+                {"name": "X-Other", "value": "ignored"},
+            ],
+            "mimeType": "text/plain",
+            "body": {"data": body},
+        },
+    }
+
+
+class FakeGmail:
+    """Just enough of the Gmail REST API, including ``/batch``, over HTTP."""
+
+    def __init__(self, count: int):
+        self.messages = {f"m{n}": _message(n) for n in range(count)}
+        self.unread = [f"m{n}" for n in range(count)]
+        self.calls = {"list": 0, "get": 0, "batch": 0}
+
+    def handle(self, method: str, target: str) -> tuple[int, dict]:
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        path = url.path.removeprefix("/gmail/v1/users/me/messages")
+        if method == "GET" and path == "":
+            self.calls["list"] += 1
+            limit = int(query.get("maxResults", ["100"])[0])
+            return 200, {"messages": [{"id": i} for i in self.unread[:limit]]}
+        message = self.messages.get(path.lstrip("/"))
+        if method != "GET" or message is None:
+            return 404, {"error": {"code": 404, "message": "Not Found"}}
+        if query.get("format") == ["metadata"]:
+            wanted = set(query.get("metadataHeaders", []))
+            headers = [h for h in message["payload"]["headers"] if h["name"] in wanted]
+            return 200, {"id": message["id"], "snippet": message["snippet"], "payload": {"headers": headers}}
+        return 200, message
+
+    def handle_batch(self, content_type: str, body: bytes) -> tuple[str, bytes]:
+        self.calls["batch"] += 1
+        envelope = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + body
+        )
+        boundary = "fake_batch_boundary"
+        parts = []
+        for part in envelope.iter_parts():
+            method, target, _version = part.get_payload(decode=True).decode().splitlines()[0].split(" ")
+            status, payload = self.handle(method, target)
+            parts.append(
+                f"--{boundary}\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-{part['Content-ID'][1:]}\r\n\r\n"
+                f"HTTP/1.1 {status} {'OK' if status == 200 else 'Not Found'}\r\n"
+                f"Content-Type: application/json\r\n\r\n{json.dumps(payload)}\r\n"
+            )
+        return f"multipart/mixed; boundary={boundary}", ("".join(parts) + f"--{boundary}--").encode()
+
+
+@pytest.fixture
+def fake_gmail():
+    fake = FakeGmail(120)
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status, content_type, body):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if "/messages/" in self.path:
+                fake.calls["get"] += 1
+            status, payload = fake.handle("GET", self.path)
+            self._send(status, "application/json", json.dumps(payload).encode())
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            content_type, payload = fake.handle_batch(self.headers["Content-Type"], body)
+            self._send(200, content_type, payload)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}/"
+    fake.service = gmail_fetch.build_gmail_service(http=httplib2.Http(), endpoint=endpoint)
+    fake.endpoint = endpoint
+    yield fake
+    server.shutdown()
+    server.server_close()
+
+
+def test_messages_are_fetched_in_batches_against_a_fake_gmail(fake_gmail):
+    fake_gmail.unread.insert(1, "gone")
+    fetcher = gmail_fetch.GmailFetcher(fake_gmail.service, endpoint=fake_gmail.endpoint)
+
+    messages = fetcher.fetch_unread(max_results=101, format="metadata")
+
+    assert [m["id"] for m in messages] == ["m0"] + [f"m{n}" for n in range(1, 100)]
+    assert fake_gmail.calls == {"list": 1, "get": 0, "batch": 3}
+    assert [h["name"] for h in messages[0]["payload"]["headers"]] == ["Subject", "From"]
+    assert "body" not in messages[0]["payload"]
+    assert fetcher.timings.mode == "batch"
+    assert (fetcher.timings.requests, fetcher.timings.messages, fetcher.timings.failed) == (3, 100, 1)
+
+
+def test_clients_without_batch_support_use_a_bounded_thread_pool():
+    in_flight, peak = [0], [0]
+    lock = threading.Lock()
+    barrier = threading.Barrier(3)
+
+    def _execute(message_id):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        barrier.wait(timeout=5)
+        with lock:
+            in_flight[0] -= 1
+        return {"id": message_id}
+
+    messages_api = SimpleNamespace(
+        get=lambda **kw: SimpleNamespace(execute=lambda: _execute(kw["id"])),
+    )
+    service = SimpleNamespace(users=lambda: SimpleNamespace(messages=lambda: messages_api))
+    fetcher = gmail_fetch.GmailFetcher(service, max_workers=3, endpoint=None)
+
+    messages = fetcher.get_messages([f"m{n}" for n in range(6)], format="full")
+
+    assert [m["id"] for m in messages] == [f"m{n}" for n in range(6)]
+    assert peak[0] == 3
+    assert (fetcher.timings.mode, fetcher.timings.requests) == ("threads", 6)
+
+
+def test_action_agent_previews_use_metadata_fetches(fake_gmail, tmp_path, monkeypatch):
+    monkeypatch.setenv("GMAIL_API_ENDPOINT", fake_gmail.endpoint)
+    store = task_store.TaskStore(tmp_path / "tasks.db", legacy_path=None)
+
+    with patch.object(task_store, "_store", store), \
+         patch.object(backend_api, "_get_gmail_service", return_value=(fake_gmail.service, None)):
+        result = backend_api.action_agent()
+
+    assert result["unread_count"] == 10
+    assert result["unread_emails"][0] == {
+        "id": "m0", "subject": "Subject 0", "sender": "team@example.com", "preview": "Meeting 0 & agenda",
+    }
+    assert result["fetch_timings"]["requests"] == 1
+    assert fake_gmail.calls["get"] == 0
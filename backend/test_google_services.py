@@ -0,0 +1,111 @@
+import json
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from backend import api as backend_api
+from backend import google_services
+
+NOW = datetime(2026, 4, 11, 10, 0, 0)
+
+
+def _write_token(path, expires_in: timedelta, token="old-token"):
+    path.write_text(json.dumps({
+        "token": token,
+        "refresh_token": "refresh",
+        "token_uri": "https://oauth2.example.invalid/token",
+        "client_id": "client",
+        "client_secret": "secret",
+        "scopes": google_services.SCOPES,
+        "expiry": (NOW + expires_in).strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }))
+
+
+def _cache(tmp_path, builds=None):
+    def _builder(name, version, credentials=None):
+        if builds is not None:
+            builds.append((name, threading.get_ident(), credentials.token))
+        return SimpleNamespace(name=name, credentials=credentials)
+
+    return google_services.GoogleServiceCache(
+        token_file=tmp_path / "token.json",
+        credentials_file=tmp_path / "credentials.json",
+        builder=_builder,
+        clock=lambda: NOW,
+    )
+
+
+def test_token_is_refreshed_once_before_expiry_under_concurrency(tmp_path):
+    _write_token(tmp_path / "token.json", expires_in=timedelta(minutes=3))
+    cache = _cache(tmp_path)
+    refreshes = []
+
+    def _refresh(self, _request):
+        refreshes.append(self.token)
+        self.token = "new-token"
+        self.expiry = NOW + timedelta(hours=1)
+
+    with patch.object(Credentials, "refresh", _refresh):
+        threads = [threading.Thread(target=cache.credentials) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        creds = cache.credentials()
+
+    assert refreshes == ["old-token"]
+    assert creds.token == "new-token"
+    assert json.loads((tmp_path / "token.json").read_text())["token"] == "new-token"
+    assert cache.stats() == {"loads": 1, "refreshes": 1, "builds": 0, "invalidations": 0}
+
+
+def test_services_are_reused_per_thread_and_rebuilt_after_auth_errors(tmp_path):
+    _write_token(tmp_path / "token.json", expires_in=timedelta(hours=1))
+    builds = []
+    cache = _cache(tmp_path, builds)
+
+    first = cache.gmail()
+    assert cache.gmail() is first
+    other = []
+    worker = threading.Thread(target=lambda: other.append(cache.gmail()))
+    worker.start()
+    worker.join()
+    assert other[0] is not first
+
+    unauthorized = SimpleNamespace(resp=SimpleNamespace(status=401))
+    assert cache.invalidate_on_auth_error(unauthorized) is True
+    assert cache.invalidate_on_auth_error(ValueError("boom")) is False
+    rebuilt = cache.gmail()
+
+    assert rebuilt is not first
+    assert len(builds) == 3
+    assert cache.stats()["loads"] == 2
+
+
+def test_missing_or_unrefreshable_tokens_are_reported_without_a_browser(tmp_path):
+    cache = _cache(tmp_path)
+    with pytest.raises(google_services.GoogleAuthError, match="not configured"):
+        cache.gmail()
+
+    _write_token(tmp_path / "token.json", expires_in=timedelta(minutes=-10))
+    with patch.object(Credentials, "refresh", side_effect=RuntimeError("revoked")), \
+         patch.object(google_services, "get_google_services", return_value=cache):
+        service, error = backend_api._get_gmail_service()
+
+    assert service is None
+    assert "cannot be refreshed" in error
+
+
+def test_failed_early_refresh_keeps_the_still_valid_token(tmp_path):
+    _write_token(tmp_path / "token.json", expires_in=timedelta(minutes=3))
+    cache = _cache(tmp_path)
+
+    with patch.object(Credentials, "refresh", side_effect=RuntimeError("503")) as refresh:
+        assert cache.credentials().token == "old-token"
+        assert cache.credentials().token == "old-token"
+
+    assert refresh.call_count == 2
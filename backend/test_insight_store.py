@@ -0,0 +1,110 @@
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from backend import insight_agent
+from backend import insight_store
+from backend import knowledge_hub
+from backend import task_store
+
+
+def _counting_source(name, fingerprint, insights, calls):
+    def compute(now):
+        calls.append(name)
+        return [insight_store.InsightUnit(str(n), lambda at, i=i: ([dict(i)], None))
+                for n, i in enumerate(insights)]
+    return insight_store.InsightSource(name, lambda: fingerprint[0], compute)
+
+
+def test_only_sources_with_changed_fingerprints_are_recomputed():
+    calls = []
+    email_fp, meeting_fp = ["v1"], ["v1"]
+    store = insight_store.InsightStore([
+        _counting_source("email", email_fp, [{"title": "A", "priority": "low"}], calls),
+        _counting_source("meeting", meeting_fp, [{"title": "B", "priority": "high"},
+                                                 {"title": "C", "priority": "medium"}], calls),
+    ])
+
+    first = store.snapshot()
+    store.snapshot()
+    email_fp[0] = "v2"
+    store.snapshot()
+
+    assert calls == ["email", "meeting", "email"]
+    assert [i["id"] for i in first["insights"]] == ["meeting:0", "meeting:1", "email:0"]
+    assert first["stats"] == {"total": 3, "high_priority": 1, "action_required": 2, "informational": 1}
+
+
+def test_only_units_whose_time_boundary_passed_are_rerendered():
+    clock = [datetime(2026, 5, 1, tzinfo=timezone.utc)]
+    followups = [
+        {"id": "a", "title": "Old", "status": "pending", "priority": "medium",
+         "created_at": "2026-04-30T06:00:00+00:00", "due_date": ""},
+        {"id": "b", "title": "Due", "status": "pending", "priority": "low",
+         "created_at": "2026-04-30T23:00:00+00:00", "due_date": "2026-05-03"},
+    ]
+    source = insight_store.InsightSource(
+        "email", lambda: "fixed",
+        lambda now: [insight_store.InsightUnit(f["id"], lambda at, f=f: insight_agent._render_followup(f, at))
+                     for f in followups],
+    )
+    store = insight_store.InsightStore([source], clock=lambda: clock[0])
+
+    def priorities():
+        return {i["id"]: (i["priority"], i["icon"]) for i in store.snapshot()["insights"]}
+
+    assert priorities() == {"email:a": ("low", "📌"), "email:b": ("low", "📌")}
+    assert store.next_refresh_at() == datetime(2026, 5, 1, 6, 0, 0, 1, tzinfo=timezone.utc)
+
+    clock[0] = datetime(2026, 5, 1, 5, tzinfo=timezone.utc)
+    assert store.refresh() == []
+
+    clock[0] = datetime(2026, 5, 1, 7, tzinfo=timezone.utc)
+    assert store.refresh() == ["email:a"]
+    assert priorities()["email:a"] == ("medium", "📌")
+
+    clock[0] = datetime(2026, 5, 3, 7, tzinfo=timezone.utc)
+    assert sorted(store.refresh()) == ["email:a", "email:b"]
+    assert priorities() == {"email:a": ("high", "📌"), "email:b": ("high", "⚠️")}
+    assert store.next_refresh_at() is None
+
+
+def test_meeting_windows_and_stale_task_boundaries():
+    meeting = {"type": "meeting", "date": "2026-05-01T09:00:00+00:00",
+               "data": {"title": "Plan", "actions": ["ship"], "next_steps": ["review"]}}
+    at = datetime(2026, 5, 1, 12, tzinfo=timezone.utc)
+
+    insights, boundary = insight_agent._render_meeting(meeting, at)
+    assert [i["priority"] for i in insights] == ["high", "medium"]
+    assert boundary == datetime(2026, 5, 3, 9, tzinfo=timezone.utc)
+    insights, boundary = insight_agent._render_meeting(meeting, boundary)
+    assert [i["priority"] for i in insights] == ["medium", "medium"]
+    assert boundary == datetime(2026, 5, 8, 9, tzinfo=timezone.utc)
+
+    tasks = [{"title": "t", "done": False, "created_at": "2026-05-01T12:00:00+00:00"}]
+    insights, boundary = insight_agent._render_task_analytics(tasks, at)
+    assert len(insights) == 1
+    assert boundary == datetime(2026, 5, 1, 13, 0, 0, 1, tzinfo=timezone.utc)
+
+
+def test_insight_agent_serves_insights_and_stats_from_one_snapshot(tmp_path):
+    (tmp_path / "followups.json").write_text(json.dumps([
+        {"title": "Reply to Bob", "status": "pending", "priority": "high",
+         "created_at": "2026-05-01T10:00:00+00:00", "due_date": ""},
+    ]))
+    log = knowledge_hub.KnowledgeLog(tmp_path / "kb.jsonl", tmp_path / "kb.idx", legacy_path=None)
+    tasks = task_store.TaskStore(tmp_path / "tasks.db", legacy_path=None)
+
+    with patch.object(insight_agent, "PROJECT_ROOT", tmp_path), \
+         patch.object(insight_agent, "_store", None), \
+         patch.object(insight_agent, "_knowledge_units", return_value=[]), \
+         patch.object(knowledge_hub, "_log", log), \
+         patch.object(task_store, "_store", tasks):
+        snapshot = insight_agent.get_insights_snapshot()
+        with patch.object(insight_agent, "_load_json", side_effect=AssertionError("re-read")):
+            assert insight_agent.get_all_insights() == snapshot["insights"]
+            assert insight_agent.get_insight_stats() == snapshot["stats"]
+
+    titles = [i["title"] for i in snapshot["insights"]]
+    assert "Pending Follow-up: Reply to Bob" in titles
+    assert snapshot["stats"]["total"] == len(titles)
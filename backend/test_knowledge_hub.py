@@ -0,0 +1,162 @@
+import json
+import threading
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from backend import api as backend_api
+from backend import knowledge_hub
+from backend import knowledge_search
+
+
+def _log(tmp_path, legacy=None):
+    return knowledge_hub.KnowledgeLog(
+        tmp_path / "kb.jsonl", tmp_path / "kb.idx.json", legacy_path=legacy
+    )
+
+
+def _meeting(day, title, source="Meeting Intelligence"):
+    return {"type": "meeting", "source": source, "date": f"2026-05-{day:02d} 10:00:00",
+            "data": {"title": title, "summary": f"{title} summary"}}
+
+
+def test_append_tail_and_seek_by_date_and_type(tmp_path):
+    log = _log(tmp_path)
+    for day in range(1, 6):
+        log.append(_meeting(day, f"m{day}"))
+    log.append({"type": "journal", "source": "Journal AI", "date": "2026-05-06 09:00:00"})
+
+    assert log.tail(2)[0]["data"]["title"] == "m5"
+    between = log.entries(since="2026-05-02", until="2026-05-04")
+    assert [e["data"]["title"] for e in between] == ["m2", "m3"]
+    assert len(log.entries(entry_type="meeting")) == 5
+
+
+def test_legacy_json_is_migrated_and_index_survives_reopen(tmp_path):
+    legacy = tmp_path / "knowledge_base.json"
+    legacy.write_text(json.dumps([_meeting(1, "old"), {"title": "journal", "content": "x"}]))
+
+    log = _log(tmp_path, legacy)
+    for day in range(2, 2 + knowledge_hub.INDEX_FLUSH_EVERY):
+        log.append(_meeting(day % 28 + 1, f"m{day}"))
+
+    assert not legacy.exists()
+    assert (tmp_path / "knowledge_base.json.migrated").exists()
+    assert (tmp_path / "kb.idx.json").exists()
+
+    reopened = _log(tmp_path)
+    assert len(reopened) == len(log) == 2 + knowledge_hub.INDEX_FLUSH_EVERY
+    assert reopened.tail(1) == log.tail(1)
+
+
+def test_lines_appended_by_another_process_are_picked_up(tmp_path):
+    log = _log(tmp_path)
+    log.append(_meeting(1, "first"))
+    with open(tmp_path / "kb.jsonl", "a", encoding="utf-8") as f:
+        f.write(json.dumps(_meeting(2, "other process")) + "\n")
+        f.write('{"torn": ')
+
+    assert [e["data"]["title"] for e in log.tail(5)] == ["first", "other process"]
+
+
+def test_keyed_entries_supersede_and_compaction_drops_them(tmp_path):
+    log = _log(tmp_path)
+    for version in range(3):
+        log.append({"type": "journal", "key": "notion:1", "date": f"2026-05-0{version + 1}",
+                    "content": f"v{version}"})
+    log.append(_meeting(9, "keep"))
+    size_before = (tmp_path / "kb.jsonl").stat().st_size
+
+    result = log.compact()
+
+    assert [e.get("content") for e in log.tail(10)] == ["v2", None]
+    assert result["entries"] == 2
+    assert (tmp_path / "kb.jsonl").stat().st_size < size_before
+    assert len(_log(tmp_path)) == 2
+
+
+def test_appends_from_another_process_wait_for_compaction(tmp_path):
+    log, other = _log(tmp_path), _log(tmp_path)   # separate lock fds, like two processes
+    log.append(_meeting(1, "first"))
+    compacting, appended = threading.Event(), threading.Event()
+
+    def _slow_transform(entry):
+        compacting.set()
+        appended.wait(0.3)   # an unlocked append would land here and be lost
+        return entry
+
+    worker = threading.Thread(target=lambda: log.compact(_slow_transform))
+    worker.start()
+    compacting.wait(5)
+    writer = threading.Thread(target=lambda: (other.append(_meeting(2, "during")), appended.set()))
+    writer.start()
+    worker.join(5)
+    writer.join(5)
+
+    assert [e["data"]["title"] for e in _log(tmp_path).tail(5)] == ["first", "during"]
+
+
+def test_append_after_a_torn_line_starts_a_new_line(tmp_path):
+    log = _log(tmp_path)
+    log.append(_meeting(1, "first"))
+    with open(tmp_path / "kb.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"torn": ')   # a writer crashed mid-line
+
+    log.append(_meeting(2, "second"))
+
+    assert [e["data"]["title"] for e in _log(tmp_path).tail(5)] == ["first", "second"]
+
+
+def test_compaction_in_another_process_waits_for_readers(tmp_path):
+    log, other = _log(tmp_path), _log(tmp_path)
+    for version in range(3):
+        log.append({"type": "journal", "key": "notion:1", "date": "2026-05-01", "content": f"v{version}"})
+    log.append(_meeting(2, "keep"))
+
+    with other.read_lock():
+        records = other._records[:]
+        worker = threading.Thread(target=log.compact)
+        worker.start()
+        worker.join(0.3)
+        assert worker.is_alive()   # blocked on the shared lock
+        assert [e.get("content") for e in other.read(records)] == ["v2", None]
+    worker.join(5)
+
+    assert [e.get("content") for e in other.tail(5)] == ["v2", None]
+
+
+def test_knowledge_hub_endpoint_reads_newest_entries_from_log(tmp_path):
+    log = _log(tmp_path)
+    for day in range(1, 4):
+        log.append(_meeting(day, f"Planning {day}"))
+
+    with patch.object(knowledge_hub, "_log", log), \
+         patch.object(knowledge_search, "_index", knowledge_search.KnowledgeSearchIndex(log)):
+        client = TestClient(backend_api.app)
+        recent = client.post("/knowledge-hub", json={"query": "", "limit": 2}).json()
+        found = client.post("/knowledge-hub", json={"query": "planning 2"}).json()
+
+    assert [e["title"] for e in recent["entries"]] == ["Planning 3", "Planning 2"]
+    assert recent["total"] == 3
+    assert [e["title"] for e in found["entries"]] == ["Planning 2"]
+
+
+def test_store_meeting_precomputes_view_and_backfill_adds_missing_ones(tmp_path):
+    legacy = tmp_path / "knowledge_base.json"
+    legacy.write_text(json.dumps([
+        {"type": "meeting", "source": "pipeline", "date": "2026-05-01",
+         "data": {"title": "Short meeting title", "summary": "Ship v2. Then rest."}},
+        {"title": "Diary", "content": "notes"},
+    ]))
+    log = _log(tmp_path, legacy)
+
+    with patch.object(knowledge_hub, "_log", log):
+        knowledge_hub.store_meeting({"title": "Sync", "summary": "All good"}, source="research")
+        result = knowledge_hub.backfill_views()
+
+    views = [e["view"] for e in log.tail(10)]
+    assert result["views_added"] == 2
+    assert views[0] == {"type": "meeting", "source": "Meeting Pipeline",
+                        "title": "Ship v2", "summary": "Ship v2. Then rest."}
+    assert views[1]["source"] == "Knowledge Hub" and views[1]["title"] == "Diary"
+    assert views[2]["source"] == "Research Copilot" and views[2]["title"] == "Sync"
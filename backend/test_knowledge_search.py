@@ -0,0 +1,44 @@
+from backend import knowledge_hub
+from backend import knowledge_search
+
+
+def _log(tmp_path):
+    return knowledge_hub.KnowledgeLog(tmp_path / "kb.jsonl", tmp_path / "kb.idx.json", legacy_path=None)
+
+
+def _meeting(title, summary="", actions=()):
+    return {"type": "meeting", "source": "Meeting Intelligence", "date": "2026-05-01 10:00:00",
+            "data": {"title": title, "summary": summary, "actions": list(actions)}}
+
+
+def test_ranked_prefix_search_with_pagination(tmp_path):
+    log = _log(tmp_path)
+    log.append(_meeting("Budget review", "Quarterly budget numbers", ["Send budget deck"]))
+    log.append(_meeting("Standup", "Mentioned the budget briefly"))
+    log.append(_meeting("Hiring sync", "Interview loop for backend role"))
+    index = knowledge_search.KnowledgeSearchIndex(log)
+
+    result = index.search("budg")
+    assert result["total"] == 2
+    assert [e["data"]["title"] for e in result["entries"]] == ["Budget review", "Standup"]
+
+    second_page = index.search("budget", limit=1, offset=1)
+    assert [e["data"]["title"] for e in second_page["entries"]] == ["Standup"]
+    assert index.search("budget interview")["total"] == 0
+    assert index.search("")["entries"] == []
+
+
+def test_index_follows_appends_supersedes_and_compaction(tmp_path):
+    log = _log(tmp_path)
+    index = knowledge_search.KnowledgeSearchIndex(log)
+
+    log.append({"type": "journal", "key": "notion:1", "title": "Draft", "content": "alpha"})
+    assert index.search("alpha")["total"] == 1
+
+    log.append({"type": "journal", "key": "notion:1", "title": "Final", "content": "omega"})
+    log.append(_meeting("Retro", "alpha lessons"))
+    log.compact()
+
+    assert [e["data"]["title"] for e in index.search("alpha")["entries"]] == ["Retro"]
+    assert [e["title"] for e in index.search("omega")["entries"]] == ["Final"]
+    assert len(index) == 2
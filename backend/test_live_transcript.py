@@ -0,0 +1,184 @@
+import json
+import os
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from backend import api as backend_api
+from backend import live_transcript
+
+
+def _make_model_dir(tmp_path):
+    model_dir = tmp_path / "tiny"
+    model_dir.mkdir()
+    (model_dir / "model.bin").write_bytes(b"\x00weights" * 1024)
+    (model_dir / "config.json").write_text('{"layers": 4}')
+    return model_dir
+
+
+def test_model_health_creates_manifest_then_trusts_unchanged_files(tmp_path, caplog):
+    model_dir = _make_model_dir(tmp_path)
+
+    assert live_transcript._is_model_healthy(model_dir)
+    assert (model_dir / live_transcript.MANIFEST_NAME).exists()
+    assert "NOT verified" in caplog.text
+
+    with patch.object(live_transcript, "_file_sha256", side_effect=AssertionError("re-read")):
+        assert live_transcript._is_model_healthy(model_dir)
+
+
+def test_model_health_rehashes_touched_file_and_detects_corruption(tmp_path):
+    model_dir = _make_model_dir(tmp_path)
+    live_transcript._is_model_healthy(model_dir)
+    bin_path = model_dir / "model.bin"
+
+    # Same bytes, new mtime: re-hashed once and accepted.
+    stat = bin_path.stat()
+    os.utime(bin_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    assert live_transcript._is_model_healthy(model_dir)
+
+    # Same size, different bytes: rejected.
+    data = bytearray(bin_path.read_bytes())
+    data[0] ^= 0xFF
+    bin_path.write_bytes(bytes(data))
+    assert not live_transcript._is_model_healthy(model_dir)
+
+
+def test_model_health_rejects_lfs_pointer(tmp_path):
+    model_dir = tmp_path / "tiny"
+    model_dir.mkdir()
+    (model_dir / "model.bin").write_text(
+        "version https://git-lfs.github.com/spec/v1\noid sha256:abc\nsize 1\n"
+    )
+
+    assert not live_transcript._is_model_healthy(model_dir)
+
+
+def test_background_init_reports_loading_then_ready():
+    engine = live_transcript.TranscriptionEngine()
+    release = threading.Event()
+
+    def slow_init():
+        release.wait(5)
+        engine._model = object()
+        engine._backend = "faster-whisper"
+
+    with patch.object(engine, "_init_faster_whisper", side_effect=slow_init):
+        engine.start_background_init()
+        assert engine.state == "loading"
+        release.set()
+        assert engine.wait_until_ready(5)
+
+    status = engine.status()
+    assert status["state"] == "ready"
+    assert status["backend"] == "faster-whisper"
+    assert status["cold_start_seconds"] is not None
+
+
+def test_transcribe_returns_503_with_retry_after_while_warming():
+    engine = live_transcript.TranscriptionEngine()
+
+    with patch.object(live_transcript, "_engine", engine), \
+         patch.object(engine, "start_background_init"):
+        engine._state = "loading"
+        client = TestClient(backend_api.app)
+        response = client.post("/transcribe", files={"file": ("a.webm", b"123")})
+        health = client.get("/health")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(live_transcript.WARMUP_RETRY_AFTER)
+    assert health.status_code == 200
+    assert health.json()["transcription"]["state"] == "loading"
+
+
+def _ready_engine(segments):
+    engine = live_transcript.TranscriptionEngine()
+    engine._state = "ready"
+    engine._backend = "faster-whisper"
+    engine._model = SimpleNamespace(
+        transcribe=lambda _audio, **_kwargs: (iter(segments), SimpleNamespace())
+    )
+    return engine
+
+
+def _fake_segment(text, start, end, avg_logprob=-0.2, no_speech_prob=0.01, words=None):
+    return SimpleNamespace(
+        text=text,
+        start=start,
+        end=end,
+        avg_logprob=avg_logprob,
+        no_speech_prob=no_speech_prob,
+        words=words,
+    )
+
+
+def test_transcribe_keeps_segment_timing_and_drops_no_speech():
+    engine = _ready_engine([
+        _fake_segment(" Hello team. ", 0.0, 1.5),
+        _fake_segment(" (music) ", 1.5, 4.0, avg_logprob=-1.7, no_speech_prob=0.9),
+        _fake_segment(" Let's start. ", 4.0, 5.25),
+    ])
+
+    result = engine.transcribe([0.0], language="en")
+
+    assert result["transcript"] == "Hello team. Let's start."
+    assert result["segments"][1] == {
+        "text": "Let's start.",
+        "start": 4.0,
+        "end": 5.25,
+        "avg_logprob": -0.2,
+        "no_speech_prob": 0.01,
+    }
+
+
+def test_iter_segments_is_lazy_and_includes_words():
+    consumed = []
+
+    def segments():
+        word = SimpleNamespace(word=" Hi", start=0.1, end=0.4, probability=0.97)
+        consumed.append(1)
+        yield _fake_segment(" Hi", 0.0, 0.5, words=[word])
+        consumed.append(2)
+        raise AssertionError("second segment should not be decoded")
+
+    engine = _ready_engine([])
+    engine._model = SimpleNamespace(
+        transcribe=lambda _audio, **_kwargs: (segments(), SimpleNamespace())
+    )
+
+    first = next(engine.iter_segments([0.0], word_timestamps=True))
+
+    assert consumed == [1]
+    assert first["words"] == [{"word": "Hi", "start": 0.1, "end": 0.4, "probability": 0.97}]
+
+
+def test_transcribe_stream_emits_ndjson_segments():
+    engine = _ready_engine([_fake_segment(" One.", 0.0, 1.0), _fake_segment(" Two.", 1.0, 2.0)])
+
+    with patch.object(live_transcript, "_engine", engine), \
+         patch.object(live_transcript, "convert_audio_to_float32", return_value=([0.1], 16000)):
+        response = TestClient(backend_api.app).post(
+            "/transcribe/stream", files={"file": ("a.webm", b"123")}
+        )
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line.get("text") for line in lines[:2]] == ["One.", "Two."]
+    assert lines[-1] == {"done": True, "transcript": "One. Two."}
+
+
+def test_resample_filters_tones_above_the_new_nyquist():
+    t = np.arange(44100) / 44100
+    speech_band = np.sin(2 * np.pi * 440 * t).astype(np.float32)
+    # 10 kHz can't exist at 16 kHz; a bare interpolation folds it to 6 kHz
+    aliasing = np.sin(2 * np.pi * 10000 * t).astype(np.float32)
+
+    with patch.object(live_transcript, "resample_poly", None):
+        kept = live_transcript.resample(speech_band, 44100)
+        folded = live_transcript.resample(aliasing, 44100)
+
+    assert len(kept) == len(folded) == 16000
+    assert np.sqrt(np.mean(kept[100:-100] ** 2)) > 0.65
+    assert np.sqrt(np.mean(folded[100:-100] ** 2)) < 0.05
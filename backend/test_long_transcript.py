@@ -0,0 +1,119 @@
+import threading
+from unittest.mock import patch
+
+import numpy as np
+
+from backend import long_transcript
+
+SR = long_transcript.samplerate
+
+
+def _tone(seconds):
+    t = np.arange(int(seconds * SR)) / SR
+    return (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _silence(seconds):
+    return np.zeros(int(seconds * SR), dtype=np.float32)
+
+
+def _blocks(signal, block_seconds=5):
+    step = int(block_seconds * SR)
+    for i in range(0, len(signal), step):
+        yield signal[i:i + step]
+
+
+def test_split_on_silence_cuts_inside_the_pause_and_keeps_overlap():
+    signal = np.concatenate([_tone(28), _silence(2), _tone(20)])
+
+    pieces = list(long_transcript.split_on_silence(_blocks(signal)))
+
+    assert len(pieces) == 2
+    (start0, cut0, first), (start1, cut1, second) = pieces
+    assert start0 == 0.0
+    assert 28.0 <= cut0 <= 30.0
+    assert start1 == cut0
+    assert len(first) == int(cut0 * SR) + int(long_transcript.OVERLAP_SECONDS * SR)
+    assert abs(start1 + len(second) / SR - 50.0) < 0.01
+
+
+def test_split_on_silence_never_exceeds_max_piece_length():
+    signal = _tone(100)
+
+    pieces = list(long_transcript.split_on_silence(_blocks(signal)))
+
+    limit = long_transcript.MAX_PIECE_SECONDS + long_transcript.OVERLAP_SECONDS
+    assert all(len(samples) / SR <= limit for _, _, samples in pieces)
+    assert pieces[-1][0] + len(pieces[-1][2]) / SR == 100.0
+
+
+def test_stitch_pieces_assigns_overlap_once_and_trims_repeated_words():
+    pieces = [
+        {"start": 0.0, "cut": 30.0, "segments": [
+            {"text": "Welcome everyone.", "start": 1.0, "end": 3.0},
+            {"text": "Budget is approved", "start": 27.0, "end": 29.8},
+            {"text": "and shipped.", "start": 30.1, "end": 30.9},
+        ]},
+        {"start": 30.0, "cut": 45.0, "segments": [
+            {"text": "approved and shipped. Next item.", "start": 0.0, "end": 3.0},
+            {"text": "Next item is hiring.", "start": 3.5, "end": 5.0},
+        ]},
+    ]
+
+    segments = long_transcript.stitch_pieces(pieces)
+
+    assert [s["text"] for s in segments] == [
+        "Welcome everyone.",
+        "Budget is approved",
+        "and shipped. Next item.",
+        "Next item is hiring.",   # inside a piece: left alone
+    ]
+    assert segments[2]["start"] == 30.0
+
+
+class _FakeEngine:
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def transcribe(self, samples, language="en", word_timestamps=False):
+        with self.lock:
+            _FakeEngine.active += 1
+            _FakeEngine.peak = max(_FakeEngine.peak, _FakeEngine.active)
+        try:
+            threading.Event().wait(0.05)
+            seconds = len(samples) / SR
+            return {
+                "transcript": "piece",
+                "segments": [{"text": f"piece {seconds:.0f}s", "start": 0.5, "end": 1.5}],
+            }
+        finally:
+            with self.lock:
+                _FakeEngine.active -= 1
+
+
+def test_transcribe_long_audio_runs_pieces_in_parallel_and_reports_rtf():
+    signal = np.concatenate([_tone(28), _silence(2), _tone(28), _silence(2), _tone(20)])
+    pool = long_transcript.ReplicaPool(size=2, engine_factory=_FakeEngine)
+
+    with patch.object(long_transcript, "stream_decode", return_value=_blocks(signal)):
+        result = long_transcript.transcribe_long_audio(b"audio", pool=pool)
+
+    assert "error" not in result
+    assert len(result["segments"]) == 3
+    assert result["stats"]["pieces"] == 3
+    assert result["stats"]["audio_seconds"] == 80.0
+    assert result["stats"]["real_time_factor"] > 0
+    assert _FakeEngine.peak == 2
+
+
+def test_failed_checkout_releases_its_in_flight_slot():
+    class _BrokenPool(long_transcript.ReplicaPool):
+        def checkout(self):
+            raise RuntimeError("model failed to load")
+
+    signal = np.concatenate([_tone(28), _silence(2), _tone(28), _silence(2), _tone(28), _silence(2), _tone(20)])
+    with patch.object(long_transcript, "stream_decode", return_value=_blocks(signal)):
+        result = long_transcript.transcribe_long_audio(b"audio", pool=_BrokenPool(size=1))
+
+    assert "model failed to load" in result["error"]
@@ -0,0 +1,179 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from backend import mailbox_sync
+
+
+class FakeHttpError(Exception):
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.resp = SimpleNamespace(status=status)
+
+
+def _request(fn):
+    return SimpleNamespace(execute=fn)
+
+
+class FakeMailbox:
+    """In-memory Gmail with a history feed, shaped like the discovery client."""
+
+    def __init__(self):
+        self.history_id = 100
+        self.oldest_history_id = 100
+        self.history = []   # (history_id, message)
+        self.messages = {}
+        self.history_pages = 0
+        self.failing = {}   # message id -> gets left that answer 503
+
+    def deliver(self, count, labels=("INBOX", "UNREAD")):
+        for _ in range(count):
+            self.history_id += 1
+            message = {"id": f"m{self.history_id}", "labelIds": list(labels), "payload": {}}
+            self.messages[message["id"]] = message
+            self.history.append((self.history_id, message))
+
+    def users(self):
+        return SimpleNamespace(
+            getProfile=lambda userId: _request(lambda: {"historyId": str(self.history_id)}),
+            history=lambda: SimpleNamespace(list=self._history_list),
+            messages=lambda: SimpleNamespace(list=self._messages_list, get=self._messages_get),
+        )
+
+    def _history_list(self, userId, startHistoryId, historyTypes, maxResults, pageToken=None):
+        def _execute():
+            if int(startHistoryId) < self.oldest_history_id:
+                raise FakeHttpError(404)
+            self.history_pages += 1
+            records = [
+                {"id": str(h), "messagesAdded": [{"message": {"id": m["id"], "labelIds": m["labelIds"]}}]}
+                for h, m in self.history if h > int(startHistoryId)
+            ]
+            start = int(pageToken or 0)
+            page = {"history": records[start:start + maxResults], "historyId": str(self.history_id)}
+            if start + maxResults < len(records):
+                page["nextPageToken"] = str(start + maxResults)
+            return page
+        return _request(_execute)
+
+    def _messages_list(self, userId, labelIds, maxResults, pageToken=None):
+        def _execute():
+            ids = [m["id"] for _h, m in reversed(self.history) if labelIds[0] in m["labelIds"]]
+            start = int(pageToken or 0)
+            page = {"messages": [{"id": i} for i in ids[start:start + maxResults]]}
+            if start + maxResults < len(ids):
+                page["nextPageToken"] = str(start + maxResults)
+            return page
+        return _request(_execute)
+
+    def _messages_get(self, userId, id, format):
+        def _execute():
+            if self.failing.get(id):
+                self.failing[id] -= 1
+                raise FakeHttpError(503)
+            return self.messages[id]
+        return _request(_execute)
+
+
+def test_sync_backfills_recent_mail_then_follows_history_pages(tmp_path, monkeypatch):
+    monkeypatch.setattr(mailbox_sync, "HISTORY_PAGE_SIZE", 7)
+    gmail = FakeMailbox()
+    gmail.deliver(3)
+    sync = mailbox_sync.MailboxSync(tmp_path / "sync.json", batch_size=25)
+    handled = []
+
+    first = sync.sync(gmail, lambda message: handled.append(message["id"]))
+    assert (first["mode"], first["processed"]) == ("backfill", 3)
+    assert handled == ["m101", "m102", "m103"]
+
+    gmail.deliver(60)
+    gmail.deliver(1, labels=("SENT",))
+    handled.clear()
+    second = sync.sync(gmail, lambda message: handled.append(message["id"]))
+
+    assert second["mode"] == "incremental"
+    assert handled == [f"m{n}" for n in range(104, 164)]
+    assert (second["listed"], second["batches"]) == (60, 3)
+    assert gmail.history_pages == 9
+    assert json.loads((tmp_path / "sync.json").read_text())["history_id"] == "164"
+
+    assert sync.sync(gmail, handled.append)["processed"] == 0
+
+
+def test_interrupted_sync_resumes_pending_and_expired_history_backfills(tmp_path, monkeypatch):
+    gmail = FakeMailbox()
+    sync = mailbox_sync.MailboxSync(tmp_path / "sync.json", batch_size=10)
+    sync.sync(gmail, lambda message: None)
+    gmail.deliver(30)
+    handled = []
+
+    def _crash_on_m115(message):
+        handled.append(message["id"])
+        if message["id"] == "m115":
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        sync.sync(gmail, _crash_on_m115)
+    assert len(sync.checkpoint()["pending"]) == 20
+
+    resumed = sync.sync(gmail, lambda message: handled.append(message["id"]))
+    assert resumed["processed"] == 20
+    assert set(handled) == {f"m{n}" for n in range(101, 131)}
+
+    monkeypatch.setattr(mailbox_sync, "BACKFILL_LIMIT", 5)
+    gmail.oldest_history_id = 200
+    gmail.deliver(1)
+    handled.clear()
+    relisted = sync.sync(gmail, lambda message: handled.append(message["id"]))
+    assert (relisted["mode"], relisted["listed"]) == ("backfill", 5)
+    assert handled == [f"m{n}" for n in range(127, 132)]
+    assert sync.checkpoint()["history_id"] == "131"
+
+
+def test_failed_fetches_stay_pending_until_the_retry_cap(tmp_path, monkeypatch):
+    monkeypatch.setattr(mailbox_sync, "MAX_ATTEMPTS", 3)
+    gmail = FakeMailbox()
+    sync = mailbox_sync.MailboxSync(tmp_path / "sync.json", batch_size=2)
+    sync.sync(gmail, lambda message: None)
+    gmail.deliver(4)
+    gmail.failing = {"m102": 1, "m104": 10}
+    handled = []
+
+    first = sync.sync(gmail, lambda message: handled.append(message["id"]))
+    assert handled == ["m101", "m103"]
+    assert (first["retrying"], first["batches"]) == (2, 2)
+    assert sync.checkpoint()["pending"] == ["m102", "m104"]
+
+    second = sync.sync(gmail, lambda message: handled.append(message["id"]))
+    assert (handled[2:], second["retrying"]) == (["m102"], 1)
+    assert sync.checkpoint()["attempts"] == {"m104": 2}
+
+    third = sync.sync(gmail, lambda message: handled.append(message["id"]))
+    assert (third["dropped"], third["retrying"]) == (1, 0)
+    assert sync.checkpoint()["pending"] == [] and sync.checkpoint()["attempts"] == {}
+
+
+def test_handler_failures_stay_pending_until_the_retry_cap(tmp_path, monkeypatch):
+    monkeypatch.setattr(mailbox_sync, "MAX_ATTEMPTS", 2)
+    gmail = FakeMailbox()
+    sync = mailbox_sync.MailboxSync(tmp_path / "sync.json", batch_size=10)
+    sync.sync(gmail, lambda message: None)
+    gmail.deliver(3)
+    outages = {"m102": 1, "m103": 10}
+    handled = []
+
+    def _handler(message):
+        if outages.get(message["id"]):
+            outages[message["id"]] -= 1
+            raise RuntimeError("calendar down")
+        handled.append(message["id"])
+
+    first = sync.sync(gmail, _handler)
+    assert (first["failed"], first["retrying"]) == (2, 2)
+    assert sync.checkpoint()["pending"] == ["m102", "m103"]
+
+    second = sync.sync(gmail, _handler)
+    assert handled == ["m101", "m102"]
+    assert second["dropped"] == 1
+    assert sync.checkpoint()["pending"] == [] and sync.checkpoint()["attempts"] == {}
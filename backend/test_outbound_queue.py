@@ -0,0 +1,166 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import pytest
+
+from backend import outbound_queue
+
+
+class StubApi:
+    """Local HTTP server that answers with scripted statuses per path."""
+
+    def __init__(self):
+        self.script = {}           # path -> list of statuses, last one repeats
+        self.delays = {}           # path -> list of seconds to stall first, last one repeats
+        self.requests = []
+        self.peers = set()
+
+    def respond(self, handler):
+        body = handler.rfile.read(int(handler.headers.get("Content-Length", 0)))
+        statuses = self.script.get(handler.path, [200])
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        self.requests.append({
+            "path": handler.path,
+            "headers": dict(handler.headers),
+            "body": body.decode(),
+            "status": status,
+        })
+        self.peers.add(handler.client_address[1])
+        delays = self.delays.get(handler.path, [0])
+        time.sleep(delays.pop(0) if len(delays) > 1 else delays[0])
+        payload = json.dumps({"ok": status < 400}).encode()
+        handler.send_response(status)
+        if status == 503:
+            handler.send_header("Retry-After", "0")
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+
+@pytest.fixture
+def stub_api():
+    stub = StubApi()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"      # keep-alive, so connection reuse is visible
+
+        def do_POST(self):
+            stub.respond(self)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    stub.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+def _queue(tmp_path, stub, **kwargs):
+    targets = {
+        "notion": outbound_queue.Target("notion", stub.url + "/v1", lambda: {"Authorization": "Bearer t"}),
+        "twilio": outbound_queue.Target("twilio", stub.url, lambda: {"Authorization": "Basic x"}, form=True),
+        "dedup": outbound_queue.Target(
+            "dedup", stub.url + "/dedup", lambda: {}, idempotency_header="Idempotency-Key",
+        ),
+    }
+    options = {"workers": 2, "backoff": 0.01, "max_backoff": 0.05, **kwargs}
+    return outbound_queue.OutboundQueue(tmp_path / "outbox.db", targets, **options)
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting for deliveries"
+        time.sleep(0.01)
+
+
+def test_workers_deliver_with_retries_idempotency_and_pooled_connections(tmp_path, stub_api):
+    stub_api.script["/v1/pages"] = [503, 502, 200]
+    queue = _queue(tmp_path, stub_api).start()
+
+    first = queue.enqueue("notion", "/pages", {"title": "Summary"}, idempotency_key="summary-1")
+    again = queue.enqueue("notion", "/pages", {"title": "Summary"}, idempotency_key="summary-1")
+    messages = [
+        queue.enqueue("twilio", "/Messages.json", {"To": "whatsapp:+1", "Body": f"Reminder {n}"})
+        for n in range(10)
+    ]
+    assert (again["id"], again["duplicate"]) == (first["id"], True)
+
+    _wait_for(lambda: queue.stats()["queue"].get("delivered") == 11)
+    queue.stop()
+
+    attempts = [r for r in stub_api.requests if r["path"] == "/v1/pages"]
+    assert [r["status"] for r in attempts] == [503, 502, 200]
+    assert all("Idempotency-Key" not in r["headers"] for r in attempts)
+    assert json.loads(attempts[0]["body"]) == {"title": "Summary"}
+    sms = [r for r in stub_api.requests if r["path"] == "/Messages.json"]
+    assert parse_qs(sms[0]["body"])["To"] == ["whatsapp:+1"]
+    assert len(sms) == 10
+    assert len(stub_api.peers) <= 2           # one kept-alive connection per worker
+
+    delivery = queue.get(first["id"])
+    assert (delivery["status"], delivery["attempts"], delivery["response_status"]) == ("delivered", 3, 200)
+    assert queue.get(messages[0]["id"])["payload"]["Body"] == "Reminder 0"
+
+
+def test_permanent_and_exhausted_failures_are_dead_lettered_and_can_be_retried(tmp_path, stub_api):
+    stub_api.script["/v1/bad"] = [400]
+    stub_api.script["/v1/flaky"] = [500]
+    queue = _queue(tmp_path, stub_api, max_attempts=3)
+
+    bad = queue.enqueue("notion", "/bad", {"n": 1})
+    flaky = queue.enqueue("notion", "/flaky", {"n": 2}, idempotency_key="flaky")
+    while queue.process_one() or queue.stats()["queue"].get("pending"):
+        time.sleep(0.01)
+
+    dead = {d["id"]: d for d in queue.dead_letters()}
+    assert (dead[bad["id"]]["attempts"], dead[bad["id"]]["last_error"]) == (1, "HTTP 400")
+    assert (dead[flaky["id"]]["attempts"], dead[flaky["id"]]["response_status"]) == (3, 500)
+    assert queue.enqueue("notion", "/flaky", {"n": 2}, idempotency_key="flaky")["status"] == "dead"
+    assert queue.get(bad["id"])["status"] == "dead"
+
+    stub_api.script["/v1/flaky"] = [200]
+    assert queue.retry_dead(flaky["id"])
+    assert queue.process_one()
+    assert queue.get(flaky["id"])["status"] == "delivered"
+    assert queue.stats()["queue"] == {"delivered": 1, "dead": 1}
+
+
+def test_unconfigured_targets_are_refused_and_expired_claims_are_recovered(tmp_path, stub_api, monkeypatch):
+    monkeypatch.delenv("NOTION_SUMMARY_TOKEN", raising=False)
+    queue = outbound_queue.OutboundQueue(tmp_path / "outbox.db", outbound_queue.default_targets())
+    with pytest.raises(outbound_queue.OutboundNotConfigured, match="NOTION_SUMMARY_TOKEN"):
+        queue.enqueue("notion_summary", "/pages", {})
+
+    # A worker claimed a delivery and died before finishing it
+    crashed = _queue(tmp_path, stub_api, lease=0.05)
+    delivery = crashed.enqueue("notion", "/pages", {"n": 1})
+    crashed._claim(time.time())
+    restarted = _queue(tmp_path, stub_api)
+    assert not restarted.process_one()
+    time.sleep(0.06)
+    assert restarted.process_one()
+    assert restarted.get(delivery["id"])["status"] == "delivered"
+
+
+def test_read_timeouts_are_only_retried_where_the_api_deduplicates(tmp_path, stub_api):
+    stub_api.delays = {"/v1/pages": [0.3, 0], "/dedup/pages": [0.3, 0]}
+    queue = _queue(tmp_path, stub_api, timeout=(1, 0.1)).start()
+
+    page = queue.enqueue("notion", "/pages", {"n": 1})
+    dead = queue.wait(page["id"], timeout=5)
+    assert (dead["status"], dead["attempts"]) == ("dead", 1)
+    assert "may have been delivered" in dead["last_error"]
+
+    retried = queue.enqueue("dedup", "/pages", {"n": 2}, idempotency_key="k")
+    delivered = queue.wait(retried["id"], timeout=5)
+    queue.stop()
+    assert (delivered["status"], delivered["attempts"]) == ("delivered", 2)
+    assert [r["headers"]["Idempotency-Key"] for r in stub_api.requests if r["path"] == "/dedup/pages"] == ["k", "k"]
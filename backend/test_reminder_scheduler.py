@@ -0,0 +1,93 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from backend.reminder_scheduler import ReminderScheduler
+
+IST = timezone(timedelta(hours=5, minutes=30))
+NOW = datetime(2026, 4, 8, 10, 0, tzinfo=IST)
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _scheduler(tmp_path, clock):
+    return ReminderScheduler(tmp_path / "events.json", tmp_path / "archive.jsonl", tz=IST, clock=clock)
+
+
+def test_fires_each_reminder_once_and_archives_past_events(tmp_path):
+    (tmp_path / "events.json").write_text(json.dumps([
+        {"title": "Old exam", "datetime": "2026-04-01T09:00:00+05:30", "reminded": True},
+        {"title": "Missed", "datetime": "2026-04-08T09:30:00", "reminded": False},
+        {"title": "Standup", "datetime": "2026-04-08T10:30:00+05:30", "reminded": False},
+        {"title": "Review", "datetime": "2026-04-08T15:00:00+05:30", "reminded": False},
+    ]))
+    clock = Clock(NOW)
+    scheduler = _scheduler(tmp_path, clock)
+    sent = []
+
+    def notify(event, when):
+        sent.append((event["title"], when.strftime("%H:%M")))
+
+    assert [e["title"] for e in scheduler.fire_due(notify)] == ["Standup"]
+    assert sent == [("Standup", "10:30")]
+    archived = [json.loads(line)["title"] for line in (tmp_path / "archive.jsonl").read_text().splitlines()]
+    assert archived == ["Old exam", "Missed"]
+    hot = json.loads((tmp_path / "events.json").read_text())
+    assert [(e["title"], e["reminded"]) for e in hot] == [("Standup", True), ("Review", False)]
+
+    writes = scheduler.stats()["writes"]
+    assert scheduler.fire_due(notify) == []
+    assert scheduler.stats()["writes"] == writes          # nothing changed, nothing written
+    assert scheduler.seconds_until_next() == 30 * 60      # Standup archives at 10:30
+
+    clock.now = NOW + timedelta(hours=4, minutes=5)
+    scheduler.fire_due(notify)
+    assert sent[-1] == ("Review", "15:00")
+    assert scheduler.stats()["loads"] == 1
+
+
+def test_add_wakes_listeners_and_external_edits_are_reloaded(tmp_path):
+    clock = Clock(NOW)
+    scheduler = _scheduler(tmp_path, clock)
+    woken = []
+    unsubscribe = scheduler.add_listener(lambda: woken.append(True))
+
+    assert scheduler.seconds_until_next() is None
+    scheduler.add("Interview", NOW + timedelta(hours=3))
+    assert woken == [True]
+    assert scheduler.seconds_until_next() == 2 * 3600
+    unsubscribe()
+
+    # Another process (the API) saved an event into the same file
+    other = _scheduler(tmp_path, clock)
+    other.add("Exam", NOW + timedelta(minutes=90))
+    assert scheduler.seconds_until_next() == 30 * 60
+    assert [e["title"] for e in scheduler.upcoming()] == ["Exam", "Interview"]
+
+
+def test_failed_notifications_are_retried_and_not_marked_sent(tmp_path):
+    (tmp_path / "events.json").write_text(json.dumps([
+        {"title": "Standup", "datetime": "2026-04-08T10:30:00+05:30", "reminded": False},
+    ]))
+    clock = Clock(NOW)
+    scheduler = _scheduler(tmp_path, clock)
+    outcomes = [ConnectionError("twilio down"), None]
+
+    def notify(event, when):
+        outcome = outcomes.pop(0)
+        if outcome:
+            raise outcome
+
+    assert scheduler.fire_due(notify) == []
+    assert json.loads((tmp_path / "events.json").read_text())[0]["reminded"] is False
+    assert scheduler.seconds_until_next() == 60
+
+    clock.now = NOW + timedelta(minutes=1)
+    assert [e["title"] for e in scheduler.fire_due(notify)] == ["Standup"]
+    assert json.loads((tmp_path / "events.json").read_text())[0]["reminded"] is True
+    assert scheduler.stats()["fired"] == 1
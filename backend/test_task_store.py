@@ -0,0 +1,181 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from unittest.mock import patch
+
+from backend import journal_ai
+from backend import task_store
+
+
+def test_legacy_tasks_json_is_migrated_once(tmp_path):
+    legacy = tmp_path / "tasks.json"
+    legacy.write_text(json.dumps([
+        {"id": "1", "title": "notes", "done": True,
+         "created_at": "2026-07-29T07:31:12", "completed_at": "2026-07-29T14:47:07"},
+        {"id": "4", "title": "events", "done": False,
+         "created_at": "2026-07-29T14:47:33", "completed_at": None},
+    ]))
+
+    store = task_store.TaskStore(tmp_path / "tasks.db", legacy)
+
+    assert not legacy.exists()
+    assert (tmp_path / "tasks.json.migrated").exists()
+    assert [t["id"] for t in store.list_all()] == ["1", "4"]
+    assert store.get("1")["done"] is True
+    assert store.create("next")["id"] == "5"
+
+    legacy.write_text("[]")
+    reopened = task_store.TaskStore(tmp_path / "tasks.db", legacy)
+    assert len(reopened.list_all()) == 3
+
+
+def test_crud_keeps_api_shape_and_never_reuses_ids(tmp_path):
+    store = task_store.TaskStore(tmp_path / "tasks.db", legacy_path=None)
+
+    first = store.create("write report")
+    second = store.create("review")
+    assert store.delete(second["id"])
+    third = store.create("ship")
+
+    assert set(first) == {"id", "title", "done", "created_at", "completed_at"}
+    assert third["id"] == "3"
+    done = store.update(first["id"], {"done": True})
+    assert done["done"] is True and done["completed_at"]
+    assert store.update("99", {"title": "missing"}) is None
+    assert store.delete("not-a-number") is False
+
+
+def test_concurrent_writers_do_not_lose_tasks(tmp_path):
+    store = task_store.TaskStore(tmp_path / "tasks.db", legacy_path=None)
+
+    def writer(worker):
+        return [store.create(f"w{worker}-{i}")["id"] for i in range(50)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        ids = [task_id for batch in pool.map(writer, range(8)) for task_id in batch]
+
+    assert len(set(ids)) == 400
+    stats = store.stats()
+    assert (stats["total"], stats["completed"]) == (400, 0)
+
+
+def test_journal_ai_functions_delegate_to_store(tmp_path):
+    store = task_store.TaskStore(tmp_path / "tasks.db", legacy_path=None)
+
+    with patch.object(task_store, "_store", store):
+        task = journal_ai.create_task("  plan sprint  ")
+        journal_ai.update_task(task["id"], {"done": True})
+        stats = journal_ai.get_task_stats()
+
+    assert task["title"] == "plan sprint"
+    assert stats == {"total": 1, "completed": 1, "pending": 0, "progress": 100.0, "streak": 1}
+
+
+def test_reads_are_served_from_the_in_memory_index(tmp_path):
+    store = task_store.TaskStore(tmp_path / "tasks.db", legacy_path=None)
+    task = store.create("cached")
+
+    with patch.object(store, "_conn", side_effect=AssertionError("hit SQLite")):
+        assert store.get(task["id"])["title"] == "cached"
+        assert store.get("404") is None
+        assert [t["id"] for t in store.list_all()] == [task["id"]]
+        assert store.update("404", {"done": True}) is None
+
+
+def test_stats_are_maintained_incrementally_and_persisted(tmp_path):
+    legacy = tmp_path / "tasks.json"
+    legacy.write_text(json.dumps([
+        {"id": "1", "title": "a", "done": True,
+         "created_at": "2026-07-27T08:00:00", "completed_at": "2026-07-27T09:00:00"},
+        {"id": "2", "title": "b", "done": True,
+         "created_at": "2026-07-28T08:00:00", "completed_at": "2026-07-28T09:00:00"},
+        {"id": "3", "title": "c", "done": False,
+         "created_at": "2026-07-28T08:00:00", "completed_at": None},
+    ]))
+    store = task_store.TaskStore(tmp_path / "tasks.db", legacy)
+
+    assert store.completion_histogram() == {"2026-07-27": 1, "2026-07-28": 1}
+    assert store.stats(today=date(2026, 7, 28))["streak"] == 2
+    assert store.stats(today=date(2026, 7, 30))["streak"] == 0
+
+    store.update("1", {"done": False})
+    store.update("3", {"done": True})
+    store.delete("2")
+    store.create("d")
+    today = date.today()
+
+    with patch.object(store, "_conn", side_effect=AssertionError("hit SQLite")):
+        stats = store.stats(today=today)
+    assert stats == {"total": 3, "completed": 1, "pending": 2, "progress": 33.3, "streak": 1}
+    assert store.completion_histogram() == {today.isoformat(): 1}
+
+    reopened = task_store.TaskStore(tmp_path / "tasks.db", legacy_path=None)
+    assert reopened.stats(today=today) == stats
+    assert reopened.completion_histogram() == {today.isoformat(): 1}
+
+
+def test_query_filters_and_paginates_with_cursor(tmp_path):
+    store = task_store.TaskStore(tmp_path / "tasks.db", legacy_path=None)
+    for i in range(7):
+        task = store.create(f"Report {i}" if i % 2 else f"chore {i}")
+        if i % 3 == 0:
+            store.update(task["id"], {"done": True})
+
+    first = store.query(status="open", limit=2)
+    second = store.query(status="open", limit=2, cursor=first["next_cursor"])
+
+    assert [t["id"] for t in first["tasks"]] == ["2", "3"]
+    assert [t["id"] for t in second["tasks"]] == ["5", "6"]
+    assert second["next_cursor"] is None
+    assert [t["id"] for t in store.query(status="done")["tasks"]] == ["1", "4", "7"]
+    assert [t["id"] for t in store.query(text="report")["tasks"]] == ["2", "4", "6"]
+    assert store.query(created_before="2000-01-01")["tasks"] == []
+    assert first["stats"]["pending"] == 4
+
+    store.update("2", {"done": True})
+    store.delete("3")
+    assert [t["id"] for t in store.query(status="open")["tasks"]] == ["5", "6"]
+
+
+def test_created_range_is_bisected_and_falls_back_for_unordered_migrations(tmp_path):
+    store = task_store.TaskStore(tmp_path / "tasks.db", legacy_path=None)
+    ids = [store.create(f"t{i}")["id"] for i in range(200)]
+    stamps = [store.get(i)["created_at"] for i in ids]
+
+    with patch.object(store._index, "get", wraps=store._index.get) as lookups:
+        page = store.query(created_after=stamps[100], created_before=stamps[105])
+    assert [t["id"] for t in page["tasks"]] == ids[100:105]
+    assert lookups.call_count < 30   # bisect probes plus the page, not all 200 tasks
+
+    legacy = tmp_path / "tasks.json"
+    legacy.write_text(json.dumps([
+        {"id": "1", "title": "late", "created_at": "2026-03-01T00:00:00"},
+        {"id": "2", "title": "early", "created_at": "2026-01-01T00:00:00"},
+    ]))
+    migrated = task_store.TaskStore(tmp_path / "migrated.db", legacy_path=legacy)
+    assert [t["title"] for t in migrated.query(created_before="2026-02-01")["tasks"]] == ["early"]
+
+
+def test_tasks_endpoint_returns_304_until_a_task_changes(tmp_path):
+    from fastapi.testclient import TestClient
+
+    from backend import api as backend_api
+
+    store = task_store.TaskStore(tmp_path / "tasks.db", legacy_path=None)
+    store.create("first")
+
+    with patch.object(task_store, "_store", store):
+        client = TestClient(backend_api.app)
+        first = client.get("/tasks", params={"status": "open", "limit": 10})
+        etag = first.headers["ETag"]
+        unchanged = client.get("/tasks", params={"status": "open"}, headers={"If-None-Match": etag})
+        client.post("/tasks", json={"title": "second"})
+        changed = client.get("/tasks", headers={"If-None-Match": etag})
+        bad_cursor = client.get("/tasks", params={"cursor": "abc"})
+
+    assert first.json()["tasks"][0]["title"] == "first"
+    assert first.headers["Cache-Control"] == "no-cache"
+    assert unchanged.status_code == 304
+    assert changed.status_code == 200
+    assert len(changed.json()["tasks"]) == 2
+    assert bad_cursor.status_code == 400
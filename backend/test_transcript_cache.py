@@ -0,0 +1,73 @@
+import json
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from backend import api as backend_api
+from backend import live_transcript
+from backend import transcript_cache
+
+
+def _result(text):
+    return {"transcript": text, "segments": [{"text": text}], "sample_rate": 16000}
+
+
+def test_cache_key_depends_on_bytes_and_settings():
+    key = transcript_cache.cache_key(b"abc", language="en", word_timestamps=False)
+
+    assert key == transcript_cache.cache_key(b"abc", word_timestamps=False, language="en")
+    assert key != transcript_cache.cache_key(b"abd", language="en", word_timestamps=False)
+    assert key != transcript_cache.cache_key(b"abc", language="en", word_timestamps=True)
+
+
+def test_cache_hit_miss_metrics_and_error_results_are_not_stored(tmp_path):
+    cache = transcript_cache.TranscriptCache(tmp_path, max_bytes=10_000)
+
+    assert cache.get("k1") is None
+    cache.put("k1", _result("hello"))
+    cache.put("k2", {"transcript": "", "segments": [], "error": "boom"})
+
+    assert cache.get("k1") == _result("hello")
+    assert cache.get("k2") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 1)
+
+
+def test_cache_evicts_least_recently_used_and_survives_restart(tmp_path):
+    entry_size = len(json.dumps(_result("aaaa")).encode())
+    cache = transcript_cache.TranscriptCache(tmp_path, max_bytes=entry_size * 2)
+    cache.put("a", _result("aaaa"))
+    cache.put("b", _result("bbbb"))
+    cache.get("a")
+    cache.put("c", _result("cccc"))
+
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+
+    reopened = transcript_cache.TranscriptCache(tmp_path, max_bytes=entry_size * 2)
+    assert reopened.get("a") == _result("aaaa")
+    assert reopened.get("c") == _result("cccc")
+
+
+def test_identical_upload_is_served_from_cache(tmp_path):
+    cache = transcript_cache.TranscriptCache(tmp_path)
+    engine = live_transcript.TranscriptionEngine()
+    engine._state = "ready"
+    calls = []
+
+    def fake_transcribe(audio_bytes, word_timestamps=False):
+        calls.append(audio_bytes)
+        return _result("cached text")
+
+    with patch.object(transcript_cache, "_cache", cache), \
+         patch.object(live_transcript, "_engine", engine), \
+         patch.object(live_transcript, "transcribe_audio_file", side_effect=fake_transcribe):
+        client = TestClient(backend_api.app)
+        first = client.post("/transcribe", files={"file": ("a.webm", b"same-bytes")})
+        engine._state = "loading"
+        second = client.post("/transcribe", files={"file": ("a.webm", b"same-bytes")})
+
+    assert first.json()["transcript"] == "cached text"
+    assert second.status_code == 200
+    assert second.json()["cached"] is True
+    assert calls == [b"same-bytes"]
@@ -0,0 +1,163 @@
+"""
+Transcript Cache
+
+Content-addressed cache in front of transcription:
+- Key = sha256 of the raw upload bytes + the settings that affect output
+  (model size, language, word timestamps, long-form mode)
+- One JSON file per entry under backend/cache/transcripts/
+- Least-recently-used eviction once the store exceeds its byte budget
+- Hit / miss / eviction counters for /health
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger("transcript_cache")
+
+CACHE_DIR = Path(__file__).resolve().parent / "cache" / "transcripts"
+MAX_CACHE_BYTES = int(os.getenv("AGENTX_TRANSCRIPT_CACHE_MB", "256")) * 1024 * 1024
+
+
+def cache_key(audio_bytes: bytes, **settings) -> str:
+    """Return the cache key for *audio_bytes* transcribed with *settings*."""
+    digest = hashlib.sha256(audio_bytes)
+    digest.update(json.dumps(settings, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class TranscriptCache:
+    """On-disk transcript store with an in-memory LRU index.
+
+    The index (key -> file size, oldest first) is built once from the
+    directory listing, so lookups and evictions never scan the disk.
+    """
+
+    def __init__(self, directory: Path = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._load_index()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> dict | None:
+        """Return the cached result for *key*, or None on a miss."""
+        with self._lock:
+            if key not in self._index:
+                self._misses += 1
+                return None
+            self._index.move_to_end(key)
+
+        path = self._path(key)
+        try:
+            result = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Dropping unreadable cache entry %s: %s", key, exc)
+            with self._lock:
+                self._forget(key)
+                self._misses += 1
+            return None
+
+        with self._lock:
+            self._hits += 1
+        return result
+
+    def put(self, key: str, result: dict) -> None:
+        """Store a successful result; error results are never cached."""
+        if result.get("error"):
+            return
+
+        payload = json.dumps(result, ensure_ascii=False).encode("utf-8")
+        if len(payload) > self.max_bytes:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, self._path(key))
+
+        with self._lock:
+            self._forget(key)
+            self._index[key] = len(payload)
+            self._bytes += len(payload)
+            self._evict()
+
+    def stats(self) -> dict:
+        """Return hit metrics and current store size."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._index),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _load_index(self) -> None:
+        if not self.directory.exists():
+            return
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        for _mtime, key, size in sorted(entries):
+            self._index[key] = size
+            self._bytes += size
+        self._evict()
+
+    def _forget(self, key: str) -> None:
+        size = self._index.pop(key, None)
+        if size is not None:
+            self._bytes -= size
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until under budget (lock held)."""
+        while self._bytes > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> TranscriptCache:
+    """Return the process-wide transcript cache, creating it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TranscriptCache()
+        return _cache
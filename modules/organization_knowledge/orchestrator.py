@@ -38,6 +38,15 @@ from modules.organization_knowledge.qa_engine import answer_question
 logger = logging.getLogger("org_knowledge.orchestrator")
 
 
+def _publish_change(topic: str, data: Dict[str, Any]) -> None:
+    """Publish on the AgentX event bus when running inside the backend."""
+    try:
+        from backend.event_bus import publish
+    except ImportError:
+        return
+    publish(topic, data)
+
+
 class OrganizationKnowledgeOrchestrator:
     """
     High-level orchestrator for the Organization Knowledge Module.
@@ -180,6 +189,10 @@ class OrganizationKnowledgeOrchestrator:
             filename,
             stored_count,
         )
+        _publish_change(
+            "org_knowledge.updated",
+            {"document_name": filename, "chunks_count": stored_count},
+        )
 
         return {
             "success": True,
@@ -312,6 +325,8 @@ class OrganizationKnowledgeOrchestrator:
         cleared = clear_knowledge_base(self.settings)
         self._last_document_name = None
         self._last_upload_time = None
+        if cleared:
+            _publish_change("org_knowledge.cleared", {})
 
         return {
             "success": cleared,